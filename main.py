@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Entry point for Teams Translator."""
+
+import argparse
+import logging
+import sys
+import time
+from src.utils.startup_trace import StartupTrace
+
+# Started before the remaining imports so they show up in --startup-trace
+STARTUP_TRACE = StartupTrace()
+
+from src.config.settings import AppConfig
+
+
+DEFAULT_CONFIG_PATH = "config.json"
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Real-time translation tool for Microsoft Teams meetings using LibreTranslate"
+    )
+    parser.add_argument("--config", default=DEFAULT_CONFIG_PATH, help="Path to configuration file")
+    parser.add_argument("--source-lang", help="Source language code")
+    parser.add_argument("--target-lang", help="Target language code")
+    parser.add_argument("--screen", type=int, help="Screen index for display window")
+    parser.add_argument("--libretranslate-url", help="LibreTranslate API URL")
+    parser.add_argument("--create-config", action="store_true", help="Create default configuration file")
+    parser.add_argument("--broadcast", action="store_true", help="Publish translations to the broadcast server")
+    parser.add_argument("--broadcast-port", type=int, help="Port for the broadcast server")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run without a display window, publishing translations to the broadcast server")
+    parser.add_argument("--startup-trace", action="store_true", help="Print a startup timing breakdown")
+    parser.add_argument("--export", metavar="PATH",
+                        help="Append translations to a .jsonl, .srt or .vtt transcript file")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="Write per-caption tracing spans to a Chrome trace-event JSON file")
+    parser.add_argument("--search", action="store_true",
+                        help="Index translated segments and serve /search on the broadcast server")
+
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+
+    sessions_parser = subparsers.add_parser(
+        "sessions", help="Run several caption sessions sharing one translation pool and cache"
+    )
+    sessions_parser.add_argument("session", nargs="+", metavar="NAME=PATH",
+                                 help="Session name and transcript file to follow ('-' reads stdin)")
+    sessions_parser.add_argument("--split-marker", help="Speaker marker used in the transcripts")
+    
+    file_parser = subparsers.add_parser(
+        "translate-file", help="Translate a saved transcript, resuming an interrupted run"
+    )
+    file_parser.add_argument("input", help="Transcript file to translate")
+    file_parser.add_argument("output", help="Output file; .jsonl writes one record per segment")
+    file_parser.add_argument("--split-marker", help="Speaker marker used in the transcript")
+    file_parser.add_argument("--batch-size", type=int, default=32, help="Segments translated in parallel per batch")
+    file_parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    
+    proxy_parser = subparsers.add_parser(
+        "proxy", help="Serve a shared caching LibreTranslate-compatible API for a whole team"
+    )
+    proxy_parser.add_argument("--host", help="Address to bind")
+    proxy_parser.add_argument("--port", type=int, help="Port to bind")
+
+    return parser.parse_args(argv)
+
+
+def build_config(args: argparse.Namespace) -> AppConfig:
+    """
+    Load configuration and apply command line overrides.
+
+    Raises:
+        ValueError: If the resulting configuration is invalid
+    """
+    config = AppConfig.load_from_file(args.config)
+
+    if args.source_lang:
+        config.translation.source_language = args.source_lang
+    if args.target_lang:
+        config.translation.target_language = args.target_lang
+    if args.screen is not None:
+        config.ui.screen_index = args.screen
+    if args.libretranslate_url:
+        config.translation.libretranslate_url = args.libretranslate_url
+    if args.broadcast:
+        config.broadcast.enabled = True
+    if args.broadcast_port is not None:
+        config.broadcast.port = args.broadcast_port
+    if args.headless:
+        config.broadcast.headless = True
+    if args.export:
+        config.export.enabled = True
+        config.export.path = args.export
+    if args.trace:
+        config.tracing.enabled = True
+        config.tracing.path = args.trace
+    if args.search:
+        config.search.enabled = True
+        config.broadcast.enabled = True
+
+    if config.export.enabled:
+        from src.core.export import TranscriptExporter
+        TranscriptExporter.resolve_format(config.export.path, config.export.format)
+
+    return config
+
+
+def run_sessions(config: AppConfig, args: argparse.Namespace) -> int:
+    """Run the multi-session mode until interrupted."""
+    from src.core.sessions import SessionManager
+    from src.core.sources import FileTranscriptSource, StreamTranscriptSource
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    index = None
+    if config.search.enabled:
+        from src.core.transcript_index import TranscriptIndex
+        index = TranscriptIndex(config.search)
+
+    broadcast_server = None
+    if config.broadcast.enabled or config.broadcast.headless:
+        from src.core.broadcast import BroadcastServer
+        broadcast_server = BroadcastServer(config.broadcast, index)
+
+    exporter = None
+    if config.export.enabled:
+        from src.core.export import TranscriptExporter, make_record
+        exporter = TranscriptExporter(config.export, config.translation.target_language)
+    
+    def publish(session, update):
+        if index is not None:
+            index.add(time.time(), session.name, update.source_text, update.translations,
+                      update.seq, session.name)
+        if exporter:
+            for target_lang, translation in update.translations.items():
+                exporter.write(make_record(session.name, update.source_text, translation, target_lang, update.seq))
+        if broadcast_server:
+            for target_lang, translation in update.translations.items():
+                broadcast_server.publish({
+                    "session": session.name,
+                    "seq": update.seq,
+                    "timestamp": time.time(),
+                    "source_language": config.translation.source_language,
+                    "target_language": target_lang,
+                    "source": update.source_text,
+                    "translation": translation,
+                    "provisional": update.provisional
+                })
+
+    manager = SessionManager(config, on_translation=publish)
+    for spec in args.session:
+        name, separator, path = spec.partition("=")
+        if not separator or not name or not path:
+            print(f"Invalid session '{spec}', expected NAME=PATH", file=sys.stderr)
+            return 2
+        if path == "-":
+            source = StreamTranscriptSource(sys.stdin).start()
+        else:
+            source = FileTranscriptSource(path)
+        manager.add_session(name, source, args.split_marker)
+
+    if broadcast_server:
+        broadcast_server.start()
+    if exporter:
+        exporter.start()
+    if index is not None:
+        index.start()
+    try:
+        manager.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        manager.stop()
+        if broadcast_server:
+            broadcast_server.stop()
+        if exporter:
+            exporter.close()
+        if index is not None:
+            index.close()
+    return 0
+
+
+def run_translate_file(config: AppConfig, args: argparse.Namespace) -> int:
+    """Translate a transcript file, printing progress to stderr."""
+    from src.core.file_translation import FileTranslator
+    from src.core.translator import TranslationService
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    translator = FileTranslator(
+        TranslationService(config.translation),
+        args.split_marker or config.capture.split_marker,
+        args.batch_size
+    )
+    try:
+        result = translator.translate_file(
+            args.input, args.output,
+            resume=not args.restart,
+            progress=lambda done: print(f"\r{done} segments translated", end="", file=sys.stderr)
+        )
+    except KeyboardInterrupt:
+        print("\nInterrupted; run the same command again to resume", file=sys.stderr)
+        return 130
+    except OSError as e:
+        print(f"Cannot translate {args.input}: {e}", file=sys.stderr)
+        return 1
+    print(file=sys.stderr)
+    return 1 if result.failed else 0
+
+
+def run_proxy(config: AppConfig, args: argparse.Namespace) -> int:
+    """Run the translation proxy until interrupted."""
+    import threading
+    from src.core.proxy import TranslationProxy
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    if args.host:
+        config.proxy.host = args.host
+    if args.port is not None:
+        config.proxy.port = args.port
+    
+    proxy = TranslationProxy(config.proxy, config.translation)
+    try:
+        proxy.start()
+    except OSError as e:
+        print(f"Cannot listen on {config.proxy.host}:{config.proxy.port}: {e}", file=sys.stderr)
+        return 1
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.stop()
+    return 0
+
+
+def main(argv=None) -> int:
+    """Run Teams Translator from the command line."""
+    args = parse_args(argv)
+
+    if args.create_config:
+        AppConfig().save_to_file(args.config)
+        print(f"Default configuration written to {args.config}")
+        return 0
+
+    STARTUP_TRACE.enabled = args.startup_trace
+    with STARTUP_TRACE.phase("load configuration"):
+        try:
+            config = build_config(args)
+        except ValueError as e:
+            print(f"Invalid configuration: {e}", file=sys.stderr)
+            return 2
+
+    if args.command == "sessions":
+        return run_sessions(config, args)
+    if args.command == "translate-file":
+        return run_translate_file(config, args)
+    if args.command == "proxy":
+        return run_proxy(config, args)
+
+    with STARTUP_TRACE.phase("import application"):
+        from src.core.app import TeamsTranslatorApp
+    with STARTUP_TRACE.phase("initialize application"):
+        app = TeamsTranslatorApp(config, STARTUP_TRACE)
+    return app.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
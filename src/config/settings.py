@@ -1,20 +1,52 @@
 """Configuration management for Teams Translator."""
 
 import os
-from dataclasses import dataclass
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from typing import Dict, Any, List
 import json
 
 
 @dataclass
 class TranslationConfig:
     """Configuration for translation settings."""
+    backend: str = "http"
     libretranslate_url: str = "http://localhost:5000/translate"
     api_key: str = ""
     source_language: str = "fi"
     target_language: str = "en"
+    additional_target_languages: List[str] = field(default_factory=list)
     rate_delay: float = 1.0
     translate_always_after: float = 5.0
+    speculative_debounce: float = 0.0
+    max_requests_per_second: float = 5.0
+    request_burst: int = 10
+    scheduler_workers: int = 2
+    worker_processes: int = 0
+    warm_up: bool = True
+    fuzzy_match_threshold: float = 0.0
+    translation_memory_size: int = 5000
+    translation_cache_size: int = 10000
+    phrase_table_dir: str = "phrases"
+    detect_language: bool = False
+    request_timeout: float = 10.0
+    timeout_p99_multiplier: float = 3.0
+    min_request_timeout: float = 1.0
+    hedge_url: str = ""
+    max_chunk_chars: int = 1000
+    
+    def get_target_languages(self) -> List[str]:
+        """Return the primary target language followed by any additional ones."""
+        languages = [self.target_language]
+        for language in self.additional_target_languages:
+            if language not in languages:
+                languages.append(language)
+        return languages
+    
+    def get_scheduler_workers(self) -> int:
+        """Return the number of scheduler workers, enough to keep every worker process busy."""
+        if self.backend in ("argos", "stub") and self.worker_processes > 0:
+            return max(self.scheduler_workers, self.worker_processes)
+        return self.scheduler_workers
 
 
 @dataclass
@@ -27,6 +59,9 @@ class UIConfig:
     font_family: str = "Helvetica"
     font_size: int = 20
     font_weight: str = "bold"
+    text_color: str = "black"
+    progressive_display: bool = False
+    provisional_color: str = "gray50"
 
 
 @dataclass
@@ -35,6 +70,55 @@ class CaptureConfig:
     split_marker: str = "Jussi Rasku (TAU)"
     clipboard_delay: float = 0.5
     selection_delay: float = 0.2
+    max_translated_lines: int = 10000
+
+
+@dataclass
+class BroadcastConfig:
+    """Configuration for the translation broadcast server."""
+    enabled: bool = False
+    headless: bool = False
+    host: str = "127.0.0.1"
+    port: int = 8765
+    client_buffer_size: int = 100
+
+
+@dataclass
+class ExportConfig:
+    """Configuration for the transcript export sink."""
+    enabled: bool = False
+    path: str = "transcript.jsonl"
+    format: str = ""
+    flush_interval: float = 1.0
+    flush_size: int = 50
+
+
+@dataclass
+class SearchConfig:
+    """Configuration for the in-session transcript search index."""
+    enabled: bool = False
+    max_segments: int = 5000
+    spill_path: str = ""
+
+
+@dataclass
+class TracingConfig:
+    """Configuration for per-caption tracing."""
+    enabled: bool = False
+    path: str = "traces/captions.json"
+    sample_rate: float = 1.0
+    max_events_per_file: int = 100000
+    backups: int = 3
+
+
+@dataclass
+class ProxyConfig:
+    """Configuration for the shared caching translation proxy."""
+    host: str = "127.0.0.1"
+    port: int = 5001
+    cache_size: int = 50000
+    upstream_connections: int = 16
+    upstream_requests_per_second: float = 0.0
 
 
 @dataclass
@@ -43,11 +127,21 @@ class AppConfig:
     translation: TranslationConfig
     ui: UIConfig
     capture: CaptureConfig
+    broadcast: BroadcastConfig
+    export: ExportConfig
+    search: SearchConfig
+    proxy: ProxyConfig
+    tracing: TracingConfig
     
     def __init__(self):
         self.translation = TranslationConfig()
         self.ui = UIConfig()
         self.capture = CaptureConfig()
+        self.broadcast = BroadcastConfig()
+        self.export = ExportConfig()
+        self.search = SearchConfig()
+        self.proxy = ProxyConfig()
+        self.tracing = TracingConfig()
     
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'AppConfig':
@@ -69,6 +163,31 @@ class AppConfig:
                 if hasattr(instance.capture, key):
                     setattr(instance.capture, key, value)
         
+        if 'broadcast' in config_dict:
+            for key, value in config_dict['broadcast'].items():
+                if hasattr(instance.broadcast, key):
+                    setattr(instance.broadcast, key, value)
+        
+        if 'export' in config_dict:
+            for key, value in config_dict['export'].items():
+                if hasattr(instance.export, key):
+                    setattr(instance.export, key, value)
+        
+        if 'search' in config_dict:
+            for key, value in config_dict['search'].items():
+                if hasattr(instance.search, key):
+                    setattr(instance.search, key, value)
+        
+        if 'proxy' in config_dict:
+            for key, value in config_dict['proxy'].items():
+                if hasattr(instance.proxy, key):
+                    setattr(instance.proxy, key, value)
+        
+        if 'tracing' in config_dict:
+            for key, value in config_dict['tracing'].items():
+                if hasattr(instance.tracing, key):
+                    setattr(instance.tracing, key, value)
+        
         return instance
     
     @classmethod
@@ -86,12 +205,30 @@ class AppConfig:
         """Save configuration to JSON file."""
         config_dict = {
             'translation': {
+                'backend': self.translation.backend,
                 'libretranslate_url': self.translation.libretranslate_url,
                 'api_key': self.translation.api_key,
                 'source_language': self.translation.source_language,
                 'target_language': self.translation.target_language,
+                'additional_target_languages': self.translation.additional_target_languages,
                 'rate_delay': self.translation.rate_delay,
-                'translate_always_after': self.translation.translate_always_after
+                'translate_always_after': self.translation.translate_always_after,
+                'speculative_debounce': self.translation.speculative_debounce,
+                'max_requests_per_second': self.translation.max_requests_per_second,
+                'request_burst': self.translation.request_burst,
+                'scheduler_workers': self.translation.scheduler_workers,
+                'worker_processes': self.translation.worker_processes,
+                'warm_up': self.translation.warm_up,
+                'fuzzy_match_threshold': self.translation.fuzzy_match_threshold,
+                'translation_memory_size': self.translation.translation_memory_size,
+                'translation_cache_size': self.translation.translation_cache_size,
+                'phrase_table_dir': self.translation.phrase_table_dir,
+                'detect_language': self.translation.detect_language,
+                'request_timeout': self.translation.request_timeout,
+                'timeout_p99_multiplier': self.translation.timeout_p99_multiplier,
+                'min_request_timeout': self.translation.min_request_timeout,
+                'hedge_url': self.translation.hedge_url,
+                'max_chunk_chars': self.translation.max_chunk_chars
             },
             'ui': {
                 'screen_index': self.ui.screen_index,
@@ -100,12 +237,49 @@ class AppConfig:
                 'window_height_ratio': self.ui.window_height_ratio,
                 'font_family': self.ui.font_family,
                 'font_size': self.ui.font_size,
-                'font_weight': self.ui.font_weight
+                'font_weight': self.ui.font_weight,
+                'text_color': self.ui.text_color,
+                'progressive_display': self.ui.progressive_display,
+                'provisional_color': self.ui.provisional_color
             },
             'capture': {
                 'split_marker': self.capture.split_marker,
                 'clipboard_delay': self.capture.clipboard_delay,
-                'selection_delay': self.capture.selection_delay
+                'selection_delay': self.capture.selection_delay,
+                'max_translated_lines': self.capture.max_translated_lines
+            },
+            'broadcast': {
+                'enabled': self.broadcast.enabled,
+                'headless': self.broadcast.headless,
+                'host': self.broadcast.host,
+                'port': self.broadcast.port,
+                'client_buffer_size': self.broadcast.client_buffer_size
+            },
+            'export': {
+                'enabled': self.export.enabled,
+                'path': self.export.path,
+                'format': self.export.format,
+                'flush_interval': self.export.flush_interval,
+                'flush_size': self.export.flush_size
+            },
+            'search': {
+                'enabled': self.search.enabled,
+                'max_segments': self.search.max_segments,
+                'spill_path': self.search.spill_path
+            },
+            'proxy': {
+                'host': self.proxy.host,
+                'port': self.proxy.port,
+                'cache_size': self.proxy.cache_size,
+                'upstream_connections': self.proxy.upstream_connections,
+                'upstream_requests_per_second': self.proxy.upstream_requests_per_second
+            },
+            'tracing': {
+                'enabled': self.tracing.enabled,
+                'path': self.tracing.path,
+                'sample_rate': self.tracing.sample_rate,
+                'max_events_per_file': self.tracing.max_events_per_file,
+                'backups': self.tracing.backups
             }
         }
         
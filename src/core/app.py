@@ -1,28 +1,100 @@
 """Main application module."""
 
 import logging
+import queue
 import sys
-from typing import Optional, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, Dict, List, Tuple, Union
 from ..config.settings import AppConfig
-from ..core.translator import TranslationService
+from ..utils import tracing
+from ..utils.clock import Clock, SYSTEM_CLOCK
+from ..utils.startup_trace import StartupTrace
+from ..utils.lru import LRUCache
+from ..core.translator import TranslationService, SequencedTranslation
 from ..core.text_capture import TextCapture
+from ..core.translation_memory import TranslationMemory
+from ..core.scheduler import TranslationScheduler
+from ..core.phrase_table import PhraseTable, load_phrase_tables
+from ..core.export import TranscriptExporter, make_record
+from ..core.transcript_index import TranscriptIndex
 from ..ui.display_window import TranslationDisplayWindow
 
 
 class TeamsTranslatorApp:
     """Main application class for Teams Translator."""
     
-    def __init__(self, config: Optional[AppConfig] = None):
+    def __init__(self, config: Optional[AppConfig] = None, startup_trace: Optional[StartupTrace] = None,
+                 clock: Optional[Clock] = None):
         self.config = config or AppConfig()
+        self.startup_trace = startup_trace or StartupTrace()
+        # Shared by capture, display and headless loop; a VirtualClock replays them in simulated time
+        self.clock = clock or SYSTEM_CLOCK
         self.logger = self._setup_logging()
         
+        # Sampled captions are traced from capture to display
+        self.tracer: Optional[tracing.Tracer] = None
+        if self.config.tracing.enabled:
+            self.tracer = tracing.Tracer(self.config.tracing)
+        
         # Initialize services
         self.translation_service = TranslationService(self.config.translation)
-        self.text_capture = TextCapture(self.config.capture)
-        self.display_window = TranslationDisplayWindow(self.config.ui, self.grab_and_translate)
+        self.text_capture = TextCapture(self.config.capture, clock=self.clock, tracer=self.tracer)
+        self.display_window = TranslationDisplayWindow(self.config.ui, self.grab_translation_update,
+                                                       self.clock, self.tracer)
+        # Searchable history of the session's segments, served by the broadcast server
+        self.transcript_index: Optional[TranscriptIndex] = None
+        if self.config.search.enabled:
+            self.transcript_index = TranscriptIndex(self.config.search)
+        self.broadcast_server: Optional["BroadcastServer"] = None
+        if self.config.broadcast.enabled or self.config.broadcast.headless:
+            # Imported on demand; the HTTP server stack is not needed otherwise
+            from ..core.broadcast import BroadcastServer
+            self.broadcast_server = BroadcastServer(self.config.broadcast, self.transcript_index)
+        self.is_running = False
+        self.warm_up_status = ""
+        
+        # Capture time of recent segments, for the latency in exported records
+        self.capture_times = LRUCache(256)
+        
+        # Translation cache, keyed by (source text, target language)
+        self.target_languages: List[str] = self.config.translation.get_target_languages()
+        self.translation_cache = LRUCache(self.config.translation.translation_cache_size)
+        
+        # Short fixed utterances are answered from the phrase tables without
+        # going through the scheduler, the cache or the backend
+        self.phrase_tables: Dict[str, PhraseTable] = load_phrase_tables(
+            self.config.translation.phrase_table_dir,
+            self.config.translation.source_language,
+            self.target_languages
+        )
+        self.phrase_hits = 0
+        
+        self.exporter: Optional[TranscriptExporter] = None
+        if self.config.export.enabled:
+            self.exporter = TranscriptExporter(self.config.export, self.target_languages[0])
+        
+        # Near-duplicate captions get a provisional translation from the
+        # translation memory while the exact one is fetched in the background
+        self.translation_memory: Optional[TranslationMemory] = None
+        if self.config.translation.fuzzy_match_threshold > 0:
+            self.translation_memory = TranslationMemory(
+                max_entries=self.config.translation.translation_memory_size,
+                threshold=self.config.translation.fuzzy_match_threshold
+            )
+        # All backend work is queued by priority so completed lines go out first
+        self.scheduler = TranslationScheduler(self.config.translation.get_scheduler_workers())
+        self.refined_translations: "queue.SimpleQueue[SequencedTranslation]" = queue.SimpleQueue()
+        # Translations of segments already shown provisionally (progressive display)
+        self.final_translations: "queue.SimpleQueue[SequencedTranslation]" = queue.SimpleQueue()
+        
+        # Capture sequence number of the newest segment handed out for display
+        self.latest_seq = 0
+        self.stale_results_dropped = 0
         
-        # Translation cache
-        self.translation_cache: Dict[str, str] = {}
+        # In-flight speculative translation of the incomplete line
+        self.speculation: Optional[Tuple[str, Future]] = None
+        self.speculations_superseded = 0
         
         self.logger.info("Teams Translator initialized")
     
@@ -38,38 +110,79 @@ class TeamsTranslatorApp:
         )
         return logging.getLogger(__name__)
     
-    def grab_and_translate(self) -> Optional[str]:
+    def grab_and_translate(self) -> Optional[Union[str, Dict[str, str]]]:
         """
         Grab text from screen and translate it.
         
         Returns:
-            Translated text or None if no translation needed
+            Translated text, a mapping of target language to translated text
+            when several target languages are configured, or None if no
+            translation needed
+        """
+        update = self.grab_translation_update()
+        if update is None:
+            return None
+        return self.format_translations(update.translations)
+    
+    def grab_translation_update(self) -> Optional[SequencedTranslation]:
+        """
+        Grab text from screen and translate it, keeping the capture sequence number.
+        
+        Returns:
+            The newest translation to display or None if there is nothing new
         """
         try:
+            # Results that arrived since the last tick go out first; new
+            # text is captured on the next tick rather than hiding them
+            refined = self.pop_refined_translation()
+            if refined is not None:
+                return refined
+            final = self.pop_final_translation()
+            if final is not None:
+                return final
+            
             text_to_translate = self.text_capture.get_transcript_to_translate(
                 self.config.translation.translate_always_after
             )
             
             if not text_to_translate:
-                return None
+                return self.update_speculation()
             
+            seq = self.text_capture.capture_seq
+            self.capture_times[seq] = self.clock.time()
+            self.display_window.mark_captured(seq, self.capture_times[seq])
             self.logger.info(f"Text to translate: {text_to_translate[:100]}...")
+            self.latest_seq = seq
             
-            # Check cache first
-            if text_to_translate in self.translation_cache:
-                self.logger.debug("Using cached translation")
-                return self.translation_cache[text_to_translate]
-            
-            # Translate
-            translation = self.translation_service.translate(text_to_translate)
+            update = self.match_phrases(text_to_translate, seq)
+            if update is None:
+                self.await_speculation(text_to_translate)
+                if self.text_capture.last_segment_complete:
+                    future = self.scheduler.submit(
+                        self.translate_to_targets, text_to_translate, seq,
+                        priority=TranslationScheduler.PRIORITY_COMPLETE
+                    )
+                else:
+                    future = self.scheduler.submit(
+                        self.translate_to_targets, text_to_translate, seq,
+                        priority=TranslationScheduler.PRIORITY_INCOMPLETE,
+                        supersede_key="incomplete"
+                    )
+                if self.config.ui.progressive_display and not future.done():
+                    self.update_speculation()
+                    return self.show_provisionally(text_to_translate, seq, future)
+                with tracing.span("wait", self.tracer.get(seq) if self.tracer else None):
+                    update = future.result()
+            self.update_speculation()
             
-            if translation:
-                # Cache the translation
-                self.translation_cache[text_to_translate] = translation
+            if update.translations:
                 self.text_capture.mark_as_translated(text_to_translate)
                 
-                self.logger.info(f"Translation: {translation}")
-                return translation
+                for target_lang, translation in update.translations.items():
+                    self.logger.info(f"Translation ({target_lang}): {translation}")
+                self.publish_translation(update)
+                
+                return update
             else:
                 self.logger.warning("Translation failed")
                 return None
@@ -78,6 +191,309 @@ class TeamsTranslatorApp:
             self.logger.error(f"Error in grab_and_translate: {e}")
             return None
     
+    def show_provisionally(self, text: str, seq: int, future: Future) -> SequencedTranslation:
+        """
+        Return something to display while the translation of text is in flight.
+        
+        The final translation is queued when the future completes and
+        replaces this one on a later tick.
+        
+        Returns:
+            Provisional update holding translation memory matches, or the
+            source text itself
+        """
+        future.add_done_callback(self._queue_final_translation)
+        translations = self.lookup_translation_memory(text, self.target_languages)
+        if translations is None:
+            translations = {lang: text for lang in self.target_languages}
+        return SequencedTranslation(seq=seq, source_text=text, translations=translations, provisional=True)
+    
+    def _queue_final_translation(self, future: Future):
+        # Superseded incomplete lines are cancelled and simply never finalised
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            self.logger.error(f"Translation failed: {e}")
+            return
+        if result.translations:
+            # Timed on arrival, not when the next tick picks it up
+            self.display_window.record_timing(result, displayed=False)
+        self.final_translations.put(result)
+    
+    def pop_final_translation(self) -> Optional[SequencedTranslation]:
+        """Return the newest final translation of a provisionally shown segment, if one has arrived."""
+        newest = None
+        while True:
+            try:
+                result = self.final_translations.get_nowait()
+            except queue.Empty:
+                break
+            if not result.translations:
+                self.logger.warning("Translation failed")
+                continue
+            
+            self.text_capture.mark_as_translated(result.source_text)
+            for target_lang, translation in result.translations.items():
+                self.logger.info(f"Translation ({target_lang}): {translation}")
+            self.publish_translation(result)
+            # Still transcribed, but not shown over a newer caption
+            if result.seq < self.latest_seq:
+                self.stale_results_dropped += 1
+                self.logger.debug(f"Dropped stale final translation #{result.seq} (showing #{self.latest_seq})")
+                continue
+            if newest is None or result.seq > newest.seq:
+                newest = result
+        return newest
+    
+    def format_translations(self, translations: Dict[str, str]) -> Union[str, Dict[str, str]]:
+        """Return a single translation, or the per-language mapping for several targets."""
+        if len(self.target_languages) == 1:
+            return translations[self.target_languages[0]]
+        return translations
+    
+    def translate_to_targets(self, text: str, seq: int = 0) -> SequencedTranslation:
+        """
+        Translate text to every configured target language.
+        
+        Cached translations are reused and the remaining languages are
+        requested in parallel. If the translation memory holds a near
+        match for every remaining language, it is returned as a provisional
+        translation and the exact one is fetched in the background.
+        
+        Args:
+            text: Text to translate
+            seq: Capture sequence number of the text
+            
+        Returns:
+            Result holding the languages that could be translated
+        """
+        trace = self.tracer.get(seq) if self.tracer else None
+        with tracing.activate(trace):
+            missing = []
+            provisional = False
+            
+            # Check phrase tables and the cache first
+            with tracing.span("cache"):
+                translations = dict(self.match_phrases(text, seq, require_all=False).translations)
+                for target_lang in self.target_languages:
+                    if target_lang in translations:
+                        continue
+                    cached = self.translation_cache.get((text, target_lang))
+                    if cached is not None:
+                        self.logger.debug(f"Using cached translation ({target_lang})")
+                        translations[target_lang] = cached
+                    else:
+                        missing.append(target_lang)
+            
+            if missing:
+                with tracing.span("translation memory"):
+                    memory_matches = self.lookup_translation_memory(text, missing)
+                if memory_matches:
+                    provisional = True
+                    translations.update(memory_matches)
+                    self.scheduler.submit(
+                        self._refine_translation, text, missing, seq, dict(translations),
+                        priority=TranslationScheduler.PRIORITY_INCOMPLETE
+                    )
+                else:
+                    with tracing.span("translate", languages=",".join(missing)):
+                        translations.update(self.request_translations(text, missing, seq).translations)
+        
+        # Keep the configured language order for display lanes
+        return SequencedTranslation(
+            seq=seq,
+            source_text=text,
+            translations={lang: translations[lang] for lang in self.target_languages if lang in translations},
+            provisional=provisional
+        )
+    
+    def match_phrases(self, text: str, seq: int = 0, require_all: bool = True) -> Optional[SequencedTranslation]:
+        """
+        Translate text from the phrase tables alone.
+        
+        Args:
+            text: Text to translate
+            seq: Capture sequence number of the text
+            require_all: Give up unless every target language has the phrase
+            
+        Returns:
+            The languages that have the phrase, or None if require_all is
+            set and some language lacks it
+        """
+        translations: Dict[str, str] = {}
+        for target_lang in self.target_languages:
+            table = self.phrase_tables.get(target_lang)
+            phrase = table.lookup(text) if table is not None else None
+            if phrase is not None:
+                translations[target_lang] = phrase
+            elif require_all:
+                return None
+        
+        if len(translations) == len(self.target_languages):
+            self.phrase_hits += 1
+            self.logger.debug("Using phrase table translation")
+        return SequencedTranslation(seq=seq, source_text=text, translations=translations)
+    
+    def request_translations(self, text: str, target_langs: List[str], seq: int = 0) -> SequencedTranslation:
+        """Translate text with the backend, caching and remembering the results."""
+        result = self.translation_service.translate_sequenced(seq, text, target_langs)
+        for target_lang, translation in result.translations.items():
+            # Cache the translation
+            self.translation_cache[(text, target_lang)] = translation
+            if self.translation_memory is not None:
+                self.translation_memory.add(text, target_lang, translation)
+        return result
+    
+    def lookup_translation_memory(self, text: str, target_langs: List[str]) -> Optional[Dict[str, str]]:
+        """Return near-match translations for every target language, or None."""
+        if self.translation_memory is None:
+            return None
+        
+        matches = {}
+        for target_lang in target_langs:
+            match = self.translation_memory.lookup(text, target_lang)
+            if match is None:
+                return None
+            matches[target_lang] = match.translation
+        
+        self.logger.debug(f"Using provisional translation memory match for: {text[:50]}...")
+        return matches
+    
+    def _refine_translation(self, text: str, target_langs: List[str], seq: int,
+                            provisional_translations: Dict[str, str]):
+        """Fetch the exact translation for a provisional one, keeping its other languages."""
+        try:
+            result = self.request_translations(text, target_langs, seq)
+            if result.translations:
+                # Languages that failed keep their memory match and stay provisional
+                result.provisional = any(lang not in result.translations for lang in target_langs)
+                translations = dict(provisional_translations, **result.translations)
+                result.translations = {
+                    lang: translations[lang] for lang in self.target_languages if lang in translations
+                }
+                self.refined_translations.put(result)
+        except Exception as e:
+            self.logger.error(f"Error refining translation: {e}")
+    
+    def update_speculation(self) -> Optional[SequencedTranslation]:
+        """
+        Speculatively translate the incomplete line once it stops changing.
+        
+        A speculation is superseded as soon as the incomplete line changes.
+        A finished speculation for the current incomplete line is committed:
+        the line is marked as translated and its translation returned for
+        display.
+        
+        Returns:
+            Translation of the incomplete line if a speculation just finished
+        """
+        debounce = self.config.translation.speculative_debounce
+        if debounce <= 0:
+            return None
+        
+        current_line = self.text_capture.incomplete_line
+        
+        if self.speculation is not None:
+            text, future = self.speculation
+            if text != current_line:
+                if not future.done():
+                    # Not started requests are dropped; a running one just fills the cache
+                    future.cancel()
+                    self.speculations_superseded += 1
+                    self.logger.debug(f"Superseded speculative translation: {text[:50]}...")
+                self.speculation = None
+            else:
+                if future.done() and not future.cancelled() and text not in self.text_capture.already_translated:
+                    update = future.result()
+                    if update.translations:
+                        self.text_capture.mark_as_translated(text)
+                        # Committed on the current tick, so it is newer than anything displayed
+                        update.seq = self.text_capture.capture_seq
+                        self.latest_seq = update.seq
+                        for target_lang, translation in update.translations.items():
+                            self.logger.info(f"Speculative translation ({target_lang}): {translation}")
+                        self.publish_translation(update)
+                        return update
+                # Keep the speculation until the line changes so it is not requested again
+                return None
+        
+        candidate = self.text_capture.get_stable_incomplete_line(debounce)
+        if candidate:
+            self.logger.debug(f"Speculatively translating: {candidate[:50]}...")
+            self.speculation = (candidate, self.scheduler.submit(
+                self.translate_to_targets, candidate, self.text_capture.capture_seq,
+                priority=TranslationScheduler.PRIORITY_SPECULATIVE,
+                supersede_key="speculation"
+            ))
+        return None
+    
+    def await_speculation(self, text: str):
+        """Wait for an in-flight speculation of text instead of requesting it again."""
+        if self.speculation is None:
+            return
+        
+        speculated_text, future = self.speculation
+        if speculated_text == text and not future.cancelled():
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error(f"Speculative translation failed: {e}")
+    
+    def pop_refined_translation(self) -> Optional[SequencedTranslation]:
+        """Return the exact translation replacing the latest provisional one, if it has arrived."""
+        newest = None
+        while True:
+            try:
+                result = self.refined_translations.get_nowait()
+            except queue.Empty:
+                break
+            # Refinements of older captions must not overwrite newer ones
+            if result.seq < self.latest_seq:
+                self.stale_results_dropped += 1
+                self.logger.debug(f"Dropped stale refinement #{result.seq} (showing #{self.latest_seq})")
+                continue
+            newest = result
+        
+        if newest is None:
+            return None
+        
+        for target_lang, translation in newest.translations.items():
+            self.logger.info(f"Refined translation ({target_lang}): {translation}")
+        self.publish_translation(newest)
+        return newest
+    
+    def publish_translation(self, update: SequencedTranslation):
+        """Publish a translated segment to broadcast clients, the transcript export and the search index, if enabled."""
+        if self.transcript_index is not None and not update.provisional:
+            self.transcript_index.add(
+                self.clock.time(), self.config.capture.split_marker, update.source_text,
+                update.translations, update.seq
+            )
+        
+        if self.exporter and not update.provisional:
+            captured_at = self.capture_times.get(update.seq)
+            for target_lang, translation in update.translations.items():
+                self.exporter.write(make_record(
+                    self.config.capture.split_marker, update.source_text, translation,
+                    target_lang, update.seq, captured_at, now=self.clock.time()
+                ))
+        
+        if not self.broadcast_server:
+            return
+        
+        for target_lang, translation in update.translations.items():
+            self.broadcast_server.publish({
+                "seq": update.seq,
+                "timestamp": self.clock.time(),
+                "source_language": self.config.translation.source_language,
+                "target_language": target_lang,
+                "source": update.source_text,
+                "translation": translation,
+                "provisional": update.provisional
+            })
+    
     def check_prerequisites(self) -> bool:
         """Check if all prerequisites are met."""
         if not self.translation_service.is_service_available():
@@ -87,16 +503,40 @@ class TeamsTranslatorApp:
         self.logger.info("All prerequisites met")
         return True
     
-    def start_translation_session(self):
-        """Start a new translation session."""
+    def start_warm_up(self):
+        """Warm up the translation backend in the background during the countdown."""
+        if not self.config.translation.warm_up:
+            return
+        
+        source_lang = self.config.translation.source_language
+        pairs = [(source_lang, target_lang) for target_lang in self.target_languages]
+        
+        def set_status(message: str):
+            self.warm_up_status = message
+        
+        threading.Thread(
+            target=self.translation_service.warm_up,
+            args=(pairs, set_status),
+            name="warm-up",
+            daemon=True
+        ).start()
+    
+    def reset_session(self):
+        """Reset caches and mark existing text as translated."""
         self.logger.info("Starting translation session")
         
         # Reset caches
         self.text_capture.reset_translation_cache()
         self.translation_cache.clear()
+        self.latest_seq = 0
+        self.speculation = None
         
         # Mark existing text as translated
         self.text_capture.mark_all_previous_translated()
+    
+    def start_translation_session(self):
+        """Start a new translation session."""
+        self.reset_session()
         
         # Start translation updates
         update_interval_ms = int(self.config.translation.rate_delay * 1000)
@@ -105,20 +545,50 @@ class TeamsTranslatorApp:
     def run(self):
         """Run the main application."""
         self.logger.info("Starting Teams Translator")
+        headless = self.config.broadcast.headless
+        trace = self.startup_trace
         
-        # Check prerequisites
-        if not self.check_prerequisites():
-            self.logger.error("Prerequisites not met. Exiting.")
-            return 1
+        # Independent startup steps run concurrently; the window itself
+        # must be created on the main thread
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="startup") as startup_pool:
+            prerequisites = startup_pool.submit(trace.timed("backend probe", self.check_prerequisites))
+            screen_size = None
+            if not headless:
+                screen_size = startup_pool.submit(
+                    trace.timed("monitor discovery", self.display_window.get_screen_size)
+                )
+                with trace.phase("load ui toolkit"):
+                    self.display_window.preload()
+            
+            # Check prerequisites
+            if not prerequisites.result():
+                self.logger.error("Prerequisites not met. Exiting.")
+                return 1
+        
+        if self.broadcast_server:
+            with trace.phase("start broadcast server"):
+                self.broadcast_server.start()
+        if self.exporter:
+            self.exporter.start()
+        if self.transcript_index is not None:
+            self.transcript_index.start()
+        
+        if headless:
+            self.report_startup()
+            return self.run_headless()
         
         try:
             # Create and show display window
-            self.display_window.create_window()
+            with trace.phase("create window"):
+                self.display_window.create_window(screen_size.result())
+            self.report_startup()
             
-            # Start countdown and then translation
+            # Start countdown, warming up the backend meanwhile, and then translation
+            self.start_warm_up()
             self.display_window.start_countdown(
                 self.config.ui.wait_start_time,
-                self.start_translation_session
+                self.start_translation_session,
+                lambda: self.warm_up_status
             )
             
             # Start the main loop
@@ -130,6 +600,54 @@ class TeamsTranslatorApp:
         except Exception as e:
             self.logger.error(f"Application error: {e}")
             return 1
+        finally:
+            if self.broadcast_server:
+                self.broadcast_server.stop()
+            if self.exporter:
+                self.exporter.close()
+            if self.transcript_index is not None:
+                self.transcript_index.close()
+            if self.tracer:
+                self.tracer.close()
+        
+        self.logger.info("Application finished")
+        return 0
+    
+    def report_startup(self):
+        """Print the startup timing breakdown if tracing is enabled."""
+        self.logger.info(f"Ready after {self.startup_trace.elapsed() * 1000:.0f} ms")
+        if self.startup_trace.enabled:
+            print(self.startup_trace.report(), file=sys.stderr)
+    
+    def run_headless(self) -> int:
+        """Run the capture/translate loop without a display window."""
+        self.logger.info(f"Running headless, starting in {self.config.ui.wait_start_time} seconds")
+        self.is_running = True
+        
+        try:
+            self.start_warm_up()
+            self.clock.sleep(self.config.ui.wait_start_time)
+            self.reset_session()
+            
+            while self.is_running:
+                self.grab_and_translate()
+                self.clock.sleep(self.config.translation.rate_delay)
+                
+        except KeyboardInterrupt:
+            self.logger.info("Application interrupted by user")
+        except Exception as e:
+            self.logger.error(f"Application error: {e}")
+            return 1
+        finally:
+            self.is_running = False
+            if self.broadcast_server:
+                self.broadcast_server.stop()
+            if self.exporter:
+                self.exporter.close()
+            if self.transcript_index is not None:
+                self.transcript_index.close()
+            if self.tracer:
+                self.tracer.close()
         
         self.logger.info("Application finished")
         return 0
\ No newline at end of file
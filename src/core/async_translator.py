@@ -0,0 +1,208 @@
+"""asyncio-native translation service for embedding in async servers."""
+
+import asyncio
+import json
+import logging
+from typing import Optional, Dict, Any, List, Iterable
+from ..config.settings import TranslationConfig
+from ..utils.lazy_import import LazyModule
+from .rate_limiter import TokenBucket
+from .translator import LanguageRoutingMixin
+
+# Optional dependency, only needed when the async service is used
+aiohttp = LazyModule("aiohttp")
+
+
+class AsyncTranslationService(LanguageRoutingMixin):
+    """
+    Async counterpart of TranslationService for the LibreTranslate API.
+
+    Requests share one aiohttp session, so connections are pooled, and at
+    most max_concurrency of them are in flight at once; the rest wait on a
+    semaphore instead of occupying a thread each. Failures are logged and
+    reported as None, as in TranslationService.
+
+    Use as an async context manager, or call close() when done.
+    """
+
+    MAX_CONCURRENCY = 32
+    REQUEST_TIMEOUT = 10.0
+    PROBE_TIMEOUT = 5.0
+
+    def __init__(self, config: TranslationConfig, session: Optional["aiohttp.ClientSession"] = None,
+                 max_concurrency: int = MAX_CONCURRENCY, timeout: float = REQUEST_TIMEOUT):
+        """
+        Args:
+            config: Translation configuration
+            session: Session to use instead of creating one on first request
+            max_concurrency: Maximum number of requests in flight
+            timeout: Total timeout of a translation request in seconds
+        """
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self.rate_limiter: Optional[TokenBucket] = None
+        if config.max_requests_per_second > 0:
+            self.rate_limiter = TokenBucket(config.max_requests_per_second, config.request_burst)
+
+        self._setup_routing(config)
+
+    async def __aenter__(self) -> "AsyncTranslationService":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def languages_url(self) -> str:
+        """URL of the LibreTranslate language listing endpoint."""
+        return self.config.libretranslate_url.replace("/translate", "/languages")
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """Shared HTTP session, created on first use inside the running loop."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding the number of requests in flight."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def close(self):
+        """Close the HTTP session if this service created it."""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+        self._session = None
+
+    async def translate(self, text: str, source_lang: Optional[str] = None,
+                        target_lang: Optional[str] = None) -> Optional[str]:
+        """
+        Translate text using LibreTranslate API.
+
+        Args:
+            text: Text to translate
+            source_lang: Source language code (defaults to config)
+            target_lang: Target language code (defaults to config)
+
+        Returns:
+            Translated text or None if translation failed
+        """
+        if not text.strip():
+            return None
+
+        source_lang = source_lang or self.config.source_language
+        target_lang = target_lang or self.config.target_language
+
+        detected_lang = self.route(text, source_lang, target_lang)
+        if detected_lang == target_lang:
+            return text
+
+        translation = await self._request_translation(text, detected_lang, target_lang)
+        if translation is None and detected_lang != source_lang:
+            # The server may not have the detected pair; fall back to the configured one
+            translation = await self._request_translation(text, source_lang, target_lang)
+        return translation
+
+    async def translate_many(self, texts: Iterable[str], source_lang: Optional[str] = None,
+                             target_lang: Optional[str] = None) -> List[Optional[str]]:
+        """
+        Translate many texts concurrently.
+
+        Returns:
+            Translations in the order of texts, None for failed ones
+        """
+        return list(await asyncio.gather(
+            *(self.translate(text, source_lang, target_lang) for text in texts)
+        ))
+
+    async def translate_to_targets(self, text: str, target_langs: List[str],
+                                   source_lang: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        Translate text to several target languages concurrently.
+
+        Returns:
+            Mapping of target language code to translated text (None if failed)
+        """
+        translations = await asyncio.gather(
+            *(self.translate(text, source_lang, lang) for lang in target_langs)
+        )
+        return dict(zip(target_langs, translations))
+
+    async def is_service_available(self) -> bool:
+        """
+        Check if LibreTranslate service is available.
+
+        Returns:
+            True if service is available, False otherwise
+        """
+        try:
+            async with self.session.get(self.languages_url, timeout=self._timeout(self.PROBE_TIMEOUT)) as response:
+                return response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+    async def get_languages(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get list of supported languages.
+
+        Returns:
+            List of language dictionaries or None if request failed
+        """
+        try:
+            async with self.session.get(self.languages_url, timeout=self._timeout(self.PROBE_TIMEOUT)) as response:
+                if response.status == 200:
+                    return await response.json()
+                self.logger.error(f"Language listing failed with status {response.status}")
+                return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(f"Language listing request failed: {e}")
+            return None
+        except (json.JSONDecodeError, ValueError) as e:
+            self.logger.error(f"Failed to parse language listing: {e}")
+            return None
+
+    async def _request_translation(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        data = {
+            "q": text,
+            "source": source_lang,
+            "target": target_lang,
+            "format": "text",
+            "api_key": self.config.api_key
+        }
+
+        async with self.semaphore:
+            if self.rate_limiter:
+                while not self.rate_limiter.try_acquire():
+                    await asyncio.sleep(1 / self.rate_limiter.rate)
+
+            try:
+                async with self.session.post(self.config.libretranslate_url, json=data,
+                                             timeout=self._timeout(self.timeout)) as response:
+                    if response.status == 200:
+                        payload = await response.json()
+                        self.logger.debug(f"Translation response: {payload}")
+                        return payload.get("translatedText")
+                    body = await response.text()
+                    self.logger.error(f"Translation failed with status {response.status}: {body}")
+                    return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.error(f"Translation request failed: {e}")
+                return None
+            except (json.JSONDecodeError, ValueError) as e:
+                self.logger.error(f"Failed to parse translation response: {e}")
+                return None
+
+    def _timeout(self, seconds: float) -> "aiohttp.ClientTimeout":
+        return aiohttp.ClientTimeout(total=seconds)
@@ -0,0 +1,192 @@
+"""In-process translation backends that skip the HTTP hop, and request hedging."""
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from typing import Optional, Dict, Any, List, Tuple
+from ..utils.lazy_import import LazyModule
+from .latency import LatencyTracker
+
+# Argos Translate is the engine LibreTranslate wraps; optional dependency
+argos_translate = LazyModule("argostranslate.translate")
+
+
+class ArgosTranslationBackend:
+    """
+    Calls a locally installed Argos Translate engine directly.
+    
+    Avoids JSON serialisation and the loopback HTTP request for on-box
+    deployments. Requires the argostranslate package and the language
+    pair packages to be installed.
+    """
+    
+    name = "argos"
+    
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._translations: Dict[Tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+    
+    def _get_translation(self, source_lang: str, target_lang: str):
+        key = (source_lang, target_lang)
+        translation = self._translations.get(key)
+        if translation is None:
+            with self._lock:
+                translation = self._translations.get(key)
+                if translation is None:
+                    languages = {lang.code: lang for lang in argos_translate.get_installed_languages()}
+                    if source_lang not in languages or target_lang not in languages:
+                        return None
+                    translation = languages[source_lang].get_translation(languages[target_lang])
+                    if translation is None:
+                        return None
+                    self._translations[key] = translation
+        return translation
+    
+    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Translate text with the local Argos engine."""
+        try:
+            translation = self._get_translation(source_lang, target_lang)
+            if translation is None:
+                self.logger.error(f"Argos language pair {source_lang}->{target_lang} is not installed")
+                return None
+            return translation.translate(text)
+        except ImportError as e:
+            self.logger.error(f"Argos Translate is not installed: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Argos translation failed: {e}")
+            return None
+    
+    def is_available(self) -> bool:
+        """Check that Argos Translate is installed with at least one language."""
+        try:
+            return bool(argos_translate.get_installed_languages())
+        except ImportError:
+            return False
+    
+    def get_languages(self) -> Optional[List[Dict[str, Any]]]:
+        """List installed Argos languages."""
+        try:
+            languages = argos_translate.get_installed_languages()
+        except ImportError:
+            return None
+        return [
+            {
+                "code": lang.code,
+                "name": lang.name,
+                "targets": [other.code for other in languages
+                            if other is not lang and lang.get_translation(other) is not None]
+            }
+            for lang in languages
+        ]
+
+
+class StubTranslationBackend:
+    """
+    Deterministic fake engine for tests and benchmarks.
+    
+    Returns "[target] text" after an optional fixed delay and counts calls.
+    """
+    
+    name = "stub"
+    
+    def __init__(self, delay: float = 0.0, languages: Optional[List[str]] = None):
+        self.delay = delay
+        self.languages = languages or ["en", "fi", "sv", "de"]
+        self.calls = 0
+        self._lock = threading.Lock()
+    
+    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Return a predictable translation."""
+        with self._lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return f"[{target_lang}] {text}"
+    
+    def is_available(self) -> bool:
+        """The stub is always available."""
+        return True
+    
+    def get_languages(self) -> Optional[List[Dict[str, Any]]]:
+        """List the configured stub languages."""
+        return [
+            {"code": code, "name": code, "targets": [other for other in self.languages if other != code]}
+            for code in self.languages
+        ]
+
+
+class HedgedTranslationBackend:
+    """
+    Sends a duplicate request to a second backend when the first is slow.
+    
+    Every request goes to the primary backend. If it has not answered
+    within its p95 latency, the same request is sent to the secondary and
+    the first successful answer wins, which cuts the tail latency users
+    notice without doubling the load. No hedges are sent until enough
+    primary latencies have been observed.
+    """
+    
+    name = "hedged"
+    
+    def __init__(self, primary, secondary, min_hedge_delay: float = 0.05, workers: int = 8):
+        self.primary = primary
+        self.secondary = secondary
+        self.min_hedge_delay = min_hedge_delay
+        self.logger = logging.getLogger(__name__)
+        self.latency = LatencyTracker()
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hedge")
+    
+    def hedge_delay(self, size: Optional[int] = None) -> Optional[float]:
+        """Seconds to wait for the primary before hedging a text of the given length, None until known."""
+        p95 = self.latency.percentile(95, size)
+        return None if p95 is None else max(self.min_hedge_delay, p95)
+    
+    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Translate with the primary, hedging to the secondary if it is slow."""
+        started = time.monotonic()
+        # Each attempt runs in the caller's context so it shows up in its trace
+        primary = self._executor.submit(contextvars.copy_context().run, self.primary.translate,
+                                        text, source_lang, target_lang)
+        primary.add_done_callback(lambda _: self.latency.record(time.monotonic() - started, len(text)))
+        
+        delay = self.hedge_delay(len(text))
+        wait([primary], timeout=delay)
+        if primary.done():
+            return self._result(primary)
+        
+        self.hedges_sent += 1
+        self.logger.debug(f"Primary slower than {delay:.2f}s, hedging request")
+        hedge = self._executor.submit(contextvars.copy_context().run, self.secondary.translate,
+                                      text, source_lang, target_lang)
+        
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = self._result(future)
+                if result is not None:
+                    if future is hedge:
+                        self.hedges_won += 1
+                    return result
+        return None
+    
+    def is_available(self) -> bool:
+        """Available if either backend is."""
+        return self.primary.is_available() or self.secondary.is_available()
+    
+    def get_languages(self) -> Optional[List[Dict[str, Any]]]:
+        """List the primary's languages, or the secondary's if that fails."""
+        return self.primary.get_languages() or self.secondary.get_languages()
+    
+    def _result(self, future: Future) -> Optional[str]:
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.error(f"Hedged translation failed: {e}")
+            return None
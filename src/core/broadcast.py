@@ -0,0 +1,247 @@
+"""Broadcast server for fanning translations out to many viewers."""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, List
+from urllib.parse import urlparse, parse_qs
+from ..config.settings import BroadcastConfig
+from .transcript_index import TranscriptIndex
+
+
+VIEWER_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Teams Translator</title>
+<style>
+body { background: transparent; color: #fff; font: bold 28px Helvetica, sans-serif;
+       text-shadow: 0 0 4px #000; margin: 1em; }
+</style>
+</head>
+<body>
+<div id="translation"></div>
+<script>
+var params = new URLSearchParams(window.location.search);
+var lang = params.get("lang");
+var session = params.get("session");
+var source = new EventSource("/events");
+source.addEventListener("translation", function (e) {
+    var event = JSON.parse(e.data);
+    if ((!lang || event.target_language === lang) && (!session || event.session === session)) {
+        document.getElementById("translation").textContent = event.translation;
+    }
+});
+</script>
+</body>
+</html>
+"""
+
+
+class ClientBuffer:
+    """Bounded per-client event buffer that drops the oldest events when full."""
+
+    def __init__(self, max_size: int):
+        self.events: deque = deque(maxlen=max_size)
+        self.dropped = 0
+        self.closed = False
+        self._condition = threading.Condition()
+
+    def push(self, event: Dict[str, Any]):
+        """Queue an event without ever blocking the publisher."""
+        with self._condition:
+            if len(self.events) == self.events.maxlen:
+                self.dropped += 1
+            self.events.append(event)
+            self._condition.notify()
+
+    def pop_all(self, timeout: float) -> List[Dict[str, Any]]:
+        """Wait up to timeout seconds for events and return all queued ones."""
+        with self._condition:
+            if not self.events and not self.closed:
+                self._condition.wait(timeout)
+            events = list(self.events)
+            self.events.clear()
+            return events
+
+    def close(self):
+        """Wake up the waiting client so it can disconnect."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+
+class BroadcastServer:
+    """
+    Publishes translated segments to any number of Server-Sent Events clients.
+
+    When given a transcript index, the server also answers /search?q=...
+    with the matching segments of the session.
+    """
+
+    KEEPALIVE_INTERVAL = 15.0
+    MAX_SEARCH_RESULTS = 100
+
+    def __init__(self, config: BroadcastConfig, index: Optional[TranscriptIndex] = None):
+        self.config = config
+        self.index = index
+        self.logger = logging.getLogger(__name__)
+        self.clients: List[ClientBuffer] = []
+        self.last_event: Optional[Dict[str, Any]] = None
+        self.next_event_id = 1
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> tuple:
+        """Return the (host, port) the server is bound to."""
+        if self._server:
+            return self._server.server_address[:2]
+        return self.config.host, self.config.port
+
+    def start(self):
+        """Start serving in a background thread."""
+        handler = type("BroadcastRequestHandler", (_BroadcastRequestHandler,), {"broadcast": self})
+        self._server = ThreadingHTTPServer((self.config.host, self.config.port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="broadcast-server", daemon=True)
+        self._thread.start()
+        host, port = self.address
+        self.logger.info(f"Broadcast server listening on http://{host}:{port}/")
+
+    def stop(self):
+        """Stop the server and disconnect all clients."""
+        with self._lock:
+            clients = list(self.clients)
+        for client in clients:
+            client.close()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self.logger.info("Broadcast server stopped")
+
+    def publish(self, event: Dict[str, Any]):
+        """
+        Publish an event to every connected client.
+
+        Args:
+            event: JSON-serialisable event payload
+        """
+        with self._lock:
+            event = dict(event, id=self.next_event_id)
+            self.next_event_id += 1
+            self.last_event = event
+            clients = list(self.clients)
+
+        for client in clients:
+            client.push(event)
+
+    def add_client(self) -> ClientBuffer:
+        """Register a new client buffer, primed with the latest event."""
+        client = ClientBuffer(self.config.client_buffer_size)
+        with self._lock:
+            if self.last_event:
+                client.push(self.last_event)
+            self.clients.append(client)
+        self.logger.info(f"Broadcast client connected ({len(self.clients)} total)")
+        return client
+
+    def remove_client(self, client: ClientBuffer):
+        """Unregister a client buffer."""
+        with self._lock:
+            if client in self.clients:
+                self.clients.remove(client)
+        if client.dropped:
+            self.logger.warning(f"Broadcast client dropped {client.dropped} events")
+        self.logger.info(f"Broadcast client disconnected ({len(self.clients)} total)")
+
+
+class _BroadcastRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler serving the SSE stream and a minimal viewer page."""
+
+    broadcast: BroadcastServer
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        path = url.path
+        if path == "/events":
+            self._serve_events()
+        elif path == "/latest":
+            self._send_json(self.broadcast.last_event or {})
+        elif path == "/search" and self.broadcast.index is not None:
+            self._serve_search(parse_qs(url.query))
+        elif path in ("/", "/index.html"):
+            self._send_body(VIEWER_PAGE.encode("utf-8"), "text/html; charset=utf-8")
+        else:
+            self.send_error(404)
+
+    def _serve_search(self, params: Dict[str, List[str]]):
+        query = params.get("q", [""])[0]
+        session = params.get("session", [None])[0]
+        try:
+            limit = min(int(params.get("limit", ["20"])[0]), BroadcastServer.MAX_SEARCH_RESULTS)
+        except ValueError:
+            self.send_error(400, "limit must be an integer")
+            return
+
+        segments = self.broadcast.index.search(query, limit, session)
+        self._send_json({
+            "query": query,
+            "results": [
+                {
+                    "timestamp": segment.timestamp,
+                    "speaker": segment.speaker,
+                    "session": segment.session,
+                    "seq": segment.seq,
+                    "source": segment.source_text,
+                    "translations": segment.translations
+                }
+                for segment in segments
+            ]
+        })
+
+    def _send_json(self, payload: Any):
+        self._send_body(json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _send_body(self, body: bytes, content_type: str):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        client = self.broadcast.add_client()
+        try:
+            last_write = time.time()
+            while not client.closed:
+                events = client.pop_all(BroadcastServer.KEEPALIVE_INTERVAL)
+                chunks = [
+                    f"id: {event['id']}\nevent: translation\ndata: {json.dumps(event)}\n\n"
+                    for event in events
+                ]
+                if not chunks and time.time() - last_write >= BroadcastServer.KEEPALIVE_INTERVAL:
+                    chunks.append(": keepalive\n\n")
+                if chunks:
+                    self.wfile.write("".join(chunks).encode("utf-8"))
+                    self.wfile.flush()
+                    last_write = time.time()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.broadcast.remove_client(client)
+
+    def log_message(self, format, *args):
+        self.broadcast.logger.debug(format % args)
@@ -0,0 +1,73 @@
+"""Length-aware splitting of long texts into translatable chunks."""
+
+import re
+from typing import List, Tuple
+
+# Boundaries tried in order: sentence ends, then clause breaks, then any space
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?…。！？])\s+")
+CLAUSE_BOUNDARY = re.compile(r"(?<=[,;:，；：])\s+|\s+(?=[–—]\s)")
+WORD_BOUNDARY = re.compile(r"\s+")
+BOUNDARIES = (SENTENCE_BOUNDARY, CLAUSE_BOUNDARY, WORD_BOUNDARY)
+
+
+def split_text(text: str, max_chars: int) -> List[str]:
+    """
+    Split text into chunks of at most max_chars characters.
+
+    The text is cut at sentence ends where possible. A sentence that is
+    too long on its own is cut at clause breaks, then between words, and
+    a single word longer than max_chars is cut anywhere. Neighbouring
+    pieces are packed back together up to max_chars, so a long
+    monologue becomes as few chunks as the limit allows. Whitespace
+    between chunks is not kept; use split_chunks to join them back.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum length of a chunk
+
+    Returns:
+        Chunks in text order, empty if the text is blank
+    """
+    return [chunk for _, chunk in split_chunks(text, max_chars)]
+
+
+def split_chunks(text: str, max_chars: int) -> List[Tuple[str, str]]:
+    """
+    Split text like split_text, keeping what separates each chunk from the previous one.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum length of a chunk
+
+    Returns:
+        (separator, chunk) pairs in text order. The separator is "" for
+        the first chunk and for a chunk continuing a word that was cut
+        anywhere, so URLs and long words are not broken up by spaces
+        when the chunks are joined, and " " otherwise.
+    """
+    if max_chars <= 0:
+        raise ValueError("max_chars must be positive")
+    text = text.strip()
+    if len(text) <= max_chars:
+        return [("", text)] if text else []
+
+    chunks: List[Tuple[str, str]] = []
+    for separator, piece in _pieces(text, max_chars, 0):
+        if chunks and len(chunks[-1][1]) + len(separator) + len(piece) <= max_chars:
+            chunks[-1] = (chunks[-1][0], f"{chunks[-1][1]}{separator}{piece}")
+        else:
+            chunks.append(("" if not chunks else separator, piece))
+    return chunks
+
+
+def _pieces(text: str, max_chars: int, level: int) -> List[Tuple[str, str]]:
+    if len(text) <= max_chars:
+        return [(" ", text)]
+    if level == len(BOUNDARIES):
+        return [(" " if start == 0 else "", text[start:start + max_chars])
+                for start in range(0, len(text), max_chars)]
+    pieces: List[Tuple[str, str]] = []
+    for part in BOUNDARIES[level].split(text):
+        if part:
+            pieces.extend(_pieces(part, max_chars, level + 1))
+    return pieces
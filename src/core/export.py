@@ -0,0 +1,204 @@
+"""Buffered export of transcripts and translations to JSONL, SRT or WebVTT."""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional, List
+from ..config.settings import ExportConfig
+
+# Cue number followed by its timing line, in SRT or WebVTT
+CUE_PATTERN = re.compile(
+    r"^(\d+)\n(\d{2}):(\d{2}):(\d{2})[,.](\d{3}) --> (\d{2}):(\d{2}):(\d{2})[,.](\d{3})",
+    re.MULTILINE
+)
+
+
+@dataclass
+class ExportRecord:
+    """One translated caption segment."""
+    timestamp: float
+    speaker: str
+    source_text: str
+    translation: str
+    target_language: str
+    latency: Optional[float] = None
+    seq: int = 0
+
+
+def format_timestamp(seconds: float, separator: str) -> str:
+    """Format seconds as HH:MM:SS<separator>mmm for subtitle cues."""
+    millis = int(round(max(0.0, seconds) * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+class TranscriptExporter:
+    """
+    Appends translated segments to a transcript file.
+
+    Records are formatted on the caller's thread into an in-memory buffer
+    and written by a background thread once flush_size records are queued
+    or flush_interval seconds have passed, so file I/O never blocks the
+    capture loop. Every write appends whole records and is flushed, so the
+    file can be tailed while the meeting runs.
+
+    Subtitle cues are timed relative to the first record and stay up long
+    enough to read, between MIN_CUE_DURATION and MAX_CUE_DURATION seconds.
+    When appending to an existing subtitle file, numbering continues after
+    its last cue and timing after the latest cue end.
+    Subtitle files hold a single language; records for other languages
+    are only kept in JSONL.
+    """
+
+    FORMATS = ("jsonl", "srt", "vtt")
+    MIN_CUE_DURATION = 1.5
+    MAX_CUE_DURATION = 7.0
+    CHARACTERS_PER_SECOND = 15.0
+
+    def __init__(self, config: ExportConfig, subtitle_language: Optional[str] = None):
+        self.config = config
+        self.format = self.resolve_format(config.path, config.format)
+        self.subtitle_language = subtitle_language
+        self.logger = logging.getLogger(__name__)
+        self.records_written = 0
+        self._buffer: List[str] = []
+        self._condition = threading.Condition()
+        # Held while swapping out and writing the buffer, keeping writes in order
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._cue_index = 0
+        self._cue_offset = 0.0
+        self._origin: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def resolve_format(cls, path: str, format: str = "") -> str:
+        """Return the explicit format, or infer it from the file extension."""
+        if not format:
+            format = os.path.splitext(path)[1].lstrip(".").lower() or "jsonl"
+        if format == "webvtt":
+            format = "vtt"
+        if format not in cls.FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+        return format
+
+    def start(self):
+        """Open the file and start the background writer."""
+        if self.format != "jsonl" and self._has_content():
+            self._continue_cues()
+        elif self.format == "vtt":
+            self._write(["WEBVTT\n\n"], count=False)
+        self._thread = threading.Thread(target=self._run, name="transcript-export", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Exporting transcript to {self.config.path} ({self.format})")
+
+    def write(self, record: ExportRecord):
+        """Queue a record for writing; never blocks on file I/O."""
+        if (self.format != "jsonl" and self.subtitle_language
+                and record.target_language != self.subtitle_language):
+            return
+        with self._condition:
+            if self._closed:
+                return
+            self._buffer.append(self._format(record))
+            if len(self._buffer) >= self.config.flush_size:
+                self._condition.notify()
+
+    def flush(self):
+        """Write all queued records now."""
+        with self._write_lock:
+            with self._condition:
+                chunks, self._buffer = self._buffer, []
+            self._write(chunks)
+
+    def close(self):
+        """Flush remaining records and stop the background writer."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _format(self, record: ExportRecord) -> str:
+        if self.format == "jsonl":
+            return json.dumps(asdict(record), ensure_ascii=False) + "\n"
+
+        if self._origin is None:
+            self._origin = record.timestamp
+        start = self._cue_offset + record.timestamp - self._origin
+        duration = min(self.MAX_CUE_DURATION,
+                       max(self.MIN_CUE_DURATION, len(record.translation) / self.CHARACTERS_PER_SECOND))
+        self._cue_index += 1
+
+        if self.format == "srt":
+            timing = f"{format_timestamp(start, ',')} --> {format_timestamp(start + duration, ',')}"
+            return f"{self._cue_index}\n{timing}\n{record.speaker}: {record.translation}\n\n"
+
+        timing = f"{format_timestamp(start, '.')} --> {format_timestamp(start + duration, '.')}"
+        return f"{self._cue_index}\n{timing}\n<v {record.speaker}>{record.translation}\n\n"
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and len(self._buffer) < self.config.flush_size:
+                    self._condition.wait(self.config.flush_interval)
+                closed = self._closed
+            self.flush()
+            if closed:
+                return
+
+    def _write(self, chunks: List[str], count: bool = True):
+        if not chunks:
+            return
+        try:
+            with open(self.config.path, "a", encoding="utf-8") as f:
+                f.write("".join(chunks))
+                f.flush()
+        except OSError as e:
+            self.logger.error(f"Failed to write transcript export: {e}")
+            return
+        if count:
+            self.records_written += len(chunks)
+
+    def _continue_cues(self):
+        try:
+            with open(self.config.path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Failed to read existing subtitles, numbering cues from 1: {e}")
+            return
+        for match in CUE_PATTERN.finditer(content):
+            hours, minutes, secs, millis = (int(value) for value in match.groups()[5:])
+            self._cue_index = max(self._cue_index, int(match.group(1)))
+            self._cue_offset = max(self._cue_offset, hours * 3600 + minutes * 60 + secs + millis / 1000)
+
+    def _has_content(self) -> bool:
+        try:
+            return os.path.getsize(self.config.path) > 0
+        except OSError:
+            return False
+
+
+def make_record(speaker: str, source_text: str, translation: str, target_language: str,
+                seq: int = 0, captured_at: Optional[float] = None,
+                now: Optional[float] = None) -> ExportRecord:
+    """Build a record stamped now, with latency measured from captured_at."""
+    if now is None:
+        now = time.time()
+    return ExportRecord(
+        timestamp=now,
+        speaker=speaker,
+        source_text=source_text,
+        translation=translation,
+        target_language=target_language,
+        latency=round(now - captured_at, 3) if captured_at is not None else None,
+        seq=seq
+    )
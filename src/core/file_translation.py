@@ -0,0 +1,185 @@
+"""Offline translation of saved transcripts with batching and resume."""
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, asdict
+from itertools import islice
+from typing import Optional, Callable, List
+from .text_capture import iter_transcript_segments
+from .translator import TranslationService
+
+
+@dataclass
+class FileTranslationCheckpoint:
+    """Progress of a file translation, saved after every batch."""
+    input_path: str
+    input_size: int
+    split_marker: str
+    target_language: str
+    segments_done: int = 0
+    output_bytes: int = 0
+
+
+@dataclass
+class FileTranslationResult:
+    """Outcome of translating a file."""
+    segments_translated: int
+    segments_skipped: int
+    failed: bool = False
+
+
+class FileTranslator:
+    """
+    Translates a transcript file segment by segment.
+
+    The input is streamed through the speaker-marker parser, so files of
+    any size are translated in constant memory. Segments are sent in
+    batches whose requests run in parallel, and each finished batch is
+    appended to the output before a checkpoint records how far the run
+    got. An interrupted or failed run resumes after the last checkpointed
+    segment.
+
+    Output is JSONL (one record per segment) when the output path ends in
+    .jsonl, otherwise a transcript with the split marker before each
+    translated segment.
+    """
+
+    def __init__(self, translation_service: TranslationService, split_marker: str,
+                 batch_size: int = 32):
+        self.translation_service = translation_service
+        self.split_marker = split_marker
+        self.batch_size = max(1, batch_size)
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def checkpoint_path(output_path: str) -> str:
+        """Return the checkpoint file used for an output file."""
+        return output_path + ".checkpoint"
+
+    def translate_file(self, input_path: str, output_path: str,
+                       source_lang: Optional[str] = None, target_lang: Optional[str] = None,
+                       resume: bool = True,
+                       progress: Optional[Callable[[int], None]] = None) -> FileTranslationResult:
+        """
+        Translate a transcript file.
+
+        Args:
+            input_path: Transcript to translate
+            output_path: File the translation is written to
+            source_lang: Source language code (defaults to config)
+            target_lang: Target language code (defaults to config)
+            resume: Continue from an existing checkpoint instead of starting over
+            progress: Called with the number of segments done after each batch
+
+        Returns:
+            Counts of translated and skipped segments, and whether a batch failed
+        """
+        config = self.translation_service.config
+        source_lang = source_lang or config.source_language
+        target_lang = target_lang or config.target_language
+        jsonl = output_path.endswith(".jsonl")
+
+        checkpoint = FileTranslationCheckpoint(
+            input_path=os.path.abspath(input_path),
+            input_size=os.path.getsize(input_path),
+            split_marker=self.split_marker,
+            target_language=target_lang
+        )
+        if resume:
+            checkpoint = self._load_checkpoint(output_path, checkpoint)
+        skipped = checkpoint.segments_done
+
+        # Binary output, so the checkpoint can hold a byte offset to truncate at
+        mode = "r+b" if checkpoint.output_bytes else "wb"
+        started = time.monotonic()
+        with open(input_path, "r", encoding="utf-8") as source, open(output_path, mode) as output:
+            if checkpoint.output_bytes:
+                # Drop anything written after the last checkpoint
+                output.seek(checkpoint.output_bytes)
+                output.truncate()
+                self.logger.info(f"Resuming after {skipped} segments")
+
+            segments = iter_transcript_segments(source, self.split_marker)
+            for _ in islice(segments, skipped):
+                pass
+
+            while True:
+                batch = list(islice(segments, self.batch_size))
+                if not batch:
+                    break
+
+                translations = self._translate_batch(batch, source_lang, target_lang)
+                # Only the prefix that succeeded is written, so a resume retries the rest
+                done = 0
+                for index, (segment, translation) in enumerate(zip(batch, translations)):
+                    if translation is None:
+                        break
+                    output.write(self._format(checkpoint.segments_done + index, segment, translation, jsonl)
+                                 .encode("utf-8"))
+                    done += 1
+
+                output.flush()
+                checkpoint.segments_done += done
+                checkpoint.output_bytes = output.tell()
+                self._save_checkpoint(output_path, checkpoint)
+                if progress:
+                    progress(checkpoint.segments_done)
+
+                if done < len(batch):
+                    self.logger.error(f"Translation failed at segment {checkpoint.segments_done}; "
+                                      f"rerun to resume from there")
+                    return FileTranslationResult(checkpoint.segments_done - skipped, skipped, failed=True)
+
+        # Nothing is checkpointed when the transcript has no segments
+        if os.path.exists(self.checkpoint_path(output_path)):
+            os.remove(self.checkpoint_path(output_path))
+        translated = checkpoint.segments_done - skipped
+        elapsed = time.monotonic() - started
+        self.logger.info(f"Translated {translated} segments in {elapsed:.1f}s")
+        return FileTranslationResult(translated, skipped)
+
+    def _translate_batch(self, batch: List[str], source_lang: str, target_lang: str) -> List[Optional[str]]:
+        futures = [self.translation_service.submit(segment, source_lang, target_lang) for segment in batch]
+        translations = []
+        for future in futures:
+            try:
+                translations.append(future.result())
+            except Exception as e:
+                self.logger.error(f"Segment translation failed: {e}")
+                translations.append(None)
+        return translations
+
+    def _format(self, index: int, segment: str, translation: str, jsonl: bool) -> str:
+        if jsonl:
+            record = {"index": index, "source": segment, "translation": translation}
+            return json.dumps(record, ensure_ascii=False) + "\n"
+        return f"{self.split_marker}\n{translation}\n"
+
+    def _load_checkpoint(self, output_path: str,
+                         fresh: FileTranslationCheckpoint) -> FileTranslationCheckpoint:
+        path = self.checkpoint_path(output_path)
+        if not os.path.exists(path) or not os.path.exists(output_path):
+            return fresh
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                saved = FileTranslationCheckpoint(**json.load(f))
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return fresh
+
+        same_job = (saved.input_path, saved.input_size, saved.split_marker, saved.target_language) == \
+            (fresh.input_path, fresh.input_size, fresh.split_marker, fresh.target_language)
+        if not same_job:
+            self.logger.warning("Checkpoint belongs to a different input or settings, starting over")
+            return fresh
+        return saved
+
+    def _save_checkpoint(self, output_path: str, checkpoint: FileTranslationCheckpoint):
+        path = self.checkpoint_path(output_path)
+        temporary = path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(asdict(checkpoint), f)
+        os.replace(temporary, path)
+
@@ -0,0 +1,188 @@
+"""Lightweight local language identification for caption text."""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Iterable
+
+
+# Training text for the bundled character n-gram profiles: everyday
+# meeting speech, written the way speech recognition captions it.
+LANGUAGE_SAMPLES: Dict[str, str] = {
+    "fi": (
+        "hyvää huomenta kaikille ja tervetuloa palaveriin. aloitetaan vaikka siitä että "
+        "käydään läpi viime viikon tehtävät. onko kaikilla ääni kuuluu hyvin? minä voin "
+        "jakaa näytön ja näyttää missä vaiheessa projekti on nyt. meillä on vielä muutama "
+        "asia kesken mutta aikataulu näyttää ihan hyvältä. asiakas toivoi että toimitus "
+        "tapahtuisi ensi kuun alussa. kuka ottaa vastuun testauksesta? minun mielestäni "
+        "meidän pitäisi keskustella tästä vielä tarkemmin. se on totta että budjetti on "
+        "tiukka mutta kyllä me siitä selvitään. kiitos paljon kaikille, jatketaan huomenna. "
+        "joo selvä, tehdään niin. en ole varma ymmärsinkö oikein, voisitko toistaa? "
+        "tämä on tärkeä kysymys ja siihen pitää vastata ennen kuin päätös tehdään. "
+        "sitten seuraavaksi mennään esitykseen ja katsotaan tulokset yhdessä läpi."
+    ),
+    "en": (
+        "good morning everyone and welcome to the meeting. let's start by going through "
+        "the tasks from last week. can everyone hear me well? i can share my screen and "
+        "show you where the project is right now. we still have a few things in progress "
+        "but the schedule looks pretty good. the customer would like the delivery to "
+        "happen at the beginning of next month. who will take responsibility for testing? "
+        "i think we should discuss this in more detail. it is true that the budget is "
+        "tight but we will manage. thank you very much everyone, let's continue tomorrow. "
+        "yeah okay, let's do that. i'm not sure i understood correctly, could you repeat "
+        "that? this is an important question and we have to answer it before the decision "
+        "is made. then next we will move on to the presentation and look at the results."
+    ),
+    "sv": (
+        "god morgon allihopa och välkomna till mötet. vi börjar med att gå igenom "
+        "uppgifterna från förra veckan. hör alla mig bra? jag kan dela min skärm och visa "
+        "var projektet är just nu. vi har fortfarande några saker på gång men tidtabellen "
+        "ser ganska bra ut. kunden vill att leveransen sker i början av nästa månad. vem "
+        "tar ansvar för testningen? jag tycker att vi borde diskutera det här närmare. det "
+        "är sant att budgeten är stram men vi klarar oss nog. tack så mycket allihopa, vi "
+        "fortsätter i morgon. ja okej, vi gör så. jag är inte säker på att jag förstod rätt, "
+        "kan du upprepa? det här är en viktig fråga och vi måste svara på den innan beslutet "
+        "fattas. sedan går vi vidare till presentationen och tittar på resultaten tillsammans."
+    ),
+    "de": (
+        "guten morgen zusammen und willkommen zur besprechung. wir fangen damit an, die "
+        "aufgaben der letzten woche durchzugehen. können mich alle gut hören? ich kann "
+        "meinen bildschirm teilen und zeigen, wo das projekt gerade steht. wir haben noch "
+        "ein paar dinge offen, aber der zeitplan sieht ziemlich gut aus. der kunde möchte, "
+        "dass die lieferung anfang nächsten monats erfolgt. wer übernimmt die verantwortung "
+        "für das testen? ich denke, wir sollten das noch genauer besprechen. es stimmt, dass "
+        "das budget knapp ist, aber wir schaffen das schon. vielen dank an alle, wir machen "
+        "morgen weiter. ja gut, machen wir das so. ich bin nicht sicher, ob ich das richtig "
+        "verstanden habe, kannst du das wiederholen? das ist eine wichtige frage und wir "
+        "müssen sie beantworten, bevor die entscheidung getroffen wird."
+    ),
+    "fr": (
+        "bonjour à tous et bienvenue à la réunion. nous allons commencer par passer en revue "
+        "les tâches de la semaine dernière. est-ce que tout le monde m'entend bien? je peux "
+        "partager mon écran et vous montrer où en est le projet maintenant. nous avons encore "
+        "quelques points en cours mais le calendrier semble plutôt bon. le client voudrait que "
+        "la livraison ait lieu au début du mois prochain. qui va prendre la responsabilité des "
+        "tests? je pense que nous devrions en discuter plus en détail. c'est vrai que le budget "
+        "est serré mais nous allons nous en sortir. merci beaucoup à tous, on continue demain. "
+        "oui d'accord, faisons comme ça. je ne suis pas sûr d'avoir bien compris, pouvez-vous "
+        "répéter? c'est une question importante et il faut y répondre avant que la décision "
+        "soit prise. ensuite nous passerons à la présentation pour regarder les résultats."
+    ),
+    "es": (
+        "buenos días a todos y bienvenidos a la reunión. vamos a empezar repasando las tareas "
+        "de la semana pasada. ¿me escuchan todos bien? puedo compartir mi pantalla y mostrarles "
+        "en qué punto está el proyecto ahora. todavía tenemos algunas cosas pendientes pero el "
+        "calendario se ve bastante bien. el cliente quiere que la entrega sea a principios del "
+        "próximo mes. ¿quién se encarga de las pruebas? creo que deberíamos hablar de esto con "
+        "más detalle. es verdad que el presupuesto es ajustado pero lo vamos a lograr. muchas "
+        "gracias a todos, seguimos mañana. sí vale, hagámoslo así. no estoy seguro de haber "
+        "entendido bien, ¿puedes repetirlo? esta es una pregunta importante y tenemos que "
+        "responderla antes de tomar la decisión. luego pasamos a la presentación y vemos los "
+        "resultados juntos."
+    ),
+}
+
+
+@dataclass
+class DetectedLanguage:
+    """Best guess for the language of a text."""
+    language: str
+    score: float
+    margin: float
+
+
+class LanguageDetector:
+    """
+    Character n-gram language identifier.
+
+    Each language is profiled by the frequencies of its character 1- to
+    3-grams, and a text is scored by the average log-probability of its
+    n-grams under each profile. Short captions carry little evidence, so
+    a guess is only reported when the text is long enough and the winner
+    beats the expected language by a clear margin.
+    """
+
+    _NON_LETTER = re.compile(r"[^\w\s']+|\d+")
+    _WHITESPACE = re.compile(r"\s+")
+
+    def __init__(self, samples: Optional[Dict[str, str]] = None,
+                 languages: Optional[Iterable[str]] = None,
+                 max_ngram: int = 3, min_length: int = 12, min_margin: float = 0.15):
+        samples = samples or LANGUAGE_SAMPLES
+        if languages:
+            samples = {lang: samples[lang] for lang in languages if lang in samples}
+        self.max_ngram = max_ngram
+        self.min_length = min_length
+        self.min_margin = min_margin
+        self.profiles: Dict[str, Dict[str, float]] = {}
+        self.unseen: Dict[str, float] = {}
+        for language, sample in samples.items():
+            self._train(language, sample)
+
+    @property
+    def languages(self) -> List[str]:
+        return list(self.profiles)
+
+    def normalize(self, text: str) -> str:
+        """Lower-case and strip digits, punctuation and redundant whitespace."""
+        text = self._NON_LETTER.sub(" ", text.casefold())
+        return self._WHITESPACE.sub(" ", text).strip()
+
+    def ngrams(self, normalized: str) -> List[str]:
+        """Return the character n-grams of each padded word."""
+        grams = []
+        for word in normalized.split(" "):
+            padded = f" {word} "
+            for n in range(1, self.max_ngram + 1):
+                grams.extend(padded[i:i + n] for i in range(len(padded) - n + 1) if padded[i:i + n] != " ")
+        return grams
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """Average n-gram log-probability of text under each language profile."""
+        grams = self.ngrams(self.normalize(text))
+        if not grams:
+            return {}
+        counts = Counter(grams)
+        total = len(grams)
+        return {
+            language: sum(profile.get(gram, self.unseen[language]) * count
+                          for gram, count in counts.items()) / total
+            for language, profile in self.profiles.items()
+        }
+
+    def detect(self, text: str, expected: Optional[str] = None) -> Optional[DetectedLanguage]:
+        """
+        Identify the language of text.
+
+        Args:
+            text: Text to identify
+            expected: Language assumed unless the evidence clearly says otherwise
+
+        Returns:
+            The detected language, or None if the text is too short or the
+            result is not clear enough to overrule the expected language
+        """
+        if len(self.normalize(text)) < self.min_length:
+            return None
+        scores = self.scores(text)
+        if len(scores) < 2:
+            return None
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        best, best_score = ranked[0]
+        if expected in scores and best != expected:
+            margin = best_score - scores[expected]
+        else:
+            margin = best_score - ranked[1][1]
+        if margin < self.min_margin:
+            return None
+        return DetectedLanguage(best, best_score, margin)
+
+    def _train(self, language: str, sample: str):
+        counts = Counter(self.ngrams(self.normalize(sample)))
+        total = sum(counts.values())
+        # Add-one smoothing over the observed n-grams plus one unseen slot
+        denominator = total + len(counts) + 1
+        self.profiles[language] = {gram: math.log((count + 1) / denominator) for gram, count in counts.items()}
+        self.unseen[language] = math.log(1 / denominator)
@@ -0,0 +1,96 @@
+"""Rolling latency statistics for deriving request timeouts."""
+
+import math
+import threading
+from collections import deque
+from typing import Optional, Dict
+
+
+class LatencyTracker:
+    """
+    Thread-safe rolling window of request latencies.
+
+    Fixed timeouts are either too tight for a slow server or far too loose
+    for a fast one. Timeouts derived from the recent p99 follow what the
+    server is actually doing; until min_samples latencies have been seen
+    the caller's default applies.
+
+    Translation time grows with the length of the text, so latencies
+    recorded with a size are also kept per size class (powers of two above
+    64 characters). A long chunk is then timed against earlier requests of
+    similar length rather than against short live captions, and gets the
+    default timeout until enough of those have been seen.
+    """
+
+    SMALLEST_SIZE_CLASS = 64
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self.samples: deque = deque(maxlen=window)
+        self.sized_samples: Dict[int, deque] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    @classmethod
+    def size_class(cls, size: int) -> int:
+        """Return the size class of a request of the given length."""
+        return max(0, (max(1, size) - 1).bit_length() - (cls.SMALLEST_SIZE_CLASS - 1).bit_length())
+
+    def record(self, seconds: float, size: Optional[int] = None):
+        """
+        Add an observed latency.
+
+        Args:
+            seconds: Latency in seconds
+            size: Length of the request's text, if it has one
+        """
+        with self._lock:
+            self.samples.append(seconds)
+            if size is not None:
+                size_class = self.size_class(size)
+                if size_class not in self.sized_samples:
+                    self.sized_samples[size_class] = deque(maxlen=self.window)
+                self.sized_samples[size_class].append(seconds)
+
+    def percentile(self, percent: float, size: Optional[int] = None) -> Optional[float]:
+        """
+        Return the given percentile of the window (nearest rank).
+
+        Args:
+            percent: Percentile to return
+            size: Only use latencies of requests in the size class of this length
+
+        Returns:
+            The percentile in seconds, or None before min_samples latencies
+        """
+        with self._lock:
+            samples = self.samples if size is None else self.sized_samples.get(self.size_class(size), ())
+            if len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def timeout(self, default: float, multiplier: float = 3.0,
+                floor: float = 1.0, cap: Optional[float] = None, size: Optional[int] = None) -> float:
+        """
+        Derive a timeout from the p99 latency.
+
+        Args:
+            default: Timeout used until enough latencies have been seen
+            multiplier: Multiple of the p99 latency to allow; 0 disables adaptation
+            floor: Smallest timeout returned
+            cap: Largest timeout returned, defaults to default
+            size: Length of the request's text; its size class's latencies are used
+
+        Returns:
+            Timeout in seconds
+        """
+        p99 = self.percentile(99, size)
+        if p99 is None or multiplier <= 0:
+            return default
+        cap = default if cap is None else cap
+        return min(cap, max(floor, p99 * multiplier))
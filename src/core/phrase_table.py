@@ -0,0 +1,96 @@
+"""Phrase table for short fixed utterances that need no server round trip."""
+
+import logging
+import os
+from typing import Optional, Dict, List, Iterable, Tuple
+from ..utils.text import normalize_text
+
+
+class PhraseTable:
+    """
+    Exact translations of common short phrases for one language pair.
+
+    Meetings are full of fixed utterances ("Kiitos", "Joo", "Kuuleeko?")
+    that would otherwise each cost a server request. Phrases are stored
+    under a normalized key, so lookup is a single dict access that ignores
+    case, punctuation and extra whitespace.
+
+    Tables are plain text files named ``<source>-<target>.tsv`` with one
+    ``phrase<TAB>translation`` pair per line; empty lines and lines
+    starting with ``#`` are ignored.
+    """
+
+    normalize = staticmethod(normalize_text)
+
+    def __init__(self, phrases: Optional[Iterable[Tuple[str, str]]] = None):
+        self.phrases: Dict[str, str] = {}
+        for phrase, translation in phrases or ():
+            self.add(phrase, translation)
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def add(self, phrase: str, translation: str):
+        """Add or replace a phrase."""
+        key = self.normalize(phrase)
+        if key:
+            self.phrases[key] = translation
+
+    def lookup(self, text: str) -> Optional[str]:
+        """Return the translation of text if it is a known phrase."""
+        return self.phrases.get(self.normalize(text))
+
+    @classmethod
+    def load(cls, path: str) -> "PhraseTable":
+        """
+        Load a phrase table file.
+
+        Args:
+            path: Path of a tab-separated phrase file
+
+        Returns:
+            The loaded table
+        """
+        table = cls()
+        logger = logging.getLogger(__name__)
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                phrase, separator, translation = line.partition("\t")
+                if not separator or not translation.strip():
+                    logger.warning(f"Skipping malformed phrase in {path}:{line_number}")
+                    continue
+                table.add(phrase, translation.strip())
+        return table
+
+
+def load_phrase_tables(directory: str, source_lang: str, target_langs: List[str]) -> Dict[str, PhraseTable]:
+    """
+    Load the phrase tables available for a source language.
+
+    Args:
+        directory: Directory holding ``<source>-<target>.tsv`` files
+        source_lang: Source language code
+        target_langs: Target language codes
+
+    Returns:
+        Mapping of target language to its table, for pairs that have a file
+    """
+    logger = logging.getLogger(__name__)
+    tables: Dict[str, PhraseTable] = {}
+    if not directory:
+        return tables
+
+    for target_lang in target_langs:
+        path = os.path.join(directory, f"{source_lang}-{target_lang}.tsv")
+        if not os.path.isfile(path):
+            continue
+        try:
+            tables[target_lang] = PhraseTable.load(path)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"Failed to load phrase table {path}: {e}")
+            continue
+        logger.info(f"Loaded {len(tables[target_lang])} phrases for {source_lang}->{target_lang}")
+    return tables
@@ -0,0 +1,171 @@
+"""Process-pool execution for CPU-bound in-process translation backends."""
+
+import logging
+import math
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
+
+# Backend owned by each worker process; created once so the model stays loaded
+_worker_backend = None
+
+
+def _create_engine(engine: str, options: Dict[str, Any]):
+    from .backends import ArgosTranslationBackend, StubTranslationBackend
+    if engine == "argos":
+        return ArgosTranslationBackend(**options)
+    if engine == "stub":
+        return StubTranslationBackend(**options)
+    raise ValueError(f"Unknown in-process translation engine: {engine}")
+
+
+def _init_worker(engine: str, options: Dict[str, Any]):
+    global _worker_backend
+    _worker_backend = _create_engine(engine, options)
+
+
+def _translate_batch(batch: List[Tuple[str, str, str]]) -> List[Optional[str]]:
+    return [_worker_backend.translate(text, source_lang, target_lang)
+            for text, source_lang, target_lang in batch]
+
+
+def _probe_worker() -> bool:
+    return _worker_backend.is_available()
+
+
+def _worker_languages() -> Optional[List[Dict[str, Any]]]:
+    return _worker_backend.get_languages()
+
+
+class ProcessPoolTranslationBackend:
+    """
+    Runs an in-process engine in a pool of worker processes.
+
+    In-process model calls are CPU-bound and would otherwise compete with
+    the Tk loop and capture parsing for the GIL. Each worker loads the
+    engine once. Requests queued within batch_window seconds of each other
+    are gathered, up to batch_size, and split evenly across the workers so
+    each worker translates its share in one call; results are delivered
+    through futures.
+    """
+
+    name = "process-pool"
+
+    def __init__(self, engine: str, workers: int = 2, batch_size: int = 8, batch_window: float = 0.005,
+                 engine_options: Optional[Dict[str, Any]] = None):
+        self.engine = engine
+        self.engine_options = engine_options or {}
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.batch_window = batch_window
+        self.logger = logging.getLogger(__name__)
+        self.batches_sent = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._pending: "queue.Queue[Optional[Tuple[Tuple[str, str, str], Future]]]" = queue.Queue()
+        self._dispatcher: Optional[threading.Thread] = None
+
+    def get_pool(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        initializer=_init_worker,
+                        initargs=(self.engine, self.engine_options)
+                    )
+                    self._dispatcher = threading.Thread(
+                        target=self._dispatch, name="process-pool-dispatcher", daemon=True
+                    )
+                    self._dispatcher.start()
+                    self.logger.info(f"Started {self.workers} '{self.engine}' translation workers")
+        return self._pool
+
+    def submit(self, text: str, source_lang: str, target_lang: str) -> Future:
+        """Queue a translation and return a future for its result."""
+        self.get_pool()
+        future: Future = Future()
+        self._pending.put(((text, source_lang, target_lang), future))
+        return future
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Translate text in a worker process."""
+        try:
+            return self.submit(text, source_lang, target_lang).result()
+        except Exception as e:
+            self.logger.error(f"Worker translation failed: {e}")
+            return None
+
+    def is_available(self) -> bool:
+        """Check that a worker can load the engine."""
+        try:
+            return self.get_pool().submit(_probe_worker).result()
+        except Exception as e:
+            self.logger.error(f"Translation worker unavailable: {e}")
+            return False
+
+    def get_languages(self) -> Optional[List[Dict[str, Any]]]:
+        """List the engine's languages from a worker."""
+        try:
+            return self.get_pool().submit(_worker_languages).result()
+        except Exception as e:
+            self.logger.error(f"Failed to list worker languages: {e}")
+            return None
+
+    def shutdown(self):
+        """Stop the dispatcher and the worker processes."""
+        if self._pool is None:
+            return
+        self._pending.put(None)
+        if self._dispatcher:
+            self._dispatcher.join()
+        self._pool.shutdown()
+        self._pool = None
+
+    def _dispatch(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            batch = [item]
+            # Gather whatever else arrives shortly so workers get full batches
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._pending.get(timeout=self.batch_window)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            # One call per worker, so a gathered batch runs in parallel
+            size = math.ceil(len(batch) / self.workers)
+            for start in range(0, len(batch), size):
+                self._send(batch[start:start + size])
+            if stop:
+                return
+
+    def _send(self, batch: List[Tuple[Tuple[str, str, str], Future]]):
+        futures = [future for _, future in batch]
+        try:
+            pool_future = self._pool.submit(_translate_batch, [request for request, _ in batch])
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+        self.batches_sent += 1
+
+        def resolve(done: Future):
+            try:
+                results = done.result()
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                return
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+        pool_future.add_done_callback(resolve)
@@ -0,0 +1,208 @@
+"""Shared caching translation proxy with a LibreTranslate-compatible API."""
+
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlparse, parse_qs
+from ..config.settings import ProxyConfig, TranslationConfig
+from ..utils.lru import LRUCache
+from .translator import TranslationBackend, create_backend
+
+
+class TranslationProxy:
+    """
+    Serves /translate and /languages for many clients from one backend.
+
+    Every attendee of a meeting translates the same captions, so the
+    proxy keeps one cache for all of them, keyed by (text, source,
+    target). Identical requests that arrive while the first one is still
+    in flight wait for its result instead of calling the backend again
+    (single flight), and at most upstream_connections requests reach the
+    backend at once over its pooled connections.
+
+    Clients point their libretranslate_url at http://host:port/translate.
+    """
+
+    def __init__(self, config: ProxyConfig, translation_config: TranslationConfig,
+                 backend: Optional[TranslationBackend] = None):
+        self.config = config
+        self.translation_config = translation_config
+        self.logger = logging.getLogger(__name__)
+        # The per-client request budget would throttle the whole team; the proxy has its own
+        upstream_config = replace(translation_config, max_requests_per_second=config.upstream_requests_per_second)
+        self.backend = backend or create_backend(upstream_config, config.upstream_connections)
+        self.cache = LRUCache(config.cache_size)
+        self.requests = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.upstream_calls = 0
+        self.upstream_failures = 0
+        self._languages: Optional[List[Dict[str, Any]]] = None
+        self._in_flight: Dict[Tuple[str, str, str], Future] = {}
+        self._upstream_slots = threading.Semaphore(max(1, config.upstream_connections))
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> tuple:
+        """Return the (host, port) the proxy is bound to."""
+        if self._server:
+            return self._server.server_address[:2]
+        return self.config.host, self.config.port
+
+    def start(self):
+        """Start serving in a background thread."""
+        handler = type("ProxyRequestHandler", (_ProxyRequestHandler,), {"proxy": self})
+        self._server = ThreadingHTTPServer((self.config.host, self.config.port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="translation-proxy", daemon=True)
+        self._thread.start()
+        host, port = self.address
+        self.logger.info(f"Translation proxy listening on http://{host}:{port}/translate")
+
+    def stop(self):
+        """Stop the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self.logger.info(
+            f"Translation proxy stopped: {self.requests} requests, {self.cache_hits} cache hits, "
+            f"{self.coalesced} coalesced, {self.upstream_calls} upstream calls"
+        )
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """
+        Translate text through the shared cache.
+
+        Returns:
+            Translated text or None if the backend failed
+        """
+        key = (text, source_lang, target_lang)
+        with self._lock:
+            self.requests += 1
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        translation = None
+        try:
+            with self._upstream_slots:
+                translation = self.backend.translate(text, source_lang, target_lang)
+        except Exception as e:
+            self.logger.error(f"Upstream translation failed: {e}")
+        finally:
+            with self._lock:
+                self.upstream_calls += 1
+                if translation is None:
+                    self.upstream_failures += 1
+                else:
+                    self.cache[key] = translation
+                del self._in_flight[key]
+            future.set_result(translation)
+        return translation
+
+    def languages(self) -> Optional[List[Dict[str, Any]]]:
+        """Return the backend's language list, fetched once."""
+        if self._languages is None:
+            self._languages = self.backend.get_languages()
+        return self._languages
+
+    def stats(self) -> Dict[str, int]:
+        """Return request counters."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "cache_hits": self.cache_hits,
+                "coalesced": self.coalesced,
+                "upstream_calls": self.upstream_calls,
+                "upstream_failures": self.upstream_failures,
+                "cache_entries": len(self.cache)
+            }
+
+
+class _ProxyRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the LibreTranslate-compatible endpoints."""
+
+    proxy: TranslationProxy
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/languages":
+            languages = self.proxy.languages()
+            if languages is None:
+                self._send_json(502, {"error": "Upstream language listing failed"})
+            else:
+                self._send_json(200, languages)
+        elif path == "/stats":
+            self._send_json(200, self.proxy.stats())
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/translate":
+            self.send_error(404)
+            return
+
+        params = self._read_params()
+        if params is None:
+            self._send_json(400, {"error": "Invalid request body"})
+            return
+        q = params.get("q")
+        source = params.get("source") or self.proxy.translation_config.source_language
+        target = params.get("target")
+        if not q or not target:
+            self._send_json(400, {"error": "Invalid request: missing q or target parameter"})
+            return
+
+        # LibreTranslate accepts a list of texts as well as a single one
+        texts = q if isinstance(q, list) else [q]
+        translations = [self.proxy.translate(str(text), source, target) for text in texts]
+        if any(translation is None for translation in translations):
+            self._send_json(502, {"error": "Upstream translation failed"})
+            return
+        self._send_json(200, {"translatedText": translations if isinstance(q, list) else translations[0]})
+
+    def _read_params(self) -> Optional[Dict[str, Any]]:
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length < 0:
+                return None
+            body = self.rfile.read(length).decode("utf-8") if length else ""
+        except (ValueError, UnicodeDecodeError):
+            return None
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            try:
+                params = json.loads(body or "{}")
+            except ValueError:
+                return None
+            return params if isinstance(params, dict) else None
+        form = parse_qs(body)
+        return {key: values if key == "q" and len(values) > 1 else values[0] for key, values in form.items()}
+
+    def _send_json(self, status: int, payload: Any):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        self.proxy.logger.debug(format % args)
@@ -0,0 +1,137 @@
+"""Priority scheduling of translation requests."""
+
+import heapq
+import itertools
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Optional, Callable, Dict, List, Any, Tuple
+
+
+@dataclass(order=True)
+class ScheduledJob:
+    """A queued call, ordered by priority, fair-share round and submission order."""
+    priority: int
+    round: int
+    order: int
+    func: Callable = field(compare=False)
+    args: Tuple = field(compare=False)
+    future: Future = field(compare=False)
+    supersede_key: Optional[Tuple[Optional[str], str]] = field(default=None, compare=False)
+
+
+class TranslationScheduler:
+    """
+    Runs translation calls on a small worker pool in priority order.
+    
+    Completed lines outrank incomplete-line refreshes, which outrank
+    speculative requests. A job submitted with a supersede_key replaces any
+    job of the same session with the same key that has not started yet;
+    the replaced job's future is cancelled.
+    
+    Within a priority level, sessions are served fairly: each session's
+    jobs are numbered in rounds, so a session submitting a burst cannot
+    starve the others.
+    """
+    
+    PRIORITY_COMPLETE = 0
+    PRIORITY_INCOMPLETE = 1
+    PRIORITY_SPECULATIVE = 2
+    
+    def __init__(self, workers: int = 2):
+        self.logger = logging.getLogger(__name__)
+        self.superseded_count = 0
+        self._queue: List[ScheduledJob] = []
+        self._pending_by_key: Dict[Tuple[Optional[str], str], ScheduledJob] = {}
+        self._counter = itertools.count()
+        self._session_rounds: Dict[Optional[str], int] = {}
+        self._virtual_round = 0
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"scheduler-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+    
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._queue)
+    
+    def submit(self, func: Callable, *args: Any, priority: int = PRIORITY_COMPLETE,
+               supersede_key: Optional[str] = None, session: Optional[str] = None) -> Future:
+        """
+        Queue a call.
+        
+        Args:
+            func: Callable to run on a worker
+            *args: Arguments for func
+            priority: Lower values run first
+            supersede_key: Pending jobs of the same session with the same key are dropped
+            session: Session the job belongs to, for fair queuing
+            
+        Returns:
+            Future for the call's result
+        """
+        future: Future = Future()
+        
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Scheduler has been shut down")
+            
+            # A session that was idle rejoins at the current round instead of
+            # catching up on rounds it did not use
+            job_round = max(self._session_rounds.get(session, 0), self._virtual_round)
+            self._session_rounds[session] = job_round + 1
+            key = (session, supersede_key) if supersede_key is not None else None
+            job = ScheduledJob(priority, job_round, next(self._counter), func, args, future, key)
+            
+            if key is not None:
+                previous = self._pending_by_key.get(key)
+                if previous is not None and previous.future.cancel():
+                    self.superseded_count += 1
+                    self.logger.debug(f"Superseded pending job '{supersede_key}' of session {session}")
+                self._pending_by_key[key] = job
+            heapq.heappush(self._queue, job)
+            self._condition.notify()
+        return future
+    
+    def shutdown(self, wait: bool = True):
+        """Stop the workers, cancelling jobs that have not started."""
+        with self._condition:
+            self._shutdown = True
+            for job in self._queue:
+                job.future.cancel()
+            self._queue.clear()
+            self._pending_by_key.clear()
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+    
+    def _next_job(self) -> Optional[ScheduledJob]:
+        with self._condition:
+            while not self._queue and not self._shutdown:
+                self._condition.wait()
+            if self._shutdown:
+                return None
+            job = heapq.heappop(self._queue)
+            self._virtual_round = max(self._virtual_round, job.round)
+            if job.supersede_key is not None and self._pending_by_key.get(job.supersede_key) is job:
+                del self._pending_by_key[job.supersede_key]
+            return job
+    
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            # Skips jobs whose future was cancelled while queued
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            try:
+                job.future.set_result(job.func(*job.args))
+            except BaseException as e:
+                job.future.set_exception(e)
@@ -0,0 +1,203 @@
+"""Multi-session mode: many caption streams sharing one translation pool."""
+
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import replace
+from typing import Optional, Dict, List, Callable
+from ..config.settings import AppConfig
+from .scheduler import TranslationScheduler
+from .text_capture import TextCapture
+from .translator import TranslationService, SequencedTranslation
+from ..utils.clock import Clock, SYSTEM_CLOCK
+from ..utils.lru import LRUCache
+
+
+class CaptionSession:
+    """Per-session capture state for one caption stream."""
+
+    def __init__(self, name: str, capture: TextCapture):
+        self.name = name
+        self.capture = capture
+        self.latest_seq = 0
+        self.translated_segments = 0
+        self.stale_results_dropped = 0
+        self.failed_segments = 0
+
+
+class SessionManager:
+    """
+    Runs independent caption sessions in one process.
+
+    Every session has its own TextCapture state, while the translation
+    service (and its connection pool), the translation cache and the
+    scheduler are shared. Jobs are queued per session so the scheduler
+    serves sessions fairly.
+    """
+
+    def __init__(self, config: AppConfig,
+                 translation_service: Optional[TranslationService] = None,
+                 scheduler: Optional[TranslationScheduler] = None,
+                 on_translation: Optional[Callable[[CaptionSession, SequencedTranslation], None]] = None,
+                 clock: Optional[Clock] = None):
+        self.config = config
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger(__name__)
+        self.translation_service = translation_service or TranslationService(config.translation)
+        self.scheduler = scheduler or TranslationScheduler(config.translation.get_scheduler_workers())
+        self.on_translation = on_translation
+        self.target_languages: List[str] = config.translation.get_target_languages()
+        self.sessions: Dict[str, CaptionSession] = {}
+        self.is_running = False
+
+        # Shared translation cache, keyed by (source text, target language)
+        self.translation_cache = LRUCache(config.translation.translation_cache_size)
+        self.cache_hits = 0
+        self._lock = threading.Lock()
+
+    def add_session(self, name: str, source: Callable[[], str],
+                    split_marker: Optional[str] = None) -> CaptionSession:
+        """
+        Add a caption session.
+
+        Args:
+            name: Unique session name
+            source: Returns the session's transcript so far
+            split_marker: Speaker marker, defaults to the capture configuration
+
+        Returns:
+            The new session
+        """
+        if name in self.sessions:
+            raise ValueError(f"Session '{name}' already exists")
+
+        capture_config = replace(
+            self.config.capture,
+            split_marker=split_marker or self.config.capture.split_marker
+        )
+        session = CaptionSession(name, TextCapture(capture_config, text_source=source, clock=self.clock))
+        session.capture.mark_all_previous_translated()
+        self.sessions[name] = session
+        self.logger.info(f"Added session '{name}'")
+        return session
+
+    def remove_session(self, name: str):
+        """Remove a caption session."""
+        self.sessions.pop(name, None)
+        self.logger.info(f"Removed session '{name}'")
+
+    def translate(self, text: str, seq: int) -> SequencedTranslation:
+        """Translate text to all target languages through the shared cache."""
+        translations: Dict[str, str] = {}
+        missing = []
+        with self._lock:
+            for target_lang in self.target_languages:
+                cached = self.translation_cache.get((text, target_lang))
+                if cached is not None:
+                    translations[target_lang] = cached
+                else:
+                    missing.append(target_lang)
+            if not missing:
+                self.cache_hits += 1
+
+        if missing:
+            result = self.translation_service.translate_sequenced(seq, text, missing)
+            with self._lock:
+                for target_lang, translation in result.translations.items():
+                    self.translation_cache[(text, target_lang)] = translation
+            translations.update(result.translations)
+
+        return SequencedTranslation(
+            seq=seq,
+            source_text=text,
+            translations={lang: translations[lang] for lang in self.target_languages if lang in translations}
+        )
+
+    def tick(self) -> List[Future]:
+        """
+        Poll every session once and queue translations for new text.
+
+        Returns:
+            Futures of the queued translations
+        """
+        futures = []
+        translate_always_after = self.config.translation.translate_always_after
+
+        for session in list(self.sessions.values()):
+            try:
+                text = session.capture.get_transcript_to_translate(translate_always_after)
+            except Exception as e:
+                self.logger.error(f"Capture failed in session '{session.name}': {e}")
+                continue
+            if not text:
+                continue
+
+            seq = session.capture.capture_seq
+            if session.capture.last_segment_complete:
+                future = self.scheduler.submit(
+                    self.translate, text, seq,
+                    priority=TranslationScheduler.PRIORITY_COMPLETE,
+                    session=session.name
+                )
+            else:
+                future = self.scheduler.submit(
+                    self.translate, text, seq,
+                    priority=TranslationScheduler.PRIORITY_INCOMPLETE,
+                    supersede_key="incomplete",
+                    session=session.name
+                )
+            future.add_done_callback(lambda f, session=session: self._handle_result(session, f))
+            futures.append(future)
+
+        return futures
+
+    def _handle_result(self, session: CaptionSession, future: Future):
+        if future.cancelled():
+            return
+        try:
+            update = future.result()
+        except Exception as e:
+            session.failed_segments += 1
+            self.logger.error(f"Translation failed in session '{session.name}': {e}")
+            return
+
+        if not update.translations:
+            session.failed_segments += 1
+            return
+
+        session.capture.mark_as_translated(update.source_text)
+
+        with self._lock:
+            # Results can finish out of order; keep only the newest per session
+            if update.seq < session.latest_seq:
+                session.stale_results_dropped += 1
+                return
+            session.latest_seq = update.seq
+            session.translated_segments += 1
+
+        for target_lang, translation in update.translations.items():
+            self.logger.info(f"[{session.name}] Translation ({target_lang}): {translation}")
+        if self.on_translation:
+            self.on_translation(session, update)
+
+    def run(self, stop_event: Optional[threading.Event] = None):
+        """Tick all sessions every rate_delay seconds until stopped."""
+        stop_event = stop_event or threading.Event()
+        self.is_running = True
+        self.logger.info(f"Running {len(self.sessions)} sessions")
+        try:
+            while self.is_running and not stop_event.is_set():
+                started = self.clock.time()
+                self.tick()
+                remaining = self.config.translation.rate_delay - (self.clock.time() - started)
+                if self.clock.virtual:
+                    self.clock.sleep(max(0.0, remaining))
+                else:
+                    stop_event.wait(max(0.0, remaining))
+        finally:
+            self.is_running = False
+
+    def stop(self):
+        """Stop ticking and shut down the shared scheduler."""
+        self.is_running = False
+        self.scheduler.shutdown(wait=False)
@@ -0,0 +1,84 @@
+"""Transcript sources other than the on-screen clipboard capture."""
+
+import codecs
+import logging
+import os
+import threading
+from typing import Optional, TextIO
+
+
+class FileTranscriptSource:
+    """
+    Reads a transcript file that keeps growing while the meeting runs.
+    
+    Only appended text is read on each call, and only the last max_chars
+    characters are kept; parsing only needs the latest speaker turns.
+    """
+    
+    def __init__(self, path: str, max_chars: int = 65536, encoding: str = "utf-8"):
+        self.path = path
+        self.max_chars = max_chars
+        self.encoding = encoding
+        self.logger = logging.getLogger(__name__)
+        self._offset = 0
+        self._text = ""
+        self._decoder = None
+    
+    def __call__(self) -> str:
+        try:
+            size = os.path.getsize(self.path)
+            if size < self._offset:
+                # File was truncated or replaced; start over
+                self._offset = 0
+                self._text = ""
+                self._decoder = None
+            if size > self._offset:
+                with open(self.path, "rb") as f:
+                    f.seek(self._offset)
+                    data = f.read()
+                self._offset += len(data)
+                if self._decoder is None:
+                    # Incremental so multi-byte characters split across reads decode correctly
+                    self._decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+                self._text = (self._text + self._decoder.decode(data))[-self.max_chars:]
+        except OSError as e:
+            self.logger.error(f"Failed to read transcript {self.path}: {e}")
+        return self._text
+
+
+class StreamTranscriptSource:
+    """
+    Accumulates a transcript from a text stream such as stdin or a socket.
+    
+    A background thread reads the stream so a slow producer never blocks
+    the capture tick.
+    """
+    
+    def __init__(self, stream: TextIO, max_chars: int = 65536):
+        self.stream = stream
+        self.max_chars = max_chars
+        self.logger = logging.getLogger(__name__)
+        self.closed = False
+        self._text = ""
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> "StreamTranscriptSource":
+        """Start reading the stream in the background."""
+        self._thread = threading.Thread(target=self._read, name="stream-source", daemon=True)
+        self._thread.start()
+        return self
+    
+    def _read(self):
+        try:
+            for line in self.stream:
+                with self._lock:
+                    self._text = (self._text + line)[-self.max_chars:]
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Transcript stream failed: {e}")
+        finally:
+            self.closed = True
+    
+    def __call__(self) -> str:
+        with self._lock:
+            return self._text
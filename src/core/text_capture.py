@@ -1,22 +1,85 @@
 """Text capture module for grabbing text from screen."""
 
-import pyautogui
-import pyperclip
-import time
 import logging
-from typing import Optional, Dict, Set
+from typing import Optional, Dict, Callable, Iterator, TextIO
 from ..config.settings import CaptureConfig
+from ..utils import tracing
+from ..utils.clock import Clock, SYSTEM_CLOCK
+from ..utils.lazy_import import LazyModule
+from ..utils.lru import LRUSet
+
+# Imported on first capture; pyautogui needs a display just to import
+pyautogui = LazyModule("pyautogui")
+pyperclip = LazyModule("pyperclip")
+
+CAPTION_STARTED_MESSAGE = "Close caption has started."
+
+
+def clean_segment(text: str) -> str:
+    """Strip whitespace and the caption status message from a segment."""
+    return text.replace(CAPTION_STARTED_MESSAGE, "").strip()
+
+
+def iter_transcript_segments(stream: TextIO, split_marker: str, chunk_size: int = 65536) -> Iterator[str]:
+    """
+    Split a transcript into speaker segments without reading it all at once.
+    
+    Args:
+        stream: Text stream of the transcript
+        split_marker: Speaker marker separating segments
+        chunk_size: Characters read at a time
+        
+    Yields:
+        Non-empty segments in transcript order; text before the first
+        marker is not a speaker segment and is skipped
+    """
+    buffer = ""
+    preamble = True
+    while True:
+        chunk = stream.read(chunk_size)
+        buffer += chunk
+        parts = buffer.split(split_marker)
+        # Until the end of the stream, the last part may still grow or end in a partial marker
+        buffer = parts.pop() if chunk else ""
+        if preamble and parts:
+            parts.pop(0)
+            preamble = False
+        for part in parts:
+            segment = clean_segment(part)
+            if segment:
+                yield segment
+        if not chunk:
+            return
 
 
 class TextCapture:
     """Handles text capture from screen using clipboard operations."""
     
-    def __init__(self, config: CaptureConfig):
+    def __init__(self, config: CaptureConfig, text_source: Optional[Callable[[], str]] = None,
+                 clock: Optional[Clock] = None, tracer: Optional["tracing.Tracer"] = None):
+        """
+        Args:
+            config: Capture configuration
+            text_source: Returns the transcript so far; when given it is used
+                instead of the clipboard, e.g. for file or stream sources
+            clock: Time source for delays and translation timing, defaults to
+                the system clock
+            tracer: Starts a trace, with the capture sequence number as its
+                ID, for every capture tick; kept only if the tick finds text
+        """
         self.config = config
+        self.text_source = text_source
+        self.clock = clock or SYSTEM_CLOCK
+        self.tracer = tracer
         self.logger = logging.getLogger(__name__)
-        self.already_translated: Set[str] = set()
+        # Bounded so hours-long meetings don't accumulate every line ever seen
+        self.already_translated = LRUSet(config.max_translated_lines)
         self.prev_translated_complete_line: str = ""
-        self.prev_translation_at: float = time.time()
+        self.prev_translation_at: float = self.clock.time()
+        self.incomplete_line: str = ""
+        self.incomplete_line_changed_at: float = self.clock.time()
+        self.capture_seq: int = 0
+        self.last_segment_complete: bool = False
     
     def grab_text(self) -> str:
         """
@@ -26,11 +89,14 @@ class TextCapture:
             Text from clipboard
         """
         try:
+            if self.text_source is not None:
+                return self.text_source()
+            
             pyautogui.click()
             pyautogui.hotkey('ctrl', 'a')
-            time.sleep(self.config.selection_delay)
+            self.clock.sleep(self.config.selection_delay)
             pyautogui.hotkey('ctrl', 'c')
-            time.sleep(self.config.clipboard_delay)
+            self.clock.sleep(self.config.clipboard_delay)
             
             return pyperclip.paste()
         except Exception as e:
@@ -48,7 +114,7 @@ class TextCapture:
         
         if all_past_text:
             self.prev_translated_complete_line = all_past_text[-1]
-        self.prev_translation_at = time.time()
+        self.prev_translation_at = self.clock.time()
         
         self.logger.info(f"Marked {len(all_past_text)} previous texts as translated")
     
@@ -62,15 +128,30 @@ class TextCapture:
         Returns:
             Text to translate or None if no new text
         """
-        copied_text = self.grab_text()
+        # Monotonic across the session so results can be ordered by capture tick
+        self.capture_seq += 1
+        trace = self.tracer.start(self.capture_seq) if self.tracer else None
+        with tracing.span("grab", trace):
+            copied_text = self.grab_text()
+        with tracing.span("parse", trace):
+            text = self._select_text(copied_text, translate_always_after)
+        if text and trace:
+            trace.commit()
+        return text
+    
+    def _select_text(self, copied_text: str, translate_always_after: float) -> Optional[str]:
+        """Pick the line to translate from the captured transcript."""
         split_pos = copied_text.rfind(self.config.split_marker)
         
         if split_pos < 0:
             return None
         
         # Extract the incomplete line after the split marker
-        new_incomplete_line = copied_text[split_pos + len(self.config.split_marker):] \
-            .replace("Close caption has started.", "").strip()
+        new_incomplete_line = clean_segment(copied_text[split_pos + len(self.config.split_marker):])
+        
+        if new_incomplete_line != self.incomplete_line:
+            self.incomplete_line = new_incomplete_line
+            self.incomplete_line_changed_at = self.clock.time()
         
         # Find the previous complete line
         prev_split_pos = copied_text.rfind(self.config.split_marker, 0, split_pos)
@@ -85,21 +166,41 @@ class TextCapture:
         prev_line_changed = new_prev_complete_line != self.prev_translated_complete_line
         prev_already_translated = new_prev_complete_line in self.already_translated
         incomplete_already_translated = new_incomplete_line in self.already_translated
-        time_to_translate_incomplete = (time.time() - self.prev_translation_at) > translate_always_after
+        time_to_translate_incomplete = (self.clock.time() - self.prev_translation_at) > translate_always_after
         
         # Decide what to translate
         if prev_line_changed and not prev_already_translated and new_prev_complete_line:
             self.prev_translated_complete_line = new_prev_complete_line
-            self.prev_translation_at = time.time()
+            self.prev_translation_at = self.clock.time()
+            self.last_segment_complete = True
             self.logger.debug(f"Translating complete line: {new_prev_complete_line[:50]}...")
             return new_prev_complete_line
         elif not incomplete_already_translated and time_to_translate_incomplete and new_incomplete_line:
-            self.prev_translation_at = time.time()
+            self.prev_translation_at = self.clock.time()
+            self.last_segment_complete = False
             self.logger.debug(f"Translating incomplete line: {new_incomplete_line[:50]}...")
             return new_incomplete_line
         else:
             return None
     
+    def get_stable_incomplete_line(self, debounce: float) -> Optional[str]:
+        """
+        Return the incomplete line once it has stopped changing.
+        
+        Args:
+            debounce: Time in seconds the line must have stayed unchanged
+            
+        Returns:
+            The incomplete line seen by the latest capture, or None if it is
+            empty, still changing or already translated
+        """
+        line = self.incomplete_line
+        if not line or line in self.already_translated:
+            return None
+        if self.clock.time() - self.incomplete_line_changed_at < debounce:
+            return None
+        return line
+    
     def mark_as_translated(self, text: str):
         """Mark text as already translated."""
         if text:
@@ -109,5 +210,7 @@ class TextCapture:
         """Reset the translation cache."""
         self.already_translated.clear()
         self.prev_translated_complete_line = ""
-        self.prev_translation_at = time.time()
+        self.prev_translation_at = self.clock.time()
+        self.incomplete_line = ""
+        self.incomplete_line_changed_at = self.clock.time()
         self.logger.info("Translation cache reset")
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""Searchable index over the translated segments of the running session."""
+
+import bisect
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import deque
+from dataclasses import dataclass, asdict, field
+from typing import Optional, Dict, List, Set
+from ..config.settings import SearchConfig
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+@dataclass
+class IndexedSegment:
+    """A translated segment as stored in the index."""
+    segment_id: int
+    timestamp: float
+    speaker: str
+    source_text: str
+    translations: Dict[str, str] = field(default_factory=dict)
+    seq: int = 0
+    session: str = ""
+
+    def tokens(self) -> Set[str]:
+        """Return the distinct tokens of the source text and all translations."""
+        tokens = set(tokenize(self.source_text))
+        for translation in self.translations.values():
+            tokens.update(tokenize(translation))
+        return tokens
+
+    def matches(self, prefixes: List[str]) -> bool:
+        """Check whether every prefix starts some token of the segment."""
+        tokens = self.tokens()
+        return all(any(token.startswith(prefix) for token in tokens) for prefix in prefixes)
+
+
+class TranscriptIndex:
+    """
+    Append-only segment store with an incremental inverted index.
+
+    add() only queues the segment, so the capture loop never pays for
+    indexing; a background thread (or the next search) tokenises queued
+    segments into the posting lists. Every query term is matched as a
+    prefix of the indexed words, and all terms must match.
+
+    At most max_segments are kept in memory. Beyond that the oldest
+    quarter is appended to a spill file and dropped from the index in one
+    go, keeping the cost per segment constant; searches scan the spill
+    file only when the in-memory segments don't fill the result limit.
+    """
+
+    def __init__(self, config: SearchConfig):
+        self.config = config
+        self.max_segments = max(4, config.max_segments)
+        self.logger = logging.getLogger(__name__)
+        self.segments: Dict[int, IndexedSegment] = {}
+        # Token -> ascending segment ids, plus the sorted vocabulary for prefix lookups
+        self.postings: Dict[str, List[int]] = {}
+        self.vocabulary: List[str] = []
+        self.next_id = 1
+        self.spilled_segments = 0
+        self.spill_path: Optional[str] = config.spill_path or None
+        self._owns_spill_file = False
+        self._pending: deque = deque()
+        self._index_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self.segments) + self.spilled_segments + len(self._pending)
+
+    def start(self):
+        """Start indexing queued segments in the background."""
+        self._thread = threading.Thread(target=self._run, name="transcript-index", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Stop the background indexer and delete a temporary spill file."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        if self._owns_spill_file and self.spill_path and os.path.exists(self.spill_path):
+            os.remove(self.spill_path)
+
+    def add(self, timestamp: float, speaker: str, source_text: str, translations: Dict[str, str],
+            seq: int = 0, session: str = ""):
+        """Queue a translated segment for indexing."""
+        with self._condition:
+            self._pending.append((timestamp, speaker, source_text, dict(translations), seq, session))
+            self._condition.notify()
+
+    def catch_up(self):
+        """Index all queued segments, spilling the oldest ones if over the limit."""
+        with self._index_lock:
+            while True:
+                with self._condition:
+                    if not self._pending:
+                        break
+                    timestamp, speaker, source_text, translations, seq, session = self._pending.popleft()
+                self._index(IndexedSegment(self.next_id, timestamp, speaker, source_text,
+                                           translations, seq, session))
+                self.next_id += 1
+            if len(self.segments) > self.max_segments:
+                self._spill(len(self.segments) - self.max_segments * 3 // 4)
+
+    def search(self, query: str, limit: int = 20, session: Optional[str] = None) -> List[IndexedSegment]:
+        """
+        Find segments containing words starting with every term of the query.
+
+        Args:
+            query: Search terms, each matched as a word prefix
+            limit: Maximum number of results
+            session: Only return segments of this session
+
+        Returns:
+            Matching segments, newest first
+        """
+        prefixes = tokenize(query)
+        if not prefixes or limit <= 0:
+            return []
+
+        self.catch_up()
+        with self._index_lock:
+            ids = self._lookup(prefixes[0])
+            for prefix in prefixes[1:]:
+                if not ids:
+                    break
+                ids &= self._lookup(prefix)
+            results = [self.segments[segment_id] for segment_id in sorted(ids, reverse=True)]
+            spill_path = self.spill_path if self.spilled_segments else None
+
+        if session is not None:
+            results = [segment for segment in results if segment.session == session]
+        if len(results) < limit and spill_path:
+            results.extend(self._search_spill(spill_path, prefixes, limit - len(results), session))
+        return results[:limit]
+
+    def _lookup(self, prefix: str) -> Set[int]:
+        ids: Set[int] = set()
+        position = bisect.bisect_left(self.vocabulary, prefix)
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(prefix):
+            ids.update(self.postings[self.vocabulary[position]])
+            position += 1
+        return ids
+
+    def _index(self, segment: IndexedSegment):
+        self.segments[segment.segment_id] = segment
+        for token in segment.tokens():
+            posting = self.postings.get(token)
+            if posting is None:
+                self.postings[token] = [segment.segment_id]
+                bisect.insort(self.vocabulary, token)
+            else:
+                posting.append(segment.segment_id)
+
+    def _spill(self, count: int):
+        oldest = list(self.segments)[:count]
+        if self.spill_path is None:
+            handle, self.spill_path = tempfile.mkstemp(prefix="transcript-index-", suffix=".jsonl")
+            os.close(handle)
+            self._owns_spill_file = True
+        try:
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for segment_id in oldest:
+                    f.write(json.dumps(asdict(self.segments[segment_id]), ensure_ascii=False) + "\n")
+        except OSError as e:
+            # Keep the segments searchable in memory rather than lose them
+            self.logger.error(f"Failed to spill transcript index: {e}")
+            return
+
+        cutoff = oldest[-1]
+        touched: Set[str] = set()
+        for segment_id in oldest:
+            touched.update(self.segments.pop(segment_id).tokens())
+        for token in touched:
+            posting = self.postings[token]
+            remaining = posting[bisect.bisect_right(posting, cutoff):]
+            if remaining:
+                self.postings[token] = remaining
+            else:
+                del self.postings[token]
+        self.vocabulary = sorted(self.postings)
+        self.spilled_segments += len(oldest)
+        self.logger.debug(f"Spilled {len(oldest)} segments to {self.spill_path}")
+
+    def _search_spill(self, path: str, prefixes: List[str], limit: int,
+                      session: Optional[str]) -> List[IndexedSegment]:
+        matches: deque = deque(maxlen=limit)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    segment = IndexedSegment(**json.loads(line))
+                    if (session is None or segment.session == session) and segment.matches(prefixes):
+                        matches.append(segment)
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.error(f"Failed to search spilled segments: {e}")
+        return list(reversed(matches))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and not self._pending:
+                    self._condition.wait()
+                closed = self._closed
+            self.catch_up()
+            if closed:
+                return
@@ -0,0 +1,154 @@
+"""Fuzzy translation memory for near-duplicate captions."""
+
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Set, FrozenSet
+from ..utils.text import normalize_text
+
+
+@dataclass
+class MemoryEntry:
+    """A translated source text and its character n-grams."""
+    source: str
+    grams: FrozenSet[str]
+    translations: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class MemoryMatch:
+    """A near-duplicate found in the translation memory."""
+    source: str
+    translation: str
+    similarity: float
+
+
+class TranslationMemory:
+    """
+    Bounded character n-gram index over previously translated captions.
+
+    Speech recognition revisions usually differ from an earlier caption by
+    a word or punctuation, so an exact cache lookup misses them. Entries are
+    indexed by their character n-grams and candidates are scored by Jaccard
+    similarity. The memory holds at most max_entries source texts and evicts
+    the least recently used one when full.
+    """
+
+    MAX_CANDIDATES = 10
+    normalize = staticmethod(normalize_text)
+
+    def __init__(self, max_entries: int = 5000, threshold: float = 0.8,
+                 ngram_size: int = 3, max_posting_size: int = 200):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ngram_size = ngram_size
+        # n-grams shared by more entries than this carry little signal and
+        # are skipped during lookup to keep it fast
+        self.max_posting_size = max_posting_size
+        self.entries: "OrderedDict[str, MemoryEntry]" = OrderedDict()
+        self.postings: Dict[str, Set[str]] = {}
+        # Work done by the latest lookup, which bounds its cost independently of the memory size
+        self.last_postings_scanned = 0
+        self.last_candidates_scored = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def ngrams(self, normalized: str) -> FrozenSet[str]:
+        """Return the padded character n-grams of normalized text."""
+        padded = f" {normalized} "
+        if len(padded) <= self.ngram_size:
+            return frozenset([padded])
+        return frozenset(padded[i:i + self.ngram_size] for i in range(len(padded) - self.ngram_size + 1))
+
+    def add(self, source: str, target_lang: str, translation: str):
+        """
+        Remember a translation.
+
+        Args:
+            source: Source text
+            target_lang: Target language code
+            translation: Translated text
+        """
+        key = self.normalize(source)
+        if not key:
+            return
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = MemoryEntry(source=source, grams=self.ngrams(key))
+                self.entries[key] = entry
+                for gram in entry.grams:
+                    self.postings.setdefault(gram, set()).add(key)
+                if len(self.entries) > self.max_entries:
+                    self._evict_oldest()
+            else:
+                self.entries.move_to_end(key)
+            entry.translations[target_lang] = translation
+
+    def lookup(self, text: str, target_lang: str) -> Optional[MemoryMatch]:
+        """
+        Find the most similar remembered translation above the threshold.
+
+        Args:
+            text: Source text to match
+            target_lang: Target language code
+
+        Returns:
+            The best match or None if nothing is similar enough
+        """
+        key = self.normalize(text)
+        if not key:
+            return None
+
+        grams = self.ngrams(key)
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and target_lang in entry.translations:
+                self.entries.move_to_end(key)
+                return MemoryMatch(entry.source, entry.translations[target_lang], 1.0)
+
+            overlaps: Counter = Counter()
+            self.last_postings_scanned = 0
+            self.last_candidates_scored = 0
+            for gram in grams:
+                posting = self.postings.get(gram)
+                if posting and len(posting) <= self.max_posting_size:
+                    overlaps.update(posting)
+                    self.last_postings_scanned += len(posting)
+
+            best: Optional[MemoryMatch] = None
+            best_key = None
+            for candidate_key, _ in overlaps.most_common(self.MAX_CANDIDATES):
+                candidate = self.entries[candidate_key]
+                if target_lang not in candidate.translations:
+                    continue
+                self.last_candidates_scored += 1
+                # Exact Jaccard similarity over the full n-gram sets
+                shared = len(grams & candidate.grams)
+                similarity = shared / (len(grams) + len(candidate.grams) - shared)
+                if similarity >= self.threshold and (best is None or similarity > best.similarity):
+                    best = MemoryMatch(candidate.source, candidate.translations[target_lang], similarity)
+                    best_key = candidate_key
+
+            if best_key is not None:
+                self.entries.move_to_end(best_key)
+            return best
+
+    def clear(self):
+        """Forget all entries."""
+        with self._lock:
+            self.entries.clear()
+            self.postings.clear()
+
+    def _evict_oldest(self):
+        key, entry = self.entries.popitem(last=False)
+        for gram in entry.grams:
+            posting = self.postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self.postings[gram]
@@ -1,37 +1,107 @@
 """Translation service module."""
 
-import requests
+import contextvars
 import json
 import logging
-from typing import Optional, Dict, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field, replace
+from typing import Optional, Dict, Any, List, Tuple, Callable, Protocol
 from ..config.settings import TranslationConfig
+from .chunking import split_chunks
+from .language_detection import LanguageDetector
+from .latency import LatencyTracker
+from .rate_limiter import TokenBucket
+from ..utils import tracing
+from ..utils.lazy_import import LazyModule
+from ..utils.lru import LRUCache
 
+requests = LazyModule("requests")
 
-class TranslationService:
-    """Service for handling text translation via LibreTranslate API."""
+
+@dataclass
+class SequencedTranslation:
+    """Translations of one captured segment, tagged with its capture sequence number."""
+    seq: int
+    source_text: str
+    translations: Dict[str, str] = field(default_factory=dict)
+    provisional: bool = False
+
+
+class TranslationBackend(Protocol):
+    """Engine that performs the actual translation of one text."""
+    
+    name: str
+    
+    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Translate text, returning None on failure."""
+        ...
+    
+    def is_available(self) -> bool:
+        """Check whether the engine can serve translations."""
+        ...
+    
+    def get_languages(self) -> Optional[List[Dict[str, Any]]]:
+        """List supported languages as LibreTranslate-style descriptions."""
+        ...
+
+
+class HttpTranslationBackend:
+    """
+    Backend that calls a LibreTranslate server over HTTP/JSON.
+    
+    Request timeouts follow the server's recent p99 latency for texts of
+    similar length, capped at the configured request_timeout
+    (PROBE_TIMEOUT for availability probes).
+    """
     
-    def __init__(self, config: TranslationConfig):
+    name = "http"
+    PROBE_TIMEOUT = 5.0
+    
+    def __init__(self, config: TranslationConfig, pool_size: int = 8):
         self.config = config
+        self.pool_size = pool_size
         self.logger = logging.getLogger(__name__)
+        self._session = None
+        self._session_lock = threading.Lock()
+        self.rate_limiter: Optional[TokenBucket] = None
+        if config.max_requests_per_second > 0:
+            self.rate_limiter = TokenBucket(config.max_requests_per_second, config.request_burst)
+        self.latency = LatencyTracker()
     
-    def translate(self, text: str, source_lang: Optional[str] = None, target_lang: Optional[str] = None) -> Optional[str]:
-        """
-        Translate text using LibreTranslate API.
-        
-        Args:
-            text: Text to translate
-            source_lang: Source language code (defaults to config)
-            target_lang: Target language code (defaults to config)
-            
-        Returns:
-            Translated text or None if translation failed
-        """
-        if not text.strip():
-            return None
-        
-        source_lang = source_lang or self.config.source_language
-        target_lang = target_lang or self.config.target_language
-        
+    def request_timeout(self, default: float, size: Optional[int] = None) -> float:
+        """Timeout for the next request, derived from the latencies of requests of similar size."""
+        return self.latency.timeout(
+            default,
+            multiplier=self.config.timeout_p99_multiplier,
+            floor=self.config.min_request_timeout,
+            size=size
+        )
+    
+    @property
+    def session(self):
+        """HTTP session whose connection pool is shared by all requests."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(
+                        pool_connections=self.pool_size,
+                        pool_maxsize=self.pool_size
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+    
+    @property
+    def languages_url(self) -> str:
+        """URL of the LibreTranslate language listing endpoint."""
+        return self.config.libretranslate_url.replace("/translate", "/languages")
+    
+    def translate(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Translate text with a LibreTranslate request."""
         data = {
             "q": text,
             "source": source_lang,
@@ -40,13 +110,20 @@ class TranslationService:
             "api_key": self.config.api_key
         }
         
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        
+        timeout = self.request_timeout(self.config.request_timeout, len(text))
+        started = time.monotonic()
         try:
-            response = requests.post(
-                self.config.libretranslate_url,
-                json=data,
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
+            with tracing.span("http", url=self.config.libretranslate_url, target=target_lang, timeout=timeout):
+                response = self.session.post(
+                    self.config.libretranslate_url,
+                    json=data,
+                    headers={"Content-Type": "application/json"},
+                    timeout=timeout
+                )
+            self.latency.record(time.monotonic() - started, len(text))
             
             if response.status_code == 200:
                 payload = response.json()
@@ -56,6 +133,11 @@ class TranslationService:
                 self.logger.error(f"Translation failed with status {response.status_code}: {response.text}")
                 return None
                 
+        except requests.exceptions.Timeout as e:
+            # Counted at the timeout so a slowing server raises the estimate
+            self.latency.record(timeout, len(text))
+            self.logger.error(f"Translation request timed out after {timeout:.1f}s: {e}")
+            return None
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Translation request failed: {e}")
             return None
@@ -63,13 +145,338 @@ class TranslationService:
             self.logger.error(f"Failed to parse translation response: {e}")
             return None
     
-    def is_service_available(self) -> bool:
-        """Check if LibreTranslate service is available."""
+    def is_available(self) -> bool:
+        """Check if the LibreTranslate server responds."""
         try:
-            response = requests.get(
-                self.config.libretranslate_url.replace("/translate", "/languages"),
-                timeout=5
+            response = self.session.get(
+                self.languages_url,
+                timeout=self.request_timeout(self.PROBE_TIMEOUT)
             )
             return response.status_code == 200
         except requests.exceptions.RequestException:
-            return False
\ No newline at end of file
+            return False
+    
+    def get_languages(self) -> Optional[List[Dict[str, Any]]]:
+        """Fetch the languages supported by the LibreTranslate server."""
+        try:
+            response = self.session.get(self.languages_url, timeout=self.request_timeout(self.PROBE_TIMEOUT))
+            if response.status_code == 200:
+                return response.json()
+            self.logger.error(f"Language listing failed with status {response.status_code}")
+            return None
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Language listing request failed: {e}")
+            return None
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse language listing: {e}")
+            return None
+
+
+def create_backend(config: TranslationConfig, pool_size: Optional[int] = None) -> TranslationBackend:
+    """
+    Create the translation backend selected by config.backend.
+    
+    Args:
+        config: Translation configuration
+        pool_size: HTTP connections per server, defaults to MAX_PARALLEL_REQUESTS
+    
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if config.backend == "http":
+        pool_size = pool_size or TranslationService.MAX_PARALLEL_REQUESTS
+        backend = HttpTranslationBackend(config, pool_size)
+        if config.hedge_url:
+            from .backends import HedgedTranslationBackend
+            hedge = HttpTranslationBackend(replace(config, libretranslate_url=config.hedge_url), pool_size)
+            return HedgedTranslationBackend(backend, hedge)
+        return backend
+    
+    if config.backend in ("argos", "stub") and config.worker_processes > 0:
+        from .process_pool import ProcessPoolTranslationBackend
+        return ProcessPoolTranslationBackend(config.backend, config.worker_processes)
+    
+    from .backends import ArgosTranslationBackend, StubTranslationBackend
+    if config.backend == "argos":
+        return ArgosTranslationBackend()
+    if config.backend == "stub":
+        return StubTranslationBackend()
+    raise ValueError(f"Unknown translation backend: {config.backend}")
+
+
+class LanguageRoutingMixin:
+    """
+    Language routing shared by the synchronous and async translation services.
+    
+    Lines spoken in another language are passed through when already in
+    the target language, or translated from the language they are in.
+    Needs self.logger; call _setup_routing from __init__.
+    """
+    
+    def _setup_routing(self, config: TranslationConfig):
+        self.language_detector: Optional[LanguageDetector] = None
+        if config.detect_language:
+            self.language_detector = LanguageDetector()
+        self.passed_through = 0
+        self.rerouted = 0
+    
+    def route(self, text: str, source_lang: str, target_lang: str) -> str:
+        """
+        Pick the source language to translate text from.
+        
+        Args:
+            text: Text to translate
+            source_lang: Configured source language
+            target_lang: Target language
+            
+        Returns:
+            The detected language when language detection is enabled and
+            confident, otherwise source_lang. Equal to target_lang when the
+            text needs no translation.
+        """
+        if self.language_detector is None:
+            return source_lang
+        
+        detected = self.language_detector.detect(text, expected=source_lang)
+        if detected is None or detected.language == source_lang:
+            return source_lang
+        
+        if detected.language == target_lang:
+            self.passed_through += 1
+            self.logger.debug(f"Text already in {target_lang}, passing it through")
+        else:
+            self.rerouted += 1
+            self.logger.debug(f"Detected {detected.language} instead of {source_lang}")
+        return detected.language
+
+
+class TranslationService(LanguageRoutingMixin):
+    """Service for handling text translation via a pluggable backend (LibreTranslate by default)."""
+    
+    MAX_PARALLEL_REQUESTS = 8
+    WARM_UP_TEXT = "Hello"
+    
+    def __init__(self, config: TranslationConfig, backend: Optional[TranslationBackend] = None):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self.backend = backend or create_backend(config)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Chunks of long texts run on their own threads, since translate()
+        # itself may already be running on one of the executor's
+        self._chunk_executor: Optional[ThreadPoolExecutor] = None
+        self.chunk_cache = LRUCache(config.translation_cache_size)
+        self._chunk_lock = threading.Lock()
+        
+        self._setup_routing(config)
+    
+    def translate(self, text: str, source_lang: Optional[str] = None, target_lang: Optional[str] = None) -> Optional[str]:
+        """
+        Translate text using the configured backend.
+        
+        Args:
+            text: Text to translate
+            source_lang: Source language code (defaults to config)
+            target_lang: Target language code (defaults to config)
+            
+        Returns:
+            Translated text or None if translation failed
+        """
+        if not text.strip():
+            return None
+        
+        source_lang = source_lang or self.config.source_language
+        target_lang = target_lang or self.config.target_language
+        
+        detected_lang = self.route(text, source_lang, target_lang)
+        if detected_lang == target_lang:
+            return text
+        
+        if 0 < self.config.max_chunk_chars < len(text):
+            return self.translate_chunked(text, detected_lang, source_lang, target_lang)
+        return self._translate_routed(text, detected_lang, source_lang, target_lang)
+    
+    def translate_chunked(self, text: str, detected_lang: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """
+        Translate a long text as chunks of at most max_chunk_chars.
+        
+        The chunks are translated in parallel and joined in order. Each
+        chunk's translation is cached, so when a long line grows only its
+        new chunks are sent, and a retry after a failure only resends the
+        chunks that failed.
+        
+        Args:
+            text: Text to translate
+            detected_lang: Language the text is translated from
+            source_lang: Configured source language, the fallback of detected_lang
+            target_lang: Target language code
+            
+        Returns:
+            Translated text or None if any chunk failed
+        """
+        separators, chunks = zip(*split_chunks(text, self.config.max_chunk_chars))
+        translations: List[Optional[str]] = [
+            self.chunk_cache.get((chunk, detected_lang, target_lang)) for chunk in chunks
+        ]
+        missing = [index for index, translation in enumerate(translations) if translation is None]
+        self.logger.debug(f"Translating {len(chunks)} chunks of {len(text)} characters, {len(missing)} not cached")
+        
+        with tracing.span("chunks", chunks=len(chunks), missing=len(missing)):
+            if len(missing) == 1:
+                index = missing[0]
+                translations[index] = self._translate_routed(chunks[index], detected_lang, source_lang, target_lang)
+            elif missing:
+                executor = self._get_chunk_executor()
+                futures = {
+                    index: executor.submit(contextvars.copy_context().run, self._translate_routed,
+                                           chunks[index], detected_lang, source_lang, target_lang)
+                    for index in missing
+                }
+                for index, future in futures.items():
+                    try:
+                        translations[index] = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Translation of chunk {index + 1}/{len(chunks)} failed: {e}")
+        
+        for index in missing:
+            if translations[index] is not None:
+                self.chunk_cache[(chunks[index], detected_lang, target_lang)] = translations[index]
+        if any(translation is None for translation in translations):
+            return None
+        return "".join(separator + translation for separator, translation in zip(separators, translations))
+    
+    def _translate_routed(self, text: str, detected_lang: str, source_lang: str, target_lang: str) -> Optional[str]:
+        translation = self.backend.translate(text, detected_lang, target_lang)
+        if translation is None and detected_lang != source_lang:
+            # The server may not have the detected pair; fall back to the configured one
+            translation = self.backend.translate(text, source_lang, target_lang)
+        return translation
+    
+    def _get_chunk_executor(self) -> ThreadPoolExecutor:
+        with self._chunk_lock:
+            if self._chunk_executor is None:
+                self._chunk_executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_PARALLEL_REQUESTS,
+                    thread_name_prefix="translation-chunk"
+                )
+            return self._chunk_executor
+    
+    def submit(self, text: str, source_lang: Optional[str] = None, target_lang: Optional[str] = None) -> Future:
+        """
+        Start a translation and return a future for its result.
+        
+        Backends with their own executor (such as the process pool) are
+        used directly unless the text must be chunked; otherwise the call
+        runs on a thread.
+        """
+        chunked = 0 < self.config.max_chunk_chars < len(text)
+        if text.strip() and hasattr(self.backend, "submit") and not chunked:
+            target_lang = target_lang or self.config.target_language
+            detected_lang = self.route(text, source_lang or self.config.source_language, target_lang)
+            if detected_lang == target_lang:
+                future: Future = Future()
+                future.set_result(text)
+                return future
+            return self.backend.submit(text, detected_lang, target_lang)
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_PARALLEL_REQUESTS,
+                thread_name_prefix="translation"
+            )
+        # Carry the caller's context (such as its trace) into the worker thread
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, self.translate, text, source_lang, target_lang)
+    
+    def translate_to_targets(self, text: str, target_langs: List[str],
+                             source_lang: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        Translate text to several target languages with parallel requests.
+        
+        Args:
+            text: Text to translate
+            target_langs: Target language codes
+            source_lang: Source language code (defaults to config)
+            
+        Returns:
+            Mapping of target language to translated text (None on failure)
+        """
+        if len(target_langs) <= 1:
+            return {lang: self.translate(text, source_lang, lang) for lang in target_langs}
+        
+        futures = {lang: self.submit(text, source_lang, lang) for lang in target_langs}
+        results = {}
+        for lang, future in futures.items():
+            try:
+                results[lang] = future.result()
+            except Exception as e:
+                self.logger.error(f"Translation to {lang} failed: {e}")
+                results[lang] = None
+        return results
+    
+    def translate_sequenced(self, seq: int, text: str, target_langs: List[str],
+                            source_lang: Optional[str] = None) -> SequencedTranslation:
+        """
+        Translate a captured segment, carrying its sequence number with the result.
+        
+        Responses can arrive out of order when segments are translated
+        concurrently; the sequence number lets the caller drop stale ones.
+        
+        Args:
+            seq: Capture sequence number of the segment
+            text: Text to translate
+            target_langs: Target language codes
+            source_lang: Source language code (defaults to config)
+            
+        Returns:
+            Result holding the languages that were translated successfully
+        """
+        results = self.translate_to_targets(text, target_langs, source_lang)
+        return SequencedTranslation(
+            seq=seq,
+            source_text=text,
+            translations={lang: translation for lang, translation in results.items() if translation}
+        )
+    
+    def is_service_available(self) -> bool:
+        """Check if the translation backend is available."""
+        return self.backend.is_available()
+    
+    def get_languages(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the languages supported by the translation backend.
+        
+        Returns:
+            List of language descriptions or None if the request failed
+        """
+        return self.backend.get_languages()
+    
+    def warm_up(self, language_pairs: List[Tuple[str, str]],
+                progress: Optional[Callable[[str], None]] = None) -> bool:
+        """
+        Warm up the backend so the first real caption is served at steady-state latency.
+        
+        Opens pooled connections, fetches the language list and sends a
+        short translation for each language pair so the server loads the
+        models it would otherwise load lazily on the first caption.
+        
+        Args:
+            language_pairs: (source, target) language code pairs to warm up
+            progress: Called with a short status message after each step
+            
+        Returns:
+            True if every step succeeded
+        """
+        report = progress or (lambda message: None)
+        
+        report("connecting")
+        ok = self.get_languages() is not None
+        
+        for index, (source_lang, target_lang) in enumerate(language_pairs, start=1):
+            report(f"warming up {source_lang}->{target_lang} ({index}/{len(language_pairs)})")
+            if self.translate(self.WARM_UP_TEXT, source_lang, target_lang) is None:
+                ok = False
+        
+        report("ready" if ok else "warm-up incomplete")
+        self.logger.info(f"Backend warm-up {'finished' if ok else 'incomplete'}")
+        return ok
\ No newline at end of file
@@ -0,0 +1,325 @@
+"""
+Multi-client load generator for LibreTranslate capacity planning.
+
+Every simulated client behaves like one running translator: it polls a
+growing caption transcript through TextCapture every rate_delay seconds,
+retranslates the incomplete line after translate_always_after, keeps its
+own translation cache and sends its misses to the server over its own
+connection. Captions are synthetic speech or recorded transcripts
+replayed word by word.
+
+The client count is stepped up (1, 2, 4, ... by default) and each step
+reports throughput, latency percentiles and the error rate, so the point
+where the server saturates shows up in the table.
+
+Run with ``python -m src.tools.loadgen --url http://host:5000/translate``,
+or with ``--stub`` against a local stand-in server.
+"""
+
+import argparse
+import itertools
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Optional, List, Callable
+
+from ..config.settings import CaptureConfig, TranslationConfig
+from ..core.latency import LatencyTracker
+from ..core.text_capture import TextCapture, CAPTION_STARTED_MESSAGE, iter_transcript_segments
+from ..core.translator import HttpTranslationBackend
+from ..utils.lru import LRUCache
+from .soak import SimulatedMeeting, SPEAKER
+from .stub_server import StubLibreTranslateServer
+
+
+class RecordedMeeting:
+    """
+    Replays a saved transcript as if it were being spoken.
+
+    The transcript's segments are revealed a word at a time under the
+    split marker, starting over from the first segment when they run out.
+    """
+
+    def __init__(self, segments: List[str], split_marker: str = SPEAKER,
+                 words_per_second: float = 2.5, offset: int = 0):
+        if not segments:
+            raise ValueError("Recorded transcript has no segments")
+        self.split_marker = split_marker
+        self.words_per_second = words_per_second
+        self.text = f"{CAPTION_STARTED_MESSAGE}\n{split_marker}\n"
+        self.lines = 0
+        self._segments = itertools.cycle(segments[offset % len(segments):] + segments[:offset % len(segments)])
+        self._words: List[str] = []
+        self._line_started = False
+        self._word_debt = 0.0
+
+    def transcript(self) -> str:
+        """Return the caption pane's contents so far."""
+        return self.text
+
+    def advance(self, seconds: float):
+        """Speak for the given number of seconds."""
+        self._word_debt += seconds * self.words_per_second
+        while self._word_debt >= 1:
+            self._word_debt -= 1
+            if not self._words:
+                self._words = next(self._segments).split()
+                self._line_started = False
+            word = self._words.pop(0)
+            self.text += f" {word}" if self._line_started else word
+            self._line_started = True
+            if not self._words:
+                self.text += f"\n{self.split_marker}\n"
+                self.lines += 1
+
+
+@dataclass
+class LoadStep:
+    """Measurements for one client count."""
+    clients: int
+    duration: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    latency: LatencyTracker = field(default_factory=lambda: LatencyTracker(window=1_000_000, min_samples=1))
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, seconds: float, ok: bool):
+        """Count one request and its latency."""
+        with self._lock:
+            self.requests += 1
+            if not ok:
+                self.errors += 1
+        self.latency.record(seconds)
+
+    def record_cache_hit(self):
+        """Count a translation answered from the client's cache."""
+        with self._lock:
+            self.cache_hits += 1
+
+    @property
+    def throughput(self) -> float:
+        """Requests per second."""
+        return self.requests / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of requests that failed."""
+        return self.errors / self.requests if self.requests else 0.0
+
+    def latency_ms(self, percent: float) -> Optional[float]:
+        """Latency percentile in milliseconds, None before any request."""
+        value = self.latency.percentile(percent)
+        return value * 1000 if value is not None else None
+
+
+def format_report(steps: List[LoadStep]) -> str:
+    """Format load steps as a table."""
+    lines = [f"{'clients':>7} {'requests':>8} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} "
+             f"{'p99 ms':>8} {'errors':>7} {'cached':>7}"]
+    for step in steps:
+        percentiles = [step.latency_ms(p) for p in (50, 95, 99)]
+        latency = " ".join(f"{value:>8.1f}" if value is not None else f"{'n/a':>8}" for value in percentiles)
+        lines.append(
+            f"{step.clients:>7} {step.requests:>8} {step.throughput:>7.1f} {latency} "
+            f"{step.error_rate:>6.1%} {step.cache_hits:>7}"
+        )
+    return "\n".join(lines)
+
+
+class LoadClient:
+    """One simulated translator instance."""
+
+    def __init__(self, config: TranslationConfig, meeting, split_marker: str, step: LoadStep):
+        self.config = config
+        self.meeting = meeting
+        self.step = step
+        self.target_languages = config.get_target_languages()
+        # One connection per client, like a separate translator process
+        self.backend = HttpTranslationBackend(config, pool_size=1)
+        # The client's own throttling is applied outside the timed request,
+        # so the latencies measure the server alone
+        self.rate_limiter = self.backend.rate_limiter
+        self.backend.rate_limiter = None
+        self.capture = TextCapture(CaptureConfig(split_marker=split_marker), text_source=meeting.transcript)
+        self.cache = LRUCache(config.translation_cache_size)
+
+    def run(self, stop: threading.Event):
+        """Tick every rate_delay seconds until stopped."""
+        self.capture.mark_all_previous_translated()
+        last = time.monotonic()
+        while not stop.is_set():
+            now = time.monotonic()
+            self.meeting.advance(now - last)
+            last = now
+            self.tick()
+            stop.wait(max(0.0, self.config.rate_delay - (time.monotonic() - now)))
+
+    def tick(self):
+        """Capture once and translate new text as grab_and_translate does."""
+        text = self.capture.get_transcript_to_translate(self.config.translate_always_after)
+        if not text:
+            return
+
+        translated = True
+        for target_lang in self.target_languages:
+            if (text, target_lang) in self.cache:
+                self.step.record_cache_hit()
+                continue
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            started = time.monotonic()
+            translation = self.backend.translate(text, self.config.source_language, target_lang)
+            self.step.record(time.monotonic() - started, translation is not None)
+            if translation is None:
+                translated = False
+            else:
+                self.cache[(text, target_lang)] = translation
+        if translated:
+            self.capture.mark_as_translated(text)
+
+
+def run_step(config: TranslationConfig, clients: int, duration: float,
+             meeting_factory: Callable[[int], object], split_marker: str = SPEAKER) -> LoadStep:
+    """
+    Run the given number of clients for duration seconds.
+
+    Args:
+        config: Translation configuration of every client
+        clients: Number of concurrent clients
+        duration: Seconds to run
+        meeting_factory: Returns the caption stream of the client with the given index
+        split_marker: Speaker marker used by the caption streams
+
+    Returns:
+        Measurements of the step
+    
+    Raises:
+        ValueError: If clients is less than 1
+    """
+    if clients < 1:
+        raise ValueError(f"Client count must be at least 1, got {clients}")
+    step = LoadStep(clients)
+    stop = threading.Event()
+    load_clients = [LoadClient(config, meeting_factory(index), split_marker, step) for index in range(clients)]
+    threads = [
+        threading.Thread(target=client.run, args=(stop,), name=f"loadgen-client-{index}", daemon=True)
+        for index, client in enumerate(load_clients)
+    ]
+
+    started = time.monotonic()
+    for index, thread in enumerate(threads):
+        thread.start()
+        # Spread the clients' ticks over one rate_delay
+        stop.wait(config.rate_delay / clients)
+    stop.wait(max(0.0, duration - (time.monotonic() - started)))
+    stop.set()
+    for thread in threads:
+        thread.join()
+    step.duration = time.monotonic() - started
+    return step
+
+
+def run_load(config: TranslationConfig, client_counts: List[int], duration: float,
+             meeting_factory: Callable[[int], object], split_marker: str = SPEAKER,
+             progress: Optional[Callable[[LoadStep], None]] = None) -> List[LoadStep]:
+    """Run one step per client count, in order."""
+    steps = []
+    for clients in client_counts:
+        step = run_step(config, clients, duration, meeting_factory, split_marker)
+        steps.append(step)
+        if progress:
+            progress(step)
+    return steps
+
+
+def main(argv=None) -> int:
+    """Run the load generator from the command line."""
+    parser = argparse.ArgumentParser(description="Measure how many translator clients a LibreTranslate server handles")
+    parser.add_argument("--url", default="http://localhost:5000/translate", help="LibreTranslate translate URL")
+    parser.add_argument("--stub", action="store_true", help="Start a local stand-in server and load it instead")
+    parser.add_argument("--stub-workers", type=int, default=4, help="Concurrent requests of the stand-in server")
+    parser.add_argument("--stub-latency", type=float, default=0.02, help="Service time of the stand-in server")
+    parser.add_argument("--clients", default="1,2,4,8,16", help="Comma-separated client counts to step through")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per client count")
+    parser.add_argument("--source-lang", default="fi", help="Source language code")
+    parser.add_argument("--target-lang", default="en", help="Target language codes, comma-separated")
+    parser.add_argument("--api-key", default="", help="LibreTranslate API key")
+    parser.add_argument("--rate-delay", type=float, default=1.0, help="Seconds between capture ticks")
+    parser.add_argument("--translate-always-after", type=float, default=5.0,
+                        help="Seconds after which the incomplete line is retranslated")
+    parser.add_argument("--words-per-second", type=float, default=2.5, help="Speed of the simulated speech")
+    parser.add_argument("--transcript", action="append", default=[],
+                        help="Recorded transcript to replay; repeat to give clients different ones")
+    parser.add_argument("--split-marker", default=SPEAKER, help="Speaker marker used in the transcripts")
+    args = parser.parse_args(argv)
+
+    try:
+        client_counts = [int(count) for count in args.clients.split(",") if count.strip()]
+    except ValueError:
+        print(f"Invalid client counts: {args.clients}", file=sys.stderr)
+        return 2
+    if not client_counts or min(client_counts) < 1:
+        print(f"Client counts must be positive: {args.clients}", file=sys.stderr)
+        return 2
+    target_languages = [lang.strip() for lang in args.target_lang.split(",") if lang.strip()]
+    if not target_languages:
+        print("At least one target language is required", file=sys.stderr)
+        return 2
+
+    segments: List[List[str]] = []
+    try:
+        for path in args.transcript:
+            with open(path, "r", encoding="utf-8") as f:
+                segments.append(list(iter_transcript_segments(f, args.split_marker)))
+    except OSError as e:
+        print(f"Cannot read transcript: {e}", file=sys.stderr)
+        return 1
+    if not all(segments):
+        print(f"No '{args.split_marker}' segments in the transcripts", file=sys.stderr)
+        return 1
+
+    def meeting_factory(index: int):
+        if segments:
+            return RecordedMeeting(segments[index % len(segments)], args.split_marker,
+                                   args.words_per_second, offset=index)
+        return SimulatedMeeting(seed=index, words_per_second=args.words_per_second)
+
+    # Failed requests are counted in the report rather than logged one by one
+    logging.basicConfig(level=logging.CRITICAL)
+
+    stub = None
+    url = args.url
+    if args.stub:
+        stub = StubLibreTranslateServer(workers=args.stub_workers, latency=args.stub_latency).start()
+        url = stub.url
+
+    config = replace(
+        TranslationConfig(),
+        libretranslate_url=url,
+        api_key=args.api_key,
+        source_language=args.source_lang,
+        target_language=target_languages[0],
+        additional_target_languages=target_languages[1:],
+        rate_delay=args.rate_delay,
+        translate_always_after=args.translate_always_after
+    )
+    split_marker = args.split_marker if segments else SPEAKER
+
+    print(f"Loading {url} for {args.duration:.0f}s per step", file=sys.stderr)
+    try:
+        steps = run_load(config, client_counts, args.duration, meeting_factory, split_marker,
+                         progress=lambda step: print(f"{step.clients} clients done", file=sys.stderr))
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if stub:
+            stub.stop()
+    print(format_report(steps))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
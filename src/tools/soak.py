@@ -0,0 +1,287 @@
+"""
+Long-session soak test.
+
+Simulates a meeting lasting several hours on an accelerated clock: a
+transcript that keeps growing is polled through TextCapture and
+translated with the stub backend by the multi-session pipeline. RSS,
+the size of the capture's already_translated set, the translation cache
+size and per-tick latency are sampled along the way, and the run fails
+if any of them keeps growing.
+
+Run with ``python -m src.tools.soak --hours 8``.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import wait
+from dataclasses import dataclass, field
+from typing import Optional, List
+
+from ..config.settings import AppConfig
+from ..core.backends import StubTranslationBackend
+from ..core.scheduler import TranslationScheduler
+from ..core.sessions import SessionManager
+from ..core.translator import TranslationService
+from ..utils.clock import VirtualClock
+
+
+SPEAKER = "Soak Speaker"
+
+WORDS = [
+    "hyvä", "huomenta", "kaikille", "aloitetaan", "palaveri", "projekti", "aikataulu",
+    "budjetti", "asiakas", "toimitus", "testaus", "julkaisu", "viikko", "seuraava",
+    "tehtävä", "vastuu", "riski", "päätös", "kysymys", "vastaus", "esitys", "raportti",
+    "tulos", "tavoite", "sprintti", "tiimi", "kokous", "tänään", "huomenna", "valmis",
+    "kesken", "ongelma", "ratkaisu", "ehdotus", "muutos", "versio", "palvelin", "käyttäjä",
+]
+
+
+class SimulatedMeeting:
+    """
+    Caption pane of a long meeting.
+
+    Speech arrives a few words per second; each line ends after a random
+    number of words and the next one starts under a new speaker marker. A
+    few stock phrases recur so the cache sees repeated lines too.
+    """
+
+    STOCK_PHRASES = ["kiitos", "joo selvä", "kuuluuko ääni", "jatketaan"]
+
+    def __init__(self, seed: int = 0, words_per_second: float = 2.5):
+        self.random = random.Random(seed)
+        self.words_per_second = words_per_second
+        self.text = f"Close caption has started.\n{SPEAKER}\n"
+        self.lines = 0
+        self._line_words: List[str] = []
+        self._line_length = self._next_line_length()
+        self._word_debt = 0.0
+
+    def transcript(self) -> str:
+        """Return the caption pane's contents so far."""
+        return self.text
+
+    def advance(self, seconds: float):
+        """Speak for the given number of seconds."""
+        self._word_debt += seconds * self.words_per_second
+        while self._word_debt >= 1:
+            self._word_debt -= 1
+            self._speak_word()
+
+    def _speak_word(self):
+        if not self._line_words and self.random.random() < 0.1:
+            phrase = self.random.choice(self.STOCK_PHRASES)
+            self.text += f"{phrase}\n{SPEAKER}\n"
+            self.lines += 1
+            return
+
+        word = self.random.choice(WORDS)
+        self.text += word if not self._line_words else f" {word}"
+        self._line_words.append(word)
+        if len(self._line_words) >= self._line_length:
+            self.text += f".\n{SPEAKER}\n"
+            self.lines += 1
+            self._line_words = []
+            self._line_length = self._next_line_length()
+
+    def _next_line_length(self) -> int:
+        return self.random.randint(4, 24)
+
+
+@dataclass
+class SoakSample:
+    """Measurements taken at one point of the simulated meeting."""
+    elapsed_hours: float
+    rss_kb: Optional[int]
+    already_translated: int
+    cache_entries: int
+    tick_latency_ms: float
+    ticks: int
+
+
+@dataclass
+class SoakReport:
+    """Outcome of a soak run."""
+    samples: List[SoakSample] = field(default_factory=list)
+    failures: List[str] = field(default_factory=list)
+    lines_spoken: int = 0
+    segments_translated: int = 0
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+    def format(self) -> str:
+        """Format the samples as a table followed by the verdict."""
+        lines = [f"{'hours':>6} {'rss MB':>8} {'translated':>10} {'cache':>7} {'tick ms':>8}"]
+        for s in self.samples:
+            rss = f"{s.rss_kb / 1024:.1f}" if s.rss_kb is not None else "n/a"
+            lines.append(
+                f"{s.elapsed_hours:>6.2f} {rss:>8} {s.already_translated:>10} "
+                f"{s.cache_entries:>7} {s.tick_latency_ms:>8.3f}"
+            )
+        lines.append(f"{self.lines_spoken} lines spoken, {self.segments_translated} segments translated")
+        if self.passed:
+            lines.append("PASS")
+        else:
+            lines.extend(f"FAIL: {failure}" for failure in self.failures)
+        return "\n".join(lines)
+
+
+def current_rss_kb() -> Optional[int]:
+    """Return the resident set size of this process in KiB, if it can be read."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak rather than current RSS, but still shows sustained growth
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def analyze(samples: List[SoakSample], max_translated_lines: int, max_cache_entries: int,
+            max_rss_growth_mb: float = 50.0, max_latency_growth: float = 2.0,
+            latency_tolerance_ms: float = 0.5) -> List[str]:
+    """
+    Check soak samples for unbounded growth.
+
+    Args:
+        samples: Samples in time order
+        max_translated_lines: Bound on the already_translated set
+        max_cache_entries: Bound on the translation cache
+        max_rss_growth_mb: Allowed RSS growth over the second half of the run
+        max_latency_growth: Allowed ratio of late to early tick latency
+        latency_tolerance_ms: Latency increases smaller than this are noise
+
+    Returns:
+        Descriptions of the checks that failed
+    """
+    failures = []
+    if len(samples) < 4:
+        return ["too few samples to judge growth"]
+
+    peak_translated = max(s.already_translated for s in samples)
+    if peak_translated > max_translated_lines:
+        failures.append(f"already_translated grew to {peak_translated} (bound {max_translated_lines})")
+
+    peak_cache = max(s.cache_entries for s in samples)
+    if peak_cache > max_cache_entries:
+        failures.append(f"translation cache grew to {peak_cache} (bound {max_cache_entries})")
+
+    midpoint = samples[len(samples) // 2]
+    if midpoint.rss_kb is not None and samples[-1].rss_kb is not None:
+        growth_mb = (samples[-1].rss_kb - midpoint.rss_kb) / 1024
+        if growth_mb > max_rss_growth_mb:
+            failures.append(f"RSS grew {growth_mb:.1f} MB over the second half (limit {max_rss_growth_mb} MB)")
+
+    quarter = max(1, len(samples) // 4)
+    early = statistics.median(s.tick_latency_ms for s in samples[:quarter])
+    late = statistics.median(s.tick_latency_ms for s in samples[-quarter:])
+    if late - early > latency_tolerance_ms and late > early * max_latency_growth:
+        failures.append(f"tick latency rose from {early:.3f} ms to {late:.3f} ms")
+
+    return failures
+
+
+def run_soak(hours: float = 8.0, tick_seconds: float = 1.0, sample_minutes: float = 15.0,
+             max_entries: int = 1000, seed: int = 0, **limits) -> SoakReport:
+    """
+    Run a simulated meeting and check it for unbounded growth.
+
+    Args:
+        hours: Simulated meeting length
+        tick_seconds: Simulated time between capture ticks
+        sample_minutes: Simulated time between samples
+        max_entries: Bound for already_translated and the translation cache,
+            small enough that eviction happens during the run
+        seed: Seed for the simulated speech
+        **limits: Overrides for the thresholds of analyze()
+
+    Returns:
+        Samples and any failed checks
+    """
+    config = AppConfig()
+    config.capture.split_marker = SPEAKER
+    config.capture.max_translated_lines = max_entries
+    config.translation.translation_cache_size = max_entries
+    config.translation.rate_delay = tick_seconds
+
+    clock = VirtualClock(start=time.time())
+    meeting = SimulatedMeeting(seed)
+    report = SoakReport()
+    manager = SessionManager(
+        config,
+        translation_service=TranslationService(config.translation, backend=StubTranslationBackend()),
+        scheduler=TranslationScheduler(1),
+        clock=clock
+    )
+
+    total_ticks = int(hours * 3600 / tick_seconds)
+    ticks_per_sample = max(1, int(sample_minutes * 60 / tick_seconds))
+    latencies: List[float] = []
+
+    session = manager.add_session("soak", meeting.transcript)
+    try:
+        for tick in range(1, total_ticks + 1):
+            clock.advance(tick_seconds)
+            meeting.advance(tick_seconds)
+
+            started = time.perf_counter()
+            wait(manager.tick())
+            latencies.append((time.perf_counter() - started) * 1000)
+
+            if tick % ticks_per_sample == 0:
+                report.samples.append(SoakSample(
+                    elapsed_hours=tick * tick_seconds / 3600,
+                    rss_kb=current_rss_kb(),
+                    already_translated=len(session.capture.already_translated),
+                    cache_entries=len(manager.translation_cache),
+                    tick_latency_ms=statistics.median(latencies),
+                    ticks=len(latencies)
+                ))
+                latencies = []
+    finally:
+        manager.stop()
+
+    report.lines_spoken = meeting.lines
+    report.segments_translated = session.translated_segments
+    report.failures = analyze(report.samples, max_entries, max_entries, **limits)
+    return report
+
+
+def main(argv=None) -> int:
+    """Run the soak test from the command line."""
+    parser = argparse.ArgumentParser(description="Simulate a long meeting and check for unbounded growth")
+    parser.add_argument("--hours", type=float, default=8.0, help="Simulated meeting length")
+    parser.add_argument("--tick", type=float, default=1.0, help="Simulated seconds between capture ticks")
+    parser.add_argument("--sample-minutes", type=float, default=15.0, help="Simulated minutes between samples")
+    parser.add_argument("--max-entries", type=int, default=1000,
+                        help="Bound for already_translated and the translation cache")
+    parser.add_argument("--max-rss-growth-mb", type=float, default=50.0,
+                        help="Allowed RSS growth over the second half of the run")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the simulated speech")
+    args = parser.parse_args(argv)
+
+    report = run_soak(
+        hours=args.hours,
+        tick_seconds=args.tick,
+        sample_minutes=args.sample_minutes,
+        max_entries=args.max_entries,
+        seed=args.seed,
+        max_rss_growth_mb=args.max_rss_growth_mb
+    )
+    print(report.format())
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
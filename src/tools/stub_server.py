@@ -0,0 +1,163 @@
+"""
+Local stand-in for a LibreTranslate server.
+
+Answers /translate and /languages like LibreTranslate, using the stub
+backend's "[target] text" translations. Requests are served by a fixed
+number of workers with a configurable service time and error rate, so
+latency grows with load the way it does on a real box.
+
+Run with ``python -m src.tools.stub_server --port 5000``.
+"""
+
+import argparse
+import json
+import logging
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Any
+
+from ..core.backends import StubTranslationBackend
+
+
+class StubLibreTranslateServer:
+    """LibreTranslate-compatible HTTP server backed by the stub backend."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, workers: int = 4,
+                 latency: float = 0.02, latency_per_char: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0):
+        """
+        Args:
+            host: Address to bind
+            port: Port to bind, 0 picks a free one
+            workers: Requests translated at once; the rest queue
+            latency: Service time of a translation in seconds
+            latency_per_char: Additional service time per character of text
+            error_rate: Fraction of translations answered with HTTP 500
+            seed: Seed for the injected errors
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.latency_per_char = latency_per_char
+        self.error_rate = error_rate
+        self.backend = StubTranslationBackend()
+        self.logger = logging.getLogger(__name__)
+        self.requests_served = 0
+        self._random = random.Random(seed)
+        self._workers = threading.Semaphore(max(1, workers))
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> tuple:
+        """Return the (host, port) the server is bound to."""
+        if self._server:
+            return self._server.server_address[:2]
+        return self.host, self.port
+
+    @property
+    def url(self) -> str:
+        """URL of the /translate endpoint."""
+        host, port = self.address
+        return f"http://{host}:{port}/translate"
+
+    def start(self) -> "StubLibreTranslateServer":
+        """Start serving in a background thread."""
+        handler = type("StubRequestHandler", (_StubRequestHandler,), {"stub": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-libretranslate", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Stub LibreTranslate listening on {self.url}")
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def translate(self, payload: dict) -> Optional[str]:
+        """Translate a request payload, or return None for an injected error."""
+        text = str(payload.get("q", ""))
+        with self._workers:
+            time.sleep(self.latency + self.latency_per_char * len(text))
+            with self._lock:
+                self.requests_served += 1
+                failed = self._random.random() < self.error_rate
+        if failed:
+            return None
+        return self.backend.translate(text, payload.get("source", ""), payload.get("target", ""))
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the LibreTranslate endpoints."""
+
+    stub: StubLibreTranslateServer
+
+    def do_GET(self):
+        if self.path.split("?")[0] == "/languages":
+            self._send_json(200, self.stub.backend.get_languages())
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        if self.path.split("?")[0] != "/translate":
+            self.send_error(404)
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "Invalid request"})
+            return
+
+        translation = self.stub.translate(payload)
+        if translation is None:
+            self._send_json(500, {"error": "Injected failure"})
+        else:
+            self._send_json(200, {"translatedText": translation})
+
+    def _send_json(self, status: int, payload: Any):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        self.stub.logger.debug(format % args)
+
+
+def main(argv=None) -> int:
+    """Run the stub server from the command line."""
+    parser = argparse.ArgumentParser(description="Serve a stand-in LibreTranslate API")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind")
+    parser.add_argument("--port", type=int, default=5000, help="Port to bind")
+    parser.add_argument("--workers", type=int, default=4, help="Requests translated at once")
+    parser.add_argument("--latency", type=float, default=0.02, help="Service time per request in seconds")
+    parser.add_argument("--latency-per-char", type=float, default=0.0,
+                        help="Additional service time per character in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    server = StubLibreTranslateServer(args.host, args.port, args.workers, args.latency,
+                                      args.latency_per_char, args.error_rate).start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,27 +1,89 @@
 """Display window module for showing translations."""
 
-import tkinter as tk
-from tkinter import font
 import logging
-from typing import Optional, Callable
-from screeninfo import get_monitors
+import statistics
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Callable, Dict, Tuple, List
 from ..config.settings import UIConfig
+from ..core.translator import SequencedTranslation
+from ..utils import tracing
+from ..utils.clock import Clock, SYSTEM_CLOCK
+from ..utils.lazy_import import LazyModule
+from ..utils.lru import LRUCache
+
+# Imported when the window is created
+tk = LazyModule("tkinter")
+font = LazyModule("tkinter.font")
+screeninfo = LazyModule("screeninfo")
+
+
+@dataclass
+class SegmentTiming:
+    """Display timing of one captured segment."""
+    seq: int
+    captured_at: float
+    first_display_at: Optional[float] = None
+    final_at: Optional[float] = None
+    
+    @property
+    def time_to_first_display(self) -> Optional[float]:
+        """Seconds from capture until anything was shown for the segment."""
+        if self.first_display_at is None:
+            return None
+        return self.first_display_at - self.captured_at
+    
+    @property
+    def time_to_final(self) -> Optional[float]:
+        """Seconds from capture until the final translation arrived."""
+        if self.final_at is None:
+            return None
+        return self.final_at - self.captured_at
 
 
 class TranslationDisplayWindow:
-    """Main display window for showing translations."""
+    """
+    Main display window for showing translations.
+    
+    In progressive mode, provisional text (the source text or a fuzzy
+    match) is shown in a muted colour as soon as a segment is captured and
+    replaced in place once the final translation arrives.
+    """
     
-    def __init__(self, config: UIConfig, update_callback: Optional[Callable] = None):
+    HISTORY_SIZE = 200
+    
+    def __init__(self, config: UIConfig, update_callback: Optional[Callable] = None,
+                 clock: Optional[Clock] = None, tracer: Optional[tracing.Tracer] = None):
         self.config = config
         self.update_callback = update_callback
+        # A virtual clock drives the countdown and update loop instead of Tk timers
+        self.clock = clock or SYSTEM_CLOCK
+        self.tracer = tracer
         self.logger = logging.getLogger(__name__)
         self.root = None
         self.label = None
+        self.display_font = None
+        self.wraplength = 0
+        self.lane_labels: Dict[str, "tk.Label"] = {}
         self.is_running = False
+        
+        # Sequence number of the newest displayed result; older results
+        # arriving late are filed into history instead of overwriting it
+        self.displayed_seq = -1
+        self.stale_updates_dropped = 0
+        self.history: deque = deque(maxlen=self.HISTORY_SIZE)
+        
+        # Capture-to-display timings of recent segments, by sequence number
+        self.timings = LRUCache(self.HISTORY_SIZE)
+    
+    def preload(self):
+        """Import the GUI toolkit ahead of window creation."""
+        tk.load()
+        font.load()
     
     def get_screen_size(self) -> tuple[int, int]:
         """Get the size for the display window based on screen configuration."""
-        monitors = get_monitors()
+        monitors = screeninfo.get_monitors()
         
         if len(monitors) > self.config.screen_index:
             monitor = monitors[self.config.screen_index]
@@ -32,32 +94,40 @@ class TranslationDisplayWindow:
             self.logger.warning(f"Monitor {self.config.screen_index} not detected, using default size")
             return 600, 200
     
-    def create_window(self):
-        """Create and configure the main display window."""
+    def create_window(self, size: Optional[Tuple[int, int]] = None):
+        """
+        Create and configure the main display window.
+        
+        Args:
+            size: Window (width, height), looked up from the monitor
+                configuration when not given
+        """
         self.root = tk.Tk()
         self.root.title("Teams Translator")
         
         # Set window size
-        width, height = self.get_screen_size()
+        width, height = size or self.get_screen_size()
         self.root.geometry(f"{width}x{height}")
         
         # Set window to always be on top
         self.root.attributes('-topmost', True)
         
         # Create font
-        display_font = font.Font(
+        self.display_font = font.Font(
             family=self.config.font_family,
             size=self.config.font_size,
             weight=self.config.font_weight
         )
         
         # Create label for displaying translations
+        self.wraplength = width
         self.label = tk.Label(
             self.root,
             text="",
-            font=display_font,
+            font=self.display_font,
             wraplength=width,
-            justify=tk.LEFT
+            justify=tk.LEFT,
+            fg=self.config.text_color
         )
         self.label.pack(expand=True, fill=tk.BOTH)
         
@@ -66,24 +136,139 @@ class TranslationDisplayWindow:
         
         self.logger.info(f"Created display window: {width}x{height}")
     
-    def update_text(self, text: str):
+    def accept_sequence(self, seq: Optional[int]) -> bool:
+        """
+        Check whether a result with the given sequence number may be displayed.
+        
+        Args:
+            seq: Capture sequence number of the result, None for unsequenced text
+            
+        Returns:
+            False if a newer result is already displayed
+        """
+        if seq is None:
+            return True
+        if seq < self.displayed_seq:
+            self.stale_updates_dropped += 1
+            self.logger.debug(f"Dropped stale result #{seq} (showing #{self.displayed_seq})")
+            return False
+        self.displayed_seq = seq
+        return True
+    
+    def mark_captured(self, seq: int, captured_at: Optional[float] = None):
+        """Start timing a captured segment."""
+        self.timings[seq] = SegmentTiming(seq, self.clock.time() if captured_at is None else captured_at)
+    
+    def record_timing(self, update: SequencedTranslation, displayed: bool):
+        """Record when a segment was first displayed and when its final translation arrived."""
+        timing = self.timings.get(update.seq)
+        if timing is None:
+            return
+        now = self.clock.time()
+        if displayed and timing.first_display_at is None:
+            timing.first_display_at = now
+        if not update.provisional and timing.final_at is None:
+            timing.final_at = now
+    
+    def timing_summary(self) -> Dict[str, Optional[float]]:
+        """
+        Summarise the timings of recent segments.
+        
+        Returns:
+            Median and worst time to first display and to the final
+            translation in seconds, None where nothing was measured
+        """
+        timings: List[SegmentTiming] = self.timings.values()
+        summary: Dict[str, Optional[float]] = {}
+        for name in ("time_to_first_display", "time_to_final"):
+            values = [getattr(t, name) for t in timings if getattr(t, name) is not None]
+            summary[f"median_{name}"] = statistics.median(values) if values else None
+            summary[f"max_{name}"] = max(values) if values else None
+        return summary
+    
+    def show_update(self, update: SequencedTranslation) -> bool:
+        """
+        Display a sequenced translation unless a newer one is already shown.
+        
+        Returns:
+            True if the update was displayed
+        """
+        if not self.accept_sequence(update.seq):
+            self.history.append(update)
+            self.record_timing(update, displayed=False)
+            return False
+        
+        trace = self.tracer.get(update.seq) if self.tracer else None
+        with tracing.span("render", trace, provisional=update.provisional):
+            if len(update.translations) == 1 and not self.lane_labels:
+                self.update_text(next(iter(update.translations.values())), provisional=update.provisional)
+            else:
+                self.update_lanes(update.translations, provisional=update.provisional)
+        self.record_timing(update, displayed=True)
+        return True
+    
+    def text_style(self, provisional: bool) -> Dict[str, str]:
+        """Return label options for provisional or final text."""
+        if not self.config.progressive_display:
+            return {}
+        return {"fg": self.config.provisional_color if provisional else self.config.text_color}
+    
+    def update_text(self, text: str, seq: Optional[int] = None, provisional: bool = False):
         """Update the displayed text."""
+        if not self.accept_sequence(seq):
+            return
         if self.label:
-            self.label.config(text=text)
+            self.label.config(text=text, **self.text_style(provisional))
+    
+    def update_lanes(self, translations: Dict[str, str], seq: Optional[int] = None,
+                     provisional: bool = False):
+        """Update one display lane per target language."""
+        if not self.root or not self.accept_sequence(seq):
+            return
+        
+        for language, text in translations.items():
+            lane = self.lane_labels.get(language)
+            if lane is None:
+                if not self.lane_labels and self.label:
+                    # Lanes replace the single-language label
+                    self.label.pack_forget()
+                lane = tk.Label(
+                    self.root,
+                    text="",
+                    font=self.display_font,
+                    wraplength=self.wraplength,
+                    justify=tk.LEFT,
+                    anchor=tk.W,
+                    fg=self.config.text_color
+                )
+                lane.pack(expand=True, fill=tk.BOTH)
+                self.lane_labels[language] = lane
+            lane.config(text=f"[{language}] {text}", **self.text_style(provisional))
     
-    def start_countdown(self, seconds: int, on_complete: Callable):
-        """Start countdown before beginning translation."""
+    def start_countdown(self, seconds: int, on_complete: Callable,
+                        status_callback: Optional[Callable[[], str]] = None):
+        """
+        Start countdown before beginning translation.
+        
+        Args:
+            seconds: Countdown duration
+            on_complete: Function to call when countdown completes
+            status_callback: Returns a status message shown with the countdown
+        """
         self.is_running = True
-        self._countdown_recursive(seconds, on_complete)
+        self._countdown_recursive(seconds, on_complete, status_callback)
     
-    def _countdown_recursive(self, count: int, on_complete: Callable):
+    def _countdown_recursive(self, count: int, on_complete: Callable,
+                             status_callback: Optional[Callable[[], str]] = None):
         """Recursive countdown implementation."""
         if not self.is_running:
             return
         
         if count > 0:
-            self.update_text(f"Starting in {count} seconds...")
-            self.root.after(1000, lambda: self._countdown_recursive(count - 1, on_complete))
+            status = status_callback() if status_callback else ""
+            suffix = f" ({status})" if status else ""
+            self.update_text(f"Starting in {count} seconds...{suffix}")
+            self.schedule(1000, lambda: self._countdown_recursive(count - 1, on_complete, status_callback))
         else:
             self.update_text("Starting translation...")
             on_complete()
@@ -95,16 +280,33 @@ class TranslationDisplayWindow:
         
         if self.update_callback:
             translation = self.update_callback()
-            if translation:
+            if isinstance(translation, SequencedTranslation):
+                self.show_update(translation)
+            elif isinstance(translation, dict):
+                self.update_lanes(translation)
+            elif translation:
                 self.update_text(translation)
         
-        self.root.after(update_interval_ms, lambda: self.start_translation_updates(update_interval_ms))
+        self.schedule(update_interval_ms, lambda: self.start_translation_updates(update_interval_ms))
+    
+    def schedule(self, delay_ms: int, callback: Callable):
+        """Run callback after delay_ms milliseconds on the window's clock."""
+        if self.clock.virtual:
+            self.clock.call_later(delay_ms / 1000, callback)
+        else:
+            self.root.after(delay_ms, callback)
     
     def on_closing(self):
         """Handle window closing event."""
         self.is_running = False
         if self.root:
             self.root.destroy()
+        summary = self.timing_summary()
+        if summary["median_time_to_first_display"] is not None:
+            self.logger.info(
+                f"Median time to first display {summary['median_time_to_first_display'] * 1000:.0f} ms, "
+                f"to final translation {(summary['median_time_to_final'] or 0) * 1000:.0f} ms"
+            )
         self.logger.info("Display window closed")
     
     def run(self):
@@ -0,0 +1,101 @@
+"""Clocks for real and time-accelerated runs of the capture loop."""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, List, Tuple, Protocol
+
+
+class Clock(Protocol):
+    """Source of time for the capture loop and its schedulers."""
+
+    virtual: bool
+
+    def time(self) -> float:
+        """Seconds since the epoch."""
+        ...
+
+    def monotonic(self) -> float:
+        """Seconds from an arbitrary origin that never goes backwards."""
+        ...
+
+    def sleep(self, seconds: float):
+        """Wait for the given number of seconds."""
+        ...
+
+
+class SystemClock:
+    """Wall-clock time; timers are left to the caller's event loop."""
+
+    virtual = False
+
+    def time(self) -> float:
+        """Seconds since the epoch."""
+        return time.time()
+
+    def monotonic(self) -> float:
+        """Seconds from an arbitrary origin that never goes backwards."""
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        """Block for the given number of seconds."""
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    Simulated time that only moves when advanced.
+
+    sleep() returns immediately after moving the clock forward, so loops
+    paced by rate_delay or translate_always_after replay a whole meeting
+    in seconds. Callbacks registered with call_later run, in due order,
+    as the clock is advanced past them.
+    """
+
+    virtual = True
+
+    def __init__(self, start: float = 0.0):
+        self.start = start
+        self.elapsed = 0.0
+        self._timers: List[Tuple[float, int, Callable[[], None]]] = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        """Simulated seconds since the epoch."""
+        return self.start + self.elapsed
+
+    def monotonic(self) -> float:
+        """Simulated seconds since the clock was created."""
+        return self.elapsed
+
+    def sleep(self, seconds: float):
+        """Advance the clock instead of blocking."""
+        self.advance(seconds)
+
+    def call_later(self, delay: float, callback: Callable[[], None]):
+        """Run callback once the clock has advanced by delay seconds."""
+        with self._lock:
+            heapq.heappush(self._timers, (self.elapsed + max(0.0, delay), next(self._order), callback))
+
+    def advance(self, seconds: float):
+        """Move the clock forward, running the timers that fall due on the way."""
+        with self._lock:
+            target = self.elapsed + max(0.0, seconds)
+        while True:
+            with self._lock:
+                if not self._timers or self._timers[0][0] > target:
+                    self.elapsed = max(self.elapsed, target)
+                    return
+                due, _, callback = heapq.heappop(self._timers)
+                self.elapsed = max(self.elapsed, due)
+            callback()
+
+    @property
+    def pending_timers(self) -> int:
+        """Number of callbacks waiting to fall due."""
+        return len(self._timers)
+
+
+SYSTEM_CLOCK = SystemClock()
@@ -0,0 +1,44 @@
+"""Deferred module imports for heavy optional subsystems."""
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Optional
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+    
+    Heavy GUI and automation modules (pyautogui, tkinter, screeninfo) are
+    only needed once their subsystem is used, so importing them up front
+    slows down startup for nothing.
+    """
+    
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+    
+    def load(self) -> ModuleType:
+        """Import the underlying module if needed and return it."""
+        module: Optional[ModuleType] = self.__dict__["_module"]
+        if module is None:
+            with self.__dict__["_lock"]:
+                module = self.__dict__["_module"]
+                if module is None:
+                    module = importlib.import_module(self.__dict__["_name"])
+                    self.__dict__["_module"] = module
+        return module
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the underlying module has been imported."""
+        return self.__dict__["_module"] is not None
+    
+    def __getattr__(self, attr: str):
+        return getattr(self.load(), attr)
+    
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule {self.__dict__['_name']!r} ({state})>"
@@ -0,0 +1,95 @@
+"""Size-bounded containers for state that lives as long as the session."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Iterator, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe mapping that evicts the least recently used entry when full.
+
+    A meeting can run for hours, so caches keyed by caption text must not
+    grow with the transcript. Lookups and stores refresh an entry's recency.
+    """
+
+    def __init__(self, max_size: int):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the value for key, or default if it is not cached."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def __setitem__(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def values(self) -> list:
+        """Return a snapshot of the values, least recently used first."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class LRUSet:
+    """
+    Thread-safe set that forgets the least recently used member when full.
+    """
+
+    def __init__(self, max_size: int):
+        self._members = LRUCache(max_size)
+
+    @property
+    def max_size(self) -> int:
+        return self._members.max_size
+
+    @property
+    def evictions(self) -> int:
+        return self._members.evictions
+
+    def add(self, item: Hashable):
+        """Add item, or refresh it if it is already a member."""
+        self._members[item] = None
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._members._lock:
+            return iter(list(self._members._entries))
+
+    def clear(self):
+        """Remove all members."""
+        self._members.clear()
@@ -0,0 +1,65 @@
+"""Timing breakdown of application startup."""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import List, Callable, Any
+
+
+@dataclass
+class StartupPhase:
+    """A timed startup step."""
+    name: str
+    started_at: float
+    duration: float
+    thread: str
+
+
+class StartupTrace:
+    """Records how long each startup step takes, relative to process start."""
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.phases: List[StartupPhase] = []
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as a named startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.phases.append(StartupPhase(
+                    name=name,
+                    started_at=start - self.origin,
+                    duration=end - start,
+                    thread=threading.current_thread().name
+                ))
+    
+    def timed(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a callable so each call is recorded as a phase."""
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    
+    def elapsed(self) -> float:
+        """Seconds since the trace was started."""
+        return time.perf_counter() - self.origin
+    
+    def report(self) -> str:
+        """Format the recorded phases as a table ordered by start time."""
+        lines = [f"{'phase':<28} {'start':>9} {'duration':>9}  thread"]
+        with self._lock:
+            phases = sorted(self.phases, key=lambda p: p.started_at)
+        for p in phases:
+            lines.append(
+                f"{p.name:<28} {p.started_at * 1000:>7.1f}ms {p.duration * 1000:>7.1f}ms  {p.thread}"
+            )
+        lines.append(f"{'total':<28} {'':>9} {self.elapsed() * 1000:>7.1f}ms")
+        return "\n".join(lines)
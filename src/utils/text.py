@@ -0,0 +1,12 @@
+"""Text normalization shared by the caption lookups."""
+
+import re
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Case-fold and strip punctuation and redundant whitespace."""
+    text = _NON_WORD.sub(" ", text.casefold())
+    return _WHITESPACE.sub(" ", text).strip()
@@ -0,0 +1,244 @@
+"""Per-caption tracing spans written in the Chrome trace-event format."""
+
+import contextvars
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Optional, Dict, Any, List, Iterator, ContextManager
+from ..config.settings import TracingConfig
+from .lru import LRUCache
+
+# Trace of the caption being processed, carried into worker threads with the context
+_current_trace: contextvars.ContextVar = contextvars.ContextVar("current_trace", default=None)
+
+
+class Trace:
+    """
+    Spans recorded for one caption.
+
+    Until commit() the spans are kept on the trace itself, so capture
+    ticks that find nothing to translate are simply dropped and never
+    reach the file. After commit() spans go straight to the tracer, which
+    can look the trace up by ID from other components.
+    """
+
+    def __init__(self, tracer: "Tracer", trace_id: int):
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.committed = False
+        self._events: List[Dict[str, Any]] = []
+        self._threads = set()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **args) -> Iterator[None]:
+        """Record the enclosed block as a span of this trace."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, start, time.perf_counter(), args)
+
+    def commit(self):
+        """Keep the trace: write its spans so far and all later ones."""
+        with self._lock:
+            if self.committed:
+                return
+            self.committed = True
+            events, self._events = self._events, []
+        self.tracer.traces[self.trace_id] = self
+        self.tracer.record({
+            "name": "process_name", "ph": "M", "pid": self.trace_id,
+            "args": {"name": f"caption #{self.trace_id}"}
+        })
+        self.tracer.record_all(events)
+
+    def _record(self, name: str, start: float, end: float, args: Dict[str, Any]):
+        thread = threading.current_thread()
+        events = []
+        with self._lock:
+            new_thread = thread.ident not in self._threads
+            self._threads.add(thread.ident)
+        if new_thread:
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": self.trace_id, "tid": thread.ident,
+                "args": {"name": thread.name}
+            })
+        events.append({
+            "name": name, "cat": "caption", "ph": "X",
+            "ts": round((start - self.tracer.origin) * 1_000_000, 1),
+            "dur": round((end - start) * 1_000_000, 1),
+            "pid": self.trace_id, "tid": thread.ident,
+            "args": dict(args, trace_id=self.trace_id)
+        })
+        with self._lock:
+            if not self.committed:
+                self._events.extend(events)
+                return
+        self.tracer.record_all(events)
+
+
+class Tracer:
+    """
+    Samples captions for tracing and writes their spans to a rotating file.
+
+    Each trace is shown as one process named after the caption, with its
+    spans on the threads that ran them. Files hold up to
+    max_events_per_file events in the JSON array format of the Chrome
+    trace-event spec, so they open in chrome://tracing or Perfetto; full
+    files are rotated to <path>.1, <path>.2, ... keeping `backups` of them.
+    Events are buffered and written by a background thread once
+    FLUSH_EVENTS are queued or FLUSH_INTERVAL seconds have passed, so
+    threads recording spans never block on file I/O.
+    """
+
+    FLUSH_EVENTS = 512
+    FLUSH_INTERVAL = 5.0
+    ACTIVE_TRACES = 256
+
+    def __init__(self, config: TracingConfig, seed: Optional[int] = None):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self.origin = time.perf_counter()
+        self.traces = LRUCache(self.ACTIVE_TRACES)
+        self.events_written = 0
+        self._random = random.Random(seed)
+        self._buffer: List[Dict[str, Any]] = []
+        self._condition = threading.Condition()
+        # Held while swapping out and writing the buffer, keeping writes in order
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._file = None
+        self._events_in_file = 0
+
+    def start(self, trace_id: int) -> Optional[Trace]:
+        """
+        Start a trace for a caption if it is sampled.
+
+        Returns:
+            The trace, or None if the caption is not sampled
+        """
+        if self._random.random() >= self.config.sample_rate:
+            return None
+        return Trace(self, trace_id)
+
+    def get(self, trace_id: int) -> Optional[Trace]:
+        """Return the recent committed trace with the given ID, if any."""
+        return self.traces.get(trace_id)
+
+    def record(self, event: Dict[str, Any]):
+        """Queue one event for writing."""
+        self.record_all([event])
+
+    def record_all(self, events: List[Dict[str, Any]]):
+        """Queue events for the background writer; never blocks on file I/O."""
+        with self._condition:
+            if self._closed:
+                return
+            self._buffer.extend(events)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="trace-writer", daemon=True)
+                self._thread.start()
+            if len(self._buffer) >= self.FLUSH_EVENTS:
+                self._condition.notify()
+
+    def flush(self):
+        """Write buffered events to the trace file now."""
+        with self._write_lock:
+            with self._condition:
+                events, self._buffer = self._buffer, []
+            try:
+                for event in events:
+                    self._write(event)
+                if self._file:
+                    self._file.flush()
+            except OSError as e:
+                self.logger.error(f"Failed to write trace events: {e}")
+
+    def close(self):
+        """Stop the background writer, write remaining events and finish the current file."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+        if thread:
+            thread.join()
+        self.flush()
+        with self._write_lock:
+            if self._file:
+                self._finish_file()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and len(self._buffer) < self.FLUSH_EVENTS:
+                    self._condition.wait(self.FLUSH_INTERVAL)
+                closed = self._closed
+            self.flush()
+            if closed:
+                return
+
+    def _write(self, event: Dict[str, Any]):
+        if self._file is None:
+            directory = os.path.dirname(self.config.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.config.path, "w", encoding="utf-8")
+            self._file.write("[\n")
+            self._events_in_file = 0
+        self._file.write((",\n" if self._events_in_file else "") + json.dumps(event))
+        self._events_in_file += 1
+        self.events_written += 1
+        if self._events_in_file >= self.config.max_events_per_file:
+            self._finish_file()
+            self._rotate()
+
+    def _finish_file(self):
+        self._file.write("\n]\n")
+        self._file.close()
+        self._file = None
+
+    def _rotate(self):
+        path = self.config.path
+        if self.config.backups <= 0:
+            os.remove(path)
+            return
+        for index in range(self.config.backups - 1, 0, -1):
+            if os.path.exists(f"{path}.{index}"):
+                os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+        os.replace(path, f"{path}.1")
+
+
+@contextmanager
+def activate(trace: Optional[Trace]) -> Iterator[None]:
+    """Make trace the current one for span() in this context."""
+    token = _current_trace.set(trace)
+    try:
+        yield
+    finally:
+        _current_trace.reset(token)
+
+
+def current_trace() -> Optional[Trace]:
+    """Return the trace active in this context, if any."""
+    return _current_trace.get()
+
+
+def span(name: str, trace: Optional[Trace] = None, **args) -> ContextManager:
+    """
+    Record a span on the given or current trace; a no-op when untraced.
+
+    Args:
+        name: Span name
+        trace: Trace to record on, defaults to the current one
+        **args: Details shown with the span
+    """
+    trace = trace or _current_trace.get()
+    if trace is None:
+        return nullcontext()
+    return trace.span(name, **args)
@@ -0,0 +1,267 @@
+"""Unit tests for the capture/translate paths of TeamsTranslatorApp."""
+
+import logging
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from src.core.app import TeamsTranslatorApp
+from src.core.backends import StubTranslationBackend
+from src.config.settings import AppConfig
+from src.utils.clock import VirtualClock
+
+
+class AppTestCase(unittest.TestCase):
+    """Runs the app's ticks against a stub backend and an injected transcript."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.transcript = ""
+    
+    def make_app(self, delay=0.0, target_languages=("en",), progressive_display=False, **translation):
+        config = AppConfig()
+        config.capture.split_marker = "Speaker:"
+        config.translation.backend = "stub"
+        config.translation.target_language = target_languages[0]
+        config.translation.additional_target_languages = list(target_languages[1:])
+        config.translation.phrase_table_dir = self.directory.name
+        config.ui.progressive_display = progressive_display
+        for key, value in translation.items():
+            setattr(config.translation, key, value)
+        
+        self.clock = VirtualClock()
+        # Keep the app from adding a log file handler in the working directory
+        with patch.object(TeamsTranslatorApp, "_setup_logging", return_value=logging.getLogger(__name__)):
+            app = TeamsTranslatorApp(config, clock=self.clock)
+        self.addCleanup(app.scheduler.shutdown)
+        self.backend = StubTranslationBackend(delay=delay)
+        app.translation_service.backend = self.backend
+        app.text_capture.text_source = lambda: self.transcript
+        app.reset_session()
+        return app
+    
+    def write_phrases(self, target_lang, phrases):
+        path = os.path.join(self.directory.name, f"fi-{target_lang}.tsv")
+        with open(path, "w", encoding="utf-8") as f:
+            for phrase, translation in phrases.items():
+                f.write(f"{phrase}\t{translation}\n")
+    
+    def wait_until(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("Condition not met in time")
+            time.sleep(0.01)
+
+
+class TestPhraseTables(AppTestCase):
+    """Test cases for the phrase table fast path."""
+    
+    def test_phrase_answered_without_backend(self):
+        """Test that a phrase found for every target language never reaches the backend."""
+        self.write_phrases("en", {"kiitos": "thank you"})
+        self.write_phrases("sv", {"kiitos": "tack"})
+        app = self.make_app(target_languages=("en", "sv"))
+        self.transcript = "Speaker: Kiitos! Speaker:"
+        
+        update = app.grab_translation_update()
+        
+        self.assertEqual(update.translations, {"en": "thank you", "sv": "tack"})
+        self.assertEqual(app.phrase_hits, 1)
+        self.assertEqual(self.backend.calls, 0)
+        self.assertIn("Kiitos!", app.text_capture.already_translated)
+    
+    def test_partial_phrase_match_uses_backend_for_the_rest(self):
+        """Test that languages without the phrase are translated by the backend."""
+        self.write_phrases("sv", {"kiitos": "tack"})
+        app = self.make_app(target_languages=("en", "sv"))
+        self.transcript = "Speaker: Kiitos Speaker:"
+        
+        update = app.grab_translation_update()
+        
+        self.assertEqual(update.translations, {"en": "[en] Kiitos", "sv": "tack"})
+        self.assertEqual(app.phrase_hits, 0)
+        self.assertEqual(self.backend.calls, 1)
+
+
+class TestTranslationMemory(AppTestCase):
+    """Test cases for provisional memory matches and pop_refined_translation."""
+    
+    def test_memory_match_is_refined(self):
+        """Test that a near-duplicate is shown from memory and replaced by the exact translation."""
+        app = self.make_app(delay=0.2, fuzzy_match_threshold=0.8)
+        app.translation_memory.add("Hei kaikki maailma", "en", "Hi all world")
+        self.transcript = "Speaker: Hei kaikki maailmaa Speaker:"
+        
+        provisional = app.grab_translation_update()
+        self.assertTrue(provisional.provisional)
+        self.assertEqual(provisional.translations, {"en": "Hi all world"})
+        
+        self.wait_until(lambda: not app.refined_translations.empty())
+        refined = app.grab_translation_update()
+        self.assertFalse(refined.provisional)
+        self.assertEqual(refined.seq, provisional.seq)
+        self.assertEqual(refined.translations, {"en": "[en] Hei kaikki maailmaa"})
+    
+    def test_refinement_keeps_other_languages(self):
+        """Test that languages answered from a phrase table stay in the refined result."""
+        self.write_phrases("sv", {"hei maailma": "hej världen"})
+        app = self.make_app(delay=0.2, target_languages=("en", "sv"), fuzzy_match_threshold=0.8)
+        app.translation_memory.add("Hei maailma!", "en", "Hello world!")
+        self.transcript = "Speaker: Hei maailma Speaker:"
+        
+        provisional = app.grab_translation_update()
+        self.assertEqual(provisional.translations, {"en": "Hello world!", "sv": "hej världen"})
+        
+        self.wait_until(lambda: not app.refined_translations.empty())
+        refined = app.grab_translation_update()
+        self.assertEqual(refined.translations, {"en": "[en] Hei maailma", "sv": "hej världen"})
+        self.assertEqual(self.backend.calls, 1)
+    
+    def test_stale_refinement_is_dropped(self):
+        """Test that a refinement arriving after a newer segment was shown is not displayed."""
+        app = self.make_app(delay=0.3, fuzzy_match_threshold=0.8)
+        app.translation_memory.add("Hei kaikki maailma", "en", "Hi all world")
+        self.transcript = "Speaker: Hei kaikki maailmaa Speaker:"
+        provisional = app.grab_translation_update()
+        
+        self.transcript = "Speaker: Hei kaikki maailmaa Speaker: Seuraava asia Speaker:"
+        newer = app.grab_translation_update()
+        self.assertGreater(newer.seq, provisional.seq)
+        self.assertEqual(newer.translations, {"en": "[en] Seuraava asia"})
+        
+        self.wait_until(lambda: not app.refined_translations.empty())
+        self.assertIsNone(app.grab_translation_update())
+        self.assertEqual(app.stale_results_dropped, 1)
+
+
+class TestSpeculation(AppTestCase):
+    """Test cases for update_speculation and await_speculation."""
+    
+    def make_speculating_app(self):
+        app = self.make_app(delay=0.3, speculative_debounce=1.0, translate_always_after=100.0)
+        self.transcript = "Speaker: puhun nyt"
+        self.assertIsNone(app.grab_translation_update())
+        self.clock.advance(1.5)
+        # The line has been stable for longer than the debounce
+        self.assertIsNone(app.grab_translation_update())
+        self.assertEqual(app.speculation[0], "puhun nyt")
+        return app
+    
+    def test_superseded_when_line_changes(self):
+        """Test that an in-flight speculation is dropped once the incomplete line changes."""
+        app = self.make_speculating_app()
+        self.transcript = "Speaker: puhun nyt ja"
+        
+        self.assertIsNone(app.grab_translation_update())
+        
+        self.assertEqual(app.speculations_superseded, 1)
+        self.assertIsNone(app.speculation)
+        self.assertNotIn("puhun nyt", app.text_capture.already_translated)
+    
+    def test_finished_speculation_is_committed(self):
+        """Test that a finished speculation of the unchanged line is displayed once."""
+        app = self.make_speculating_app()
+        app.speculation[1].result(5)
+        
+        update = app.grab_translation_update()
+        
+        self.assertEqual(update.translations, {"en": "[en] puhun nyt"})
+        self.assertEqual(update.seq, app.text_capture.capture_seq)
+        self.assertEqual(app.latest_seq, update.seq)
+        self.assertIn("puhun nyt", app.text_capture.already_translated)
+        self.assertIsNone(app.grab_translation_update())
+        self.assertEqual(self.backend.calls, 1)
+    
+    def test_completed_line_reuses_speculation(self):
+        """Test that a line completed while speculated waits for it and is served from the cache."""
+        app = self.make_speculating_app()
+        self.transcript = "Speaker: puhun nyt Speaker: seuraava"
+        
+        update = app.grab_translation_update()
+        
+        self.assertEqual(update.source_text, "puhun nyt")
+        self.assertEqual(update.translations, {"en": "[en] puhun nyt"})
+        self.assertEqual(self.backend.calls, 1)
+
+
+class TestProgressiveDisplay(AppTestCase):
+    """Test cases for show_provisionally and pop_final_translation."""
+    
+    def test_source_shown_until_translation_arrives(self):
+        """Test that the source text is shown first and the final translation on a later tick."""
+        app = self.make_app(delay=0.2, progressive_display=True)
+        self.transcript = "Speaker: Hei maailma Speaker:"
+        
+        provisional = app.grab_translation_update()
+        self.assertTrue(provisional.provisional)
+        self.assertEqual(provisional.translations, {"en": "Hei maailma"})
+        self.assertNotIn("Hei maailma", app.text_capture.already_translated)
+        
+        self.wait_until(lambda: not app.final_translations.empty())
+        final = app.grab_translation_update()
+        self.assertFalse(final.provisional)
+        self.assertEqual(final.seq, provisional.seq)
+        self.assertEqual(final.translations, {"en": "[en] Hei maailma"})
+        self.assertIn("Hei maailma", app.text_capture.already_translated)
+    
+    def test_final_translation_timed_on_arrival(self):
+        """Test that time to final ends when the translation arrives, not on the next tick."""
+        app = self.make_app(delay=0.2, progressive_display=True)
+        self.transcript = "Speaker: Hei maailma Speaker:"
+        seq = app.grab_translation_update().seq
+        
+        self.wait_until(lambda: not app.final_translations.empty())
+        self.clock.advance(app.config.translation.rate_delay)
+        app.grab_translation_update()
+        
+        self.assertEqual(app.display_window.timings.get(seq).time_to_final, 0.0)
+    
+    def test_final_translation_not_lost_to_new_text(self):
+        """Test that a final translation arriving with a new line is shown before the line is captured."""
+        app = self.make_app(delay=0.2, progressive_display=True)
+        self.transcript = "Speaker: Hei maailma Speaker:"
+        first = app.grab_translation_update()
+        
+        self.wait_until(lambda: not app.final_translations.empty())
+        self.transcript = "Speaker: Hei maailma Speaker: Seuraava asia Speaker:"
+        final = app.grab_translation_update()
+        self.assertEqual(final.seq, first.seq)
+        self.assertEqual(final.translations, {"en": "[en] Hei maailma"})
+        
+        second = app.grab_translation_update()
+        self.assertTrue(second.provisional)
+        self.assertEqual(second.translations, {"en": "Seuraava asia"})
+    
+    def test_stale_final_translation_is_not_displayed(self):
+        """Test that a final translation of an older segment is transcribed but not returned."""
+        app = self.make_app(delay=0.3, progressive_display=True)
+        self.transcript = "Speaker: Hei maailma Speaker:"
+        app.grab_translation_update()
+        self.transcript = "Speaker: Hei maailma Speaker: Seuraava asia Speaker:"
+        newer = app.grab_translation_update()
+        
+        self.wait_until(lambda: app.final_translations.qsize() == 2)
+        final = app.grab_translation_update()
+        
+        self.assertEqual(final.seq, newer.seq)
+        self.assertEqual(final.translations, {"en": "[en] Seuraava asia"})
+        self.assertEqual(app.stale_results_dropped, 1)
+        self.assertIn("Hei maailma", app.text_capture.already_translated)
+    
+    def test_failed_translation_is_not_finalised(self):
+        """Test that a failed translation leaves the line to be translated again."""
+        app = self.make_app(delay=0.2, progressive_display=True)
+        self.backend.translate = lambda text, source, target: time.sleep(0.2)
+        self.transcript = "Speaker: Hei maailma Speaker:"
+        app.grab_translation_update()
+        
+        self.wait_until(lambda: not app.final_translations.empty())
+        self.assertIsNone(app.grab_translation_update())
+        self.assertNotIn("Hei maailma", app.text_capture.already_translated)
+
+
+if __name__ == '__main__':
+    unittest.main()
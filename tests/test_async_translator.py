@@ -0,0 +1,156 @@
+"""Unit tests for AsyncTranslationService."""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+from src.core.async_translator import AsyncTranslationService
+from src.config.settings import TranslationConfig
+
+
+class FakeClientError(Exception):
+    pass
+
+
+FAKE_AIOHTTP = SimpleNamespace(ClientError=FakeClientError, ClientTimeout=lambda total: total)
+
+
+class FakeResponse:
+    def __init__(self, status, payload):
+        self.status = status
+        self.payload = payload
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def json(self):
+        return self.payload
+    
+    async def text(self):
+        return str(self.payload)
+
+
+class FakeSession:
+    """Records requests and answers like a LibreTranslate server."""
+    
+    def __init__(self, status=200, error=None, delay=0.0):
+        self.status = status
+        self.error = error
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    def post(self, url, json, timeout):
+        self.requests.append((url, json, timeout))
+        return self._respond({"translatedText": f"[{json['target']}] {json['q']}"})
+    
+    def get(self, url, timeout):
+        self.requests.append((url, None, timeout))
+        return self._respond([{"code": "en", "name": "English"}])
+    
+    def _respond(self, payload):
+        session = self
+        
+        class Context:
+            async def __aenter__(self):
+                session.in_flight += 1
+                session.max_in_flight = max(session.max_in_flight, session.in_flight)
+                try:
+                    await asyncio.sleep(session.delay)
+                    if session.error:
+                        raise session.error
+                finally:
+                    session.in_flight -= 1
+                return FakeResponse(session.status, payload)
+            
+            async def __aexit__(self, *exc_info):
+                return False
+        
+        return Context()
+
+
+@patch('src.core.async_translator.aiohttp', FAKE_AIOHTTP)
+class TestAsyncTranslationService(unittest.TestCase):
+    """Test cases for AsyncTranslationService class."""
+    
+    def setUp(self):
+        self.config = TranslationConfig(max_requests_per_second=0)
+    
+    def test_translate_success(self):
+        """Test a translation request and its payload."""
+        session = FakeSession()
+        service = AsyncTranslationService(self.config, session=session)
+        
+        result = asyncio.run(service.translate("Hei maailma"))
+        
+        self.assertEqual(result, "[en] Hei maailma")
+        url, data, timeout = session.requests[0]
+        self.assertEqual(url, "http://localhost:5000/translate")
+        self.assertEqual(data["source"], "fi")
+        self.assertEqual(data["format"], "text")
+        self.assertEqual(timeout, 10.0)
+    
+    def test_translate_empty_text(self):
+        """Test that empty text is not sent."""
+        session = FakeSession()
+        service = AsyncTranslationService(self.config, session=session)
+        
+        self.assertIsNone(asyncio.run(service.translate("   ")))
+        self.assertEqual(session.requests, [])
+    
+    def test_translate_failures_return_none(self):
+        """Test error statuses, client errors and timeouts."""
+        for session in (FakeSession(status=500), FakeSession(error=FakeClientError("refused")),
+                        FakeSession(error=asyncio.TimeoutError())):
+            with self.subTest(session=session):
+                service = AsyncTranslationService(self.config, session=session)
+                self.assertIsNone(asyncio.run(service.translate("Hei")))
+    
+    def test_translate_many_bounded_concurrency(self):
+        """Test that translate_many keeps order and respects the semaphore."""
+        session = FakeSession(delay=0.01)
+        service = AsyncTranslationService(self.config, session=session, max_concurrency=3)
+        texts = [f"rivi {i}" for i in range(20)]
+        
+        results = asyncio.run(service.translate_many(texts))
+        
+        self.assertEqual(results, [f"[en] rivi {i}" for i in range(20)])
+        self.assertEqual(session.max_in_flight, 3)
+    
+    def test_translate_to_targets(self):
+        """Test fan-out to several target languages."""
+        service = AsyncTranslationService(self.config, session=FakeSession())
+        
+        self.assertEqual(asyncio.run(service.translate_to_targets("Hei", ["en", "sv"])),
+                         {"en": "[en] Hei", "sv": "[sv] Hei"})
+    
+    def test_availability_and_languages(self):
+        """Test the language listing probe."""
+        session = FakeSession()
+        service = AsyncTranslationService(self.config, session=session)
+        
+        self.assertTrue(asyncio.run(service.is_service_available()))
+        self.assertEqual(asyncio.run(service.get_languages()), [{"code": "en", "name": "English"}])
+        self.assertEqual(session.requests[0][0], "http://localhost:5000/languages")
+        self.assertEqual(session.requests[0][2], 5.0)
+        
+        unavailable = AsyncTranslationService(self.config, session=FakeSession(error=FakeClientError()))
+        self.assertFalse(asyncio.run(unavailable.is_service_available()))
+    
+    def test_injected_session_not_closed(self):
+        """Test that close() leaves a caller-owned session alone."""
+        session = FakeSession()
+        
+        async def use():
+            async with AsyncTranslationService(self.config, session=session) as service:
+                return await service.translate("Hei")
+        
+        self.assertEqual(asyncio.run(use()), "[en] Hei")
+
+
+if __name__ == '__main__':
+    unittest.main()
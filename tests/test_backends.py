@@ -0,0 +1,145 @@
+"""Unit tests for translation backends."""
+
+import unittest
+from unittest.mock import Mock, patch
+from src.core.backends import ArgosTranslationBackend, StubTranslationBackend, HedgedTranslationBackend
+from src.core.translator import TranslationService, HttpTranslationBackend, create_backend
+from src.config.settings import TranslationConfig
+
+
+class TestStubTranslationBackend(unittest.TestCase):
+    """Test cases for StubTranslationBackend class."""
+    
+    def test_deterministic_translation(self):
+        """Test that the stub returns predictable output and counts calls."""
+        backend = StubTranslationBackend()
+        
+        self.assertEqual(backend.translate("Hei", "fi", "en"), "[en] Hei")
+        self.assertEqual(backend.translate("Hei", "fi", "en"), "[en] Hei")
+        self.assertEqual(backend.calls, 2)
+        self.assertTrue(backend.is_available())
+    
+    def test_service_uses_injected_backend(self):
+        """Test that TranslationService delegates to its backend."""
+        service = TranslationService(TranslationConfig(), backend=StubTranslationBackend())
+        
+        self.assertEqual(service.translate("Hei"), "[en] Hei")
+        self.assertEqual(service.translate_to_targets("Hei", ["en", "sv"]),
+                         {"en": "[en] Hei", "sv": "[sv] Hei"})
+        self.assertTrue(service.is_service_available())
+
+
+class TestArgosTranslationBackend(unittest.TestCase):
+    """Test cases for ArgosTranslationBackend class."""
+    
+    def make_languages(self):
+        finnish, english = Mock(code="fi"), Mock(code="en")
+        finnish.name, english.name = "Finnish", "English"
+        translation = Mock()
+        translation.translate.side_effect = lambda text: f"argos:{text}"
+        finnish.get_translation.side_effect = lambda other: translation if other is english else None
+        english.get_translation.return_value = None
+        return [finnish, english], translation
+    
+    def test_translate_with_installed_pair(self):
+        """Test translating through the in-process engine."""
+        languages, translation = self.make_languages()
+        fake_argos = Mock(get_installed_languages=Mock(return_value=languages))
+        
+        with patch('src.core.backends.argos_translate', fake_argos):
+            backend = ArgosTranslationBackend()
+            self.assertEqual(backend.translate("Hei", "fi", "en"), "argos:Hei")
+            self.assertEqual(backend.translate("Moi", "fi", "en"), "argos:Moi")
+        
+        # The translation object is looked up once and reused
+        self.assertEqual(fake_argos.get_installed_languages.call_count, 1)
+    
+    def test_missing_pair(self):
+        """Test that an uninstalled language pair fails gracefully."""
+        languages, _ = self.make_languages()
+        fake_argos = Mock(get_installed_languages=Mock(return_value=languages))
+        
+        with patch('src.core.backends.argos_translate', fake_argos):
+            self.assertIsNone(ArgosTranslationBackend().translate("Hello", "en", "fi"))
+    
+    def test_not_installed(self):
+        """Test that a missing argostranslate package is reported, not raised."""
+        fake_argos = Mock(get_installed_languages=Mock(side_effect=ImportError("No module")))
+        
+        with patch('src.core.backends.argos_translate', fake_argos):
+            backend = ArgosTranslationBackend()
+            self.assertFalse(backend.is_available())
+            self.assertIsNone(backend.translate("Hei", "fi", "en"))
+
+
+class TestHedgedTranslationBackend(unittest.TestCase):
+    """Test cases for HedgedTranslationBackend class."""
+    
+    def make_backend(self, primary_delay, secondary_delay=0.0):
+        backend = HedgedTranslationBackend(
+            StubTranslationBackend(delay=primary_delay), StubTranslationBackend(delay=secondary_delay)
+        )
+        for _ in range(backend.latency.min_samples):
+            backend.latency.record(0.01, size=len("Hei"))
+        return backend
+    
+    def test_no_hedge_without_latency_history(self):
+        """Test that nothing is hedged before the primary's p95 is known."""
+        backend = HedgedTranslationBackend(StubTranslationBackend(delay=0.1), StubTranslationBackend())
+        
+        self.assertEqual(backend.translate("Hei", "fi", "en"), "[en] Hei")
+        self.assertEqual(backend.hedges_sent, 0)
+        self.assertEqual(backend.secondary.calls, 0)
+    
+    def test_fast_primary_is_not_hedged(self):
+        """Test that answers within the p95 latency only use the primary."""
+        backend = self.make_backend(primary_delay=0.0)
+        
+        self.assertEqual(backend.translate("Hei", "fi", "en"), "[en] Hei")
+        self.assertEqual(backend.hedges_sent, 0)
+    
+    def test_slow_primary_is_hedged(self):
+        """Test that the secondary answers when the primary passes its p95."""
+        backend = self.make_backend(primary_delay=1.0)
+        backend.secondary = Mock()
+        backend.secondary.translate.return_value = "hedged"
+        
+        self.assertEqual(backend.translate("Hei", "fi", "en"), "hedged")
+        self.assertEqual(backend.hedges_sent, 1)
+        self.assertEqual(backend.hedges_won, 1)
+    
+    def test_failed_hedge_waits_for_primary(self):
+        """Test that a failing secondary does not hide the primary's answer."""
+        backend = self.make_backend(primary_delay=0.2)
+        backend.secondary = Mock()
+        backend.secondary.translate.return_value = None
+        
+        self.assertEqual(backend.translate("Hei", "fi", "en"), "[en] Hei")
+        self.assertEqual(backend.hedges_won, 0)
+
+
+class TestCreateBackend(unittest.TestCase):
+    """Test cases for backend selection."""
+    
+    def test_backend_selected_by_config(self):
+        """Test that config.backend picks the implementation."""
+        self.assertIsInstance(create_backend(TranslationConfig(backend="http")), HttpTranslationBackend)
+        self.assertIsInstance(create_backend(TranslationConfig(backend="argos")), ArgosTranslationBackend)
+        self.assertIsInstance(create_backend(TranslationConfig(backend="stub")), StubTranslationBackend)
+    
+    def test_hedge_url_enables_hedging(self):
+        """Test that a hedge URL wraps two HTTP backends."""
+        backend = create_backend(TranslationConfig(hedge_url="http://backup:5000/translate"))
+        
+        self.assertIsInstance(backend, HedgedTranslationBackend)
+        self.assertEqual(backend.secondary.config.libretranslate_url, "http://backup:5000/translate")
+        self.assertEqual(backend.primary.config.libretranslate_url, "http://localhost:5000/translate")
+    
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with self.assertRaises(ValueError):
+            create_backend(TranslationConfig(backend="carrier-pigeon"))
+
+
+if __name__ == '__main__':
+    unittest.main()
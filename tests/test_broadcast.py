@@ -0,0 +1,110 @@
+"""Unit tests for BroadcastServer."""
+
+import unittest
+import json
+import urllib.request
+from src.core.broadcast import BroadcastServer, ClientBuffer
+from src.core.transcript_index import TranscriptIndex
+from src.config.settings import BroadcastConfig, SearchConfig
+
+
+class TestClientBuffer(unittest.TestCase):
+    """Test cases for ClientBuffer class."""
+    
+    def test_drops_oldest_when_full(self):
+        """Test that a slow client loses the oldest events first."""
+        buffer = ClientBuffer(max_size=2)
+        
+        for i in range(5):
+            buffer.push({"id": i})
+        
+        events = buffer.pop_all(timeout=0)
+        self.assertEqual([e["id"] for e in events], [3, 4])
+        self.assertEqual(buffer.dropped, 3)
+    
+    def test_pop_all_times_out_when_empty(self):
+        """Test waiting on an empty buffer returns nothing."""
+        buffer = ClientBuffer(max_size=2)
+        
+        self.assertEqual(buffer.pop_all(timeout=0.01), [])
+
+
+class TestBroadcastServer(unittest.TestCase):
+    """Test cases for BroadcastServer class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = BroadcastConfig(enabled=True, port=0, client_buffer_size=10)
+        self.server = BroadcastServer(self.config)
+    
+    def test_publish_reaches_all_clients(self):
+        """Test that one published event is queued for every client."""
+        clients = [self.server.add_client() for _ in range(3)]
+        
+        self.server.publish({"translation": "Hello"})
+        
+        for client in clients:
+            events = client.pop_all(timeout=0)
+            self.assertEqual(len(events), 1)
+            self.assertEqual(events[0]["translation"], "Hello")
+            self.assertEqual(events[0]["id"], 1)
+    
+    def test_new_client_receives_latest_event(self):
+        """Test that late joiners are primed with the latest event."""
+        self.server.publish({"translation": "First"})
+        self.server.publish({"translation": "Second"})
+        
+        client = self.server.add_client()
+        
+        events = client.pop_all(timeout=0)
+        self.assertEqual([e["translation"] for e in events], ["Second"])
+    
+    def test_remove_client(self):
+        """Test that removed clients no longer receive events."""
+        client = self.server.add_client()
+        self.server.remove_client(client)
+        
+        self.server.publish({"translation": "Hello"})
+        
+        self.assertEqual(client.pop_all(timeout=0), [])
+    
+    def test_sse_stream_over_http(self):
+        """Test that events are delivered over the SSE endpoint."""
+        self.server.start()
+        try:
+            host, port = self.server.address
+            self.server.publish({"translation": "Hei"})
+            
+            with urllib.request.urlopen(f"http://{host}:{port}/events", timeout=5) as response:
+                self.assertEqual(response.headers["Content-Type"], "text/event-stream")
+                lines = [response.readline().decode("utf-8") for _ in range(3)]
+            
+            self.assertEqual(lines[0], "id: 1\n")
+            self.assertEqual(lines[1], "event: translation\n")
+            self.assertEqual(json.loads(lines[2][len("data: "):])["translation"], "Hei")
+        finally:
+            self.server.stop()
+    
+    def test_search_over_http(self):
+        """Test that /search returns matching segments with timestamp and speaker."""
+        index = TranscriptIndex(SearchConfig(enabled=True))
+        index.add(100.0, "Speaker A", "Budjetti on tiukka", {"en": "The budget is tight"})
+        index.add(200.0, "Speaker B", "Kiitos", {"en": "Thanks"})
+        server = BroadcastServer(self.config, index)
+        server.start()
+        try:
+            host, port = server.address
+            with urllib.request.urlopen(f"http://{host}:{port}/search?q=budg", timeout=5) as response:
+                payload = json.loads(response.read())
+        finally:
+            server.stop()
+        
+        self.assertEqual(payload["query"], "budg")
+        self.assertEqual(len(payload["results"]), 1)
+        self.assertEqual(payload["results"][0]["speaker"], "Speaker A")
+        self.assertEqual(payload["results"][0]["timestamp"], 100.0)
+        self.assertEqual(payload["results"][0]["translations"], {"en": "The budget is tight"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Unit tests for long text chunking."""
+
+import unittest
+from src.core.chunking import split_text, split_chunks
+
+
+class TestSplitText(unittest.TestCase):
+    """Test cases for split_text."""
+    
+    def test_short_text_is_one_chunk(self):
+        """Test that text within the limit is returned whole."""
+        self.assertEqual(split_text("  Hyvää huomenta.  ", 100), ["Hyvää huomenta."])
+        self.assertEqual(split_text("   ", 100), [])
+    
+    def test_splits_at_sentence_ends(self):
+        """Test that sentences are packed into chunks under the limit."""
+        text = "First sentence here. Second one follows! Third is a question? Fourth ends it."
+        chunks = split_text(text, 45)
+        self.assertEqual(chunks, [
+            "First sentence here. Second one follows!",
+            "Third is a question? Fourth ends it."
+        ])
+    
+    def test_long_sentence_splits_at_clauses(self):
+        """Test that a sentence over the limit is cut at clause breaks first."""
+        text = "we went through the budget, then the schedule; after that the testing plan"
+        chunks = split_text(text, 30)
+        self.assertEqual(chunks, ["we went through the budget,", "then the schedule;", "after that the testing plan"])
+    
+    def test_unpunctuated_text_splits_between_words(self):
+        """Test that captions without punctuation are cut between words."""
+        words = ["sana"] * 50
+        chunks = split_text(" ".join(words), 24)
+        self.assertTrue(all(len(chunk) <= 24 for chunk in chunks))
+        self.assertEqual(" ".join(chunks).split(), words)
+    
+    def test_overlong_word_is_cut(self):
+        """Test that a single word over the limit is cut into pieces."""
+        self.assertEqual(split_text("a" * 25, 10), ["a" * 10, "a" * 10, "a" * 5])
+    
+    def test_cut_word_is_joined_without_spaces(self):
+        """Test that the pieces of a cut word are not separated by spaces."""
+        url = "https://example.com/" + "x" * 30
+        chunks = split_chunks(f"Katso {url} nyt", 20)
+        
+        self.assertEqual([separator for separator, _ in chunks], ["", " ", "", ""])
+        self.assertEqual(chunks[-1], ("", "x" * 10 + " nyt"))
+        self.assertEqual("".join(separator + chunk for separator, chunk in chunks), f"Katso {url} nyt")
+    
+    def test_chunks_preserve_text_order(self):
+        """Test that joining the chunks gives back the text's words in order."""
+        text = " ".join(f"Lause numero {index}, jossa on sivulause." for index in range(200))
+        chunks = split_text(text, 120)
+        self.assertTrue(all(len(chunk) <= 120 for chunk in chunks))
+        self.assertEqual(" ".join(chunks), text)
+    
+    def test_invalid_limit(self):
+        """Test that a non-positive limit is rejected."""
+        with self.assertRaises(ValueError):
+            split_text("text", 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""Unit tests for the clocks."""
+
+import time
+import unittest
+from src.utils.clock import SystemClock, VirtualClock
+
+
+class TestSystemClock(unittest.TestCase):
+    """Test cases for SystemClock."""
+    
+    def test_follows_wall_clock(self):
+        """Test that the system clock reports real time."""
+        clock = SystemClock()
+        
+        self.assertFalse(clock.virtual)
+        self.assertAlmostEqual(clock.time(), time.time(), delta=1.0)
+        self.assertLessEqual(clock.monotonic(), time.monotonic())
+
+
+class TestVirtualClock(unittest.TestCase):
+    """Test cases for VirtualClock."""
+    
+    def test_sleep_advances_without_blocking(self):
+        """Test that an hour of sleeping returns immediately."""
+        clock = VirtualClock(start=1000.0)
+        
+        started = time.perf_counter()
+        for _ in range(3600):
+            clock.sleep(1.0)
+        
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(clock.time(), 4600.0)
+        self.assertEqual(clock.monotonic(), 3600.0)
+    
+    def test_timers_run_in_due_order(self):
+        """Test that call_later callbacks run as the clock passes them."""
+        clock = VirtualClock()
+        fired = []
+        clock.call_later(2.0, lambda: fired.append(("b", clock.monotonic())))
+        clock.call_later(1.0, lambda: fired.append(("a", clock.monotonic())))
+        clock.call_later(5.0, lambda: fired.append(("c", clock.monotonic())))
+        
+        clock.advance(3.0)
+        
+        self.assertEqual(fired, [("a", 1.0), ("b", 2.0)])
+        self.assertEqual(clock.monotonic(), 3.0)
+        self.assertEqual(clock.pending_timers, 1)
+    
+    def test_rescheduling_timer_repeats(self):
+        """Test that a timer scheduling itself again fires once per interval."""
+        clock = VirtualClock()
+        ticks = []
+        
+        def tick():
+            ticks.append(clock.monotonic())
+            clock.call_later(0.5, tick)
+        
+        clock.call_later(0.5, tick)
+        clock.advance(2.0)
+        
+        self.assertEqual(ticks, [0.5, 1.0, 1.5, 2.0])
+    
+    def test_negative_advance_is_ignored(self):
+        """Test that time never goes backwards."""
+        clock = VirtualClock()
+        clock.advance(1.0)
+        clock.advance(-5.0)
+        
+        self.assertEqual(clock.monotonic(), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
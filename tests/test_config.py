@@ -4,7 +4,7 @@ import unittest
 import json
 import tempfile
 import os
-from src.config.settings import AppConfig, TranslationConfig, UIConfig, CaptureConfig
+from src.config.settings import AppConfig, TranslationConfig, UIConfig, CaptureConfig, BroadcastConfig, ExportConfig, SearchConfig, ProxyConfig, TracingConfig
 
 
 class TestAppConfig(unittest.TestCase):
@@ -236,12 +236,44 @@ class TestTranslationConfig(unittest.TestCase):
         """Test default configuration values."""
         config = TranslationConfig()
         
+        self.assertEqual(config.backend, "http")
         self.assertEqual(config.libretranslate_url, "http://localhost:5000/translate")
         self.assertEqual(config.api_key, "")
         self.assertEqual(config.source_language, "fi")
         self.assertEqual(config.target_language, "en")
+        self.assertEqual(config.additional_target_languages, [])
         self.assertEqual(config.rate_delay, 1.0)
         self.assertEqual(config.translate_always_after, 5.0)
+        self.assertEqual(config.speculative_debounce, 0.0)
+        self.assertEqual(config.max_requests_per_second, 5.0)
+        self.assertEqual(config.request_burst, 10)
+        self.assertEqual(config.worker_processes, 0)
+        self.assertTrue(config.warm_up)
+        self.assertEqual(config.fuzzy_match_threshold, 0.0)
+        self.assertEqual(config.translation_memory_size, 5000)
+        self.assertEqual(config.translation_cache_size, 10000)
+        self.assertEqual(config.phrase_table_dir, "phrases")
+        self.assertFalse(config.detect_language)
+        self.assertEqual(config.request_timeout, 10.0)
+        self.assertEqual(config.timeout_p99_multiplier, 3.0)
+        self.assertEqual(config.min_request_timeout, 1.0)
+        self.assertEqual(config.hedge_url, "")
+        self.assertEqual(config.max_chunk_chars, 1000)
+    
+    def test_get_target_languages(self):
+        """Test that the primary target comes first and duplicates are removed."""
+        config = TranslationConfig(target_language="en", additional_target_languages=["sv", "en", "de"])
+        
+        self.assertEqual(config.get_target_languages(), ["en", "sv", "de"])
+    
+    def test_scheduler_workers_cover_worker_processes(self):
+        """Test that the scheduler runs at least one job per engine worker process."""
+        self.assertEqual(TranslationConfig(scheduler_workers=2).get_scheduler_workers(), 2)
+        self.assertEqual(TranslationConfig(backend="argos", worker_processes=6).get_scheduler_workers(), 6)
+        self.assertEqual(TranslationConfig(backend="argos", scheduler_workers=8,
+                                           worker_processes=4).get_scheduler_workers(), 8)
+        # The HTTP backend does not use worker processes
+        self.assertEqual(TranslationConfig(worker_processes=6).get_scheduler_workers(), 2)
 
 
 class TestUIConfig(unittest.TestCase):
@@ -270,6 +302,89 @@ class TestCaptureConfig(unittest.TestCase):
         self.assertEqual(config.split_marker, "Jussi Rasku (TAU)")
         self.assertEqual(config.clipboard_delay, 0.5)
         self.assertEqual(config.selection_delay, 0.2)
+        self.assertEqual(config.max_translated_lines, 10000)
+
+
+class TestBroadcastConfig(unittest.TestCase):
+    """Test cases for BroadcastConfig."""
+    
+    def test_default_values(self):
+        """Test default configuration values."""
+        config = BroadcastConfig()
+        
+        self.assertFalse(config.enabled)
+        self.assertFalse(config.headless)
+        self.assertEqual(config.host, "127.0.0.1")
+        self.assertEqual(config.port, 8765)
+        self.assertEqual(config.client_buffer_size, 100)
+
+
+class TestExportConfig(unittest.TestCase):
+    """Test cases for ExportConfig."""
+    
+    def test_default_values(self):
+        """Test default configuration values."""
+        config = ExportConfig()
+        
+        self.assertFalse(config.enabled)
+        self.assertEqual(config.path, "transcript.jsonl")
+        self.assertEqual(config.format, "")
+        self.assertEqual(config.flush_interval, 1.0)
+        self.assertEqual(config.flush_size, 50)
+
+
+class TestSearchConfig(unittest.TestCase):
+    """Test cases for SearchConfig."""
+    
+    def test_default_values(self):
+        """Test default configuration values."""
+        config = SearchConfig()
+        
+        self.assertFalse(config.enabled)
+        self.assertEqual(config.max_segments, 5000)
+        self.assertEqual(config.spill_path, "")
+    
+    def test_from_dict(self):
+        """Test loading the search section."""
+        config = AppConfig.from_dict({"search": {"enabled": True, "max_segments": 100}})
+        
+        self.assertTrue(config.search.enabled)
+        self.assertEqual(config.search.max_segments, 100)
+
+
+class TestProxyConfig(unittest.TestCase):
+    """Test cases for ProxyConfig."""
+    
+    def test_default_values(self):
+        """Test default configuration values."""
+        config = ProxyConfig()
+        
+        self.assertEqual(config.host, "127.0.0.1")
+        self.assertEqual(config.port, 5001)
+        self.assertEqual(config.cache_size, 50000)
+        self.assertEqual(config.upstream_connections, 16)
+        self.assertEqual(config.upstream_requests_per_second, 0.0)
+
+
+class TestTracingConfig(unittest.TestCase):
+    """Test cases for TracingConfig."""
+    
+    def test_default_values(self):
+        """Test default configuration values."""
+        config = TracingConfig()
+        
+        self.assertFalse(config.enabled)
+        self.assertEqual(config.path, "traces/captions.json")
+        self.assertEqual(config.sample_rate, 1.0)
+        self.assertEqual(config.max_events_per_file, 100000)
+        self.assertEqual(config.backups, 3)
+    
+    def test_from_dict(self):
+        """Test loading the tracing section."""
+        config = AppConfig.from_dict({"tracing": {"enabled": True, "sample_rate": 0.1}})
+        
+        self.assertTrue(config.tracing.enabled)
+        self.assertEqual(config.tracing.sample_rate, 0.1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,122 @@
+"""Unit tests for TranslationDisplayWindow."""
+
+import unittest
+from unittest.mock import Mock
+from src.ui.display_window import TranslationDisplayWindow
+from src.core.translator import SequencedTranslation
+from src.config.settings import UIConfig
+from src.utils.clock import VirtualClock
+
+
+class TestTranslationDisplayWindow(unittest.TestCase):
+    """Test cases for TranslationDisplayWindow class."""
+    
+    def setUp(self):
+        """Set up test fixtures without creating a Tk window."""
+        self.window = TranslationDisplayWindow(UIConfig())
+        self.window.label = Mock()
+    
+    def test_show_update_displays_newer_results(self):
+        """Test that results are shown in sequence order."""
+        self.assertTrue(self.window.show_update(SequencedTranslation(1, "Hei", {"en": "Hi"})))
+        self.assertTrue(self.window.show_update(SequencedTranslation(2, "Moi", {"en": "Hello"})))
+        
+        self.window.label.config.assert_called_with(text="Hello")
+        self.assertEqual(self.window.displayed_seq, 2)
+    
+    def test_show_update_drops_stale_results(self):
+        """Test that a late response for an older segment does not overwrite a newer one."""
+        self.window.show_update(SequencedTranslation(5, "Uusi", {"en": "New"}))
+        stale = SequencedTranslation(3, "Vanha", {"en": "Old"})
+        
+        self.assertFalse(self.window.show_update(stale))
+        
+        self.window.label.config.assert_called_once_with(text="New")
+        self.assertEqual(self.window.stale_updates_dropped, 1)
+        self.assertIn(stale, self.window.history)
+    
+    def test_same_sequence_replaces_in_place(self):
+        """Test that a refinement of the displayed segment is shown."""
+        self.window.show_update(SequencedTranslation(4, "Hei", {"en": "Hey"}, provisional=True))
+        
+        self.assertTrue(self.window.show_update(SequencedTranslation(4, "Hei", {"en": "Hi"})))
+        self.window.label.config.assert_called_with(text="Hi")
+    
+    def test_unsequenced_text_always_shown(self):
+        """Test that plain text such as the countdown is always displayed."""
+        self.window.show_update(SequencedTranslation(9, "Hei", {"en": "Hi"}))
+        
+        self.window.update_text("Starting translation...")
+        
+        self.window.label.config.assert_called_with(text="Starting translation...")
+        self.assertEqual(self.window.stale_updates_dropped, 0)
+
+    
+    def test_progressive_display_mutes_provisional_text(self):
+        """Test that provisional text is muted and replaced in place by the final translation."""
+        window = TranslationDisplayWindow(UIConfig(progressive_display=True, provisional_color="gray50"))
+        window.label = Mock()
+        
+        window.show_update(SequencedTranslation(3, "Hei", {"en": "Hei"}, provisional=True))
+        window.label.config.assert_called_with(text="Hei", fg="gray50")
+        
+        window.show_update(SequencedTranslation(3, "Hei", {"en": "Hi"}))
+        window.label.config.assert_called_with(text="Hi", fg="black")
+    
+    def test_segment_timings(self):
+        """Test that time to first display and to the final translation are recorded."""
+        clock = VirtualClock(start=100.0)
+        window = TranslationDisplayWindow(UIConfig(progressive_display=True), clock=clock)
+        window.label = Mock()
+        
+        window.mark_captured(1)
+        clock.advance(0.05)
+        window.show_update(SequencedTranslation(1, "Hei", {"en": "Hei"}, provisional=True))
+        clock.advance(0.5)
+        window.show_update(SequencedTranslation(1, "Hei", {"en": "Hi"}))
+        
+        timing = window.timings[1]
+        self.assertAlmostEqual(timing.time_to_first_display, 0.05)
+        self.assertAlmostEqual(timing.time_to_final, 0.55)
+        summary = window.timing_summary()
+        self.assertAlmostEqual(summary["median_time_to_first_display"], 0.05)
+        self.assertAlmostEqual(summary["max_time_to_final"], 0.55)
+    
+    def test_stale_final_translation_is_timed(self):
+        """Test that a final translation kept off the display still records its arrival."""
+        clock = VirtualClock()
+        window = TranslationDisplayWindow(UIConfig(), clock=clock)
+        window.label = Mock()
+        window.mark_captured(1)
+        window.mark_captured(2)
+        window.show_update(SequencedTranslation(2, "Moi", {"en": "Hello"}))
+        
+        clock.advance(1.0)
+        window.show_update(SequencedTranslation(1, "Hei", {"en": "Hi"}))
+        
+        self.assertIsNone(window.timings[1].first_display_at)
+        self.assertEqual(window.timings[1].time_to_final, 1.0)
+    
+    def test_countdown_and_updates_on_virtual_clock(self):
+        """Test that the countdown and update loop run on a virtual clock without Tk timers."""
+        clock = VirtualClock()
+        updates = iter([SequencedTranslation(1, "Hei", {"en": "Hi"}), None, None])
+        window = TranslationDisplayWindow(UIConfig(), lambda: next(updates, None), clock)
+        window.label = Mock()
+        window.root = Mock()
+        
+        window.start_countdown(3, lambda: window.start_translation_updates(500))
+        clock.advance(2.5)
+        window.label.config.assert_called_with(text="Starting in 1 seconds...")
+        
+        clock.advance(0.5)
+        window.label.config.assert_called_with(text="Hi")
+        clock.advance(60)
+        
+        window.root.after.assert_not_called()
+        self.assertEqual(window.displayed_seq, 1)
+        self.assertEqual(clock.pending_timers, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
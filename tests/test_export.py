@@ -0,0 +1,127 @@
+"""Unit tests for the transcript export sink."""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from src.core.export import ExportRecord, TranscriptExporter, format_timestamp, make_record
+from src.config.settings import ExportConfig
+
+
+def make_exporter(path, **kwargs):
+    config = ExportConfig(enabled=True, path=path, **kwargs)
+    return TranscriptExporter(config, subtitle_language="en")
+
+
+class TestTranscriptExporter(unittest.TestCase):
+    """Test cases for TranscriptExporter class."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+    
+    def read(self, name):
+        with open(self.path(name), encoding="utf-8") as f:
+            return f.read()
+    
+    def record(self, timestamp, translation, target_language="en"):
+        return ExportRecord(timestamp=timestamp, speaker="Speaker", source_text="Hyvää huomenta",
+                            translation=translation, target_language=target_language, latency=0.25, seq=3)
+    
+    def test_jsonl_records(self):
+        """Test that JSONL output holds one complete record per line."""
+        exporter = make_exporter(self.path("transcript.jsonl"))
+        exporter.start()
+        exporter.write(self.record(100.0, "Good morning"))
+        exporter.write(self.record(101.0, "God morgon", "sv"))
+        exporter.close()
+        
+        records = [json.loads(line) for line in self.read("transcript.jsonl").splitlines()]
+        self.assertEqual([r["target_language"] for r in records], ["en", "sv"])
+        self.assertEqual(records[0]["translation"], "Good morning")
+        self.assertEqual(records[0]["latency"], 0.25)
+        self.assertEqual(exporter.records_written, 2)
+    
+    def test_buffered_until_flush_trigger(self):
+        """Test that records are written in the background once the size trigger is hit."""
+        exporter = make_exporter(self.path("transcript.jsonl"), flush_interval=60.0, flush_size=2)
+        exporter.start()
+        exporter.write(self.record(100.0, "one"))
+        time.sleep(0.05)
+        self.assertFalse(os.path.exists(self.path("transcript.jsonl")))
+        
+        exporter.write(self.record(101.0, "two"))
+        deadline = time.time() + 5
+        while exporter.records_written < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        
+        self.assertEqual(len(self.read("transcript.jsonl").splitlines()), 2)
+        exporter.close()
+    
+    def test_srt_cues(self):
+        """Test SRT numbering and timing relative to the first record."""
+        exporter = make_exporter(self.path("transcript.srt"))
+        exporter.start()
+        exporter.write(self.record(100.0, "Good morning"))
+        exporter.write(self.record(102.5, "God morgon", "sv"))
+        exporter.write(self.record(103.0, "Let's begin"))
+        exporter.close()
+        
+        self.assertEqual(
+            self.read("transcript.srt"),
+            "1\n00:00:00,000 --> 00:00:01,500\nSpeaker: Good morning\n\n"
+            "2\n00:00:03,000 --> 00:00:04,500\nSpeaker: Let's begin\n\n"
+        )
+    
+    def test_webvtt_append_continues_cues(self):
+        """Test that appending to an existing WebVTT file keeps one header and continues the cues."""
+        for timestamp in (100.0, 200.0):
+            exporter = make_exporter(self.path("transcript.vtt"))
+            exporter.start()
+            exporter.write(self.record(timestamp, "Good morning"))
+            exporter.write(self.record(timestamp + 2.0, "Let's begin"))
+            exporter.close()
+        
+        content = self.read("transcript.vtt")
+        self.assertTrue(content.startswith("WEBVTT\n\n1\n00:00:00.000 --> 00:00:01.500\n<v Speaker>Good morning"))
+        self.assertEqual(content.count("WEBVTT"), 1)
+        self.assertIn("3\n00:00:03.500 --> 00:00:05.000\n<v Speaker>Good morning", content)
+        self.assertIn("4\n00:00:05.500 --> 00:00:07.000\n<v Speaker>Let's begin", content)
+    
+    def test_srt_append_continues_cues(self):
+        """Test that appending to an existing SRT file continues numbering and timing."""
+        with open(self.path("transcript.srt"), "w", encoding="utf-8") as f:
+            f.write("7\n00:10:00,000 --> 00:10:02,000\nSpeaker: Earlier\n\n")
+        exporter = make_exporter(self.path("transcript.srt"))
+        exporter.start()
+        exporter.write(self.record(100.0, "Good morning"))
+        exporter.close()
+        
+        self.assertTrue(self.read("transcript.srt").endswith(
+            "8\n00:10:02,000 --> 00:10:03,500\nSpeaker: Good morning\n\n"
+        ))
+    
+    def test_format_resolution(self):
+        """Test format inference from the extension and rejection of unknown formats."""
+        self.assertEqual(TranscriptExporter.resolve_format("out.srt"), "srt")
+        self.assertEqual(TranscriptExporter.resolve_format("out.txt", "webvtt"), "vtt")
+        self.assertEqual(TranscriptExporter.resolve_format("out"), "jsonl")
+        with self.assertRaises(ValueError):
+            TranscriptExporter.resolve_format("out.txt")
+    
+    def test_helpers(self):
+        """Test timestamp formatting and record latency."""
+        self.assertEqual(format_timestamp(3723.456, ","), "01:02:03,456")
+        record = make_record("Speaker", "Hei", "Hi", "en", seq=1, captured_at=time.time() - 1)
+        self.assertGreaterEqual(record.latency, 1.0)
+        self.assertIsNone(make_record("Speaker", "Hei", "Hi", "en").latency)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Unit tests for offline transcript translation."""
+
+import json
+import os
+import tempfile
+import unittest
+from src.core.backends import StubTranslationBackend
+from src.core.file_translation import FileTranslator
+from src.core.translator import TranslationService
+from src.config.settings import TranslationConfig
+
+
+class FailingAfterBackend(StubTranslationBackend):
+    """Stub that fails every request after the first few."""
+    
+    def __init__(self, succeed):
+        super().__init__()
+        self.succeed = succeed
+    
+    def translate(self, text, source_lang, target_lang):
+        if text.startswith("segment") and int(text.split()[1]) >= self.succeed:
+            return None
+        return super().translate(text, source_lang, target_lang)
+
+
+class TestFileTranslator(unittest.TestCase):
+    """Test cases for FileTranslator class."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.directory.name, "meeting.txt")
+        with open(self.input, "w", encoding="utf-8") as f:
+            f.write("Close caption has started.\n")
+            for i in range(10):
+                f.write(f"Speaker\nsegment {i}\n")
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def make_translator(self, backend):
+        service = TranslationService(TranslationConfig(), backend=backend)
+        return FileTranslator(service, "Speaker", batch_size=3)
+    
+    def test_translates_all_segments(self):
+        """Test transcript output with the marker before each translation."""
+        output = os.path.join(self.directory.name, "meeting.en.txt")
+        progress = []
+        
+        result = self.make_translator(StubTranslationBackend()).translate_file(
+            self.input, output, progress=progress.append
+        )
+        
+        self.assertEqual(result.segments_translated, 10)
+        self.assertFalse(result.failed)
+        self.assertEqual(progress, [3, 6, 9, 10])
+        with open(output, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[:4], ["Speaker", "[en] segment 0", "Speaker", "[en] segment 1"])
+        self.assertFalse(os.path.exists(FileTranslator.checkpoint_path(output)))
+    
+    def test_resume_after_failure(self):
+        """Test that a rerun continues after the last translated segment."""
+        output = os.path.join(self.directory.name, "meeting.jsonl")
+        
+        failed = self.make_translator(FailingAfterBackend(succeed=4)).translate_file(self.input, output)
+        self.assertTrue(failed.failed)
+        self.assertEqual(failed.segments_translated, 4)
+        self.assertTrue(os.path.exists(FileTranslator.checkpoint_path(output)))
+        
+        backend = StubTranslationBackend()
+        resumed = self.make_translator(backend).translate_file(self.input, output)
+        
+        self.assertEqual(resumed.segments_skipped, 4)
+        self.assertEqual(resumed.segments_translated, 6)
+        self.assertEqual(backend.calls, 6)
+        with open(output, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r["index"] for r in records], list(range(10)))
+        self.assertEqual(records[9]["translation"], "[en] segment 9")
+    
+    def test_restart_ignores_checkpoint(self):
+        """Test that resume=False translates everything again."""
+        output = os.path.join(self.directory.name, "meeting.jsonl")
+        self.make_translator(FailingAfterBackend(succeed=4)).translate_file(self.input, output)
+        
+        backend = StubTranslationBackend()
+        result = self.make_translator(backend).translate_file(self.input, output, resume=False)
+        
+        self.assertEqual(result.segments_skipped, 0)
+        self.assertEqual(backend.calls, 10)
+    
+    def test_resume_with_multibyte_text(self):
+        """Test that the checkpointed output offset counts bytes, not characters."""
+        with open(self.input, "w", encoding="utf-8") as f:
+            f.write("Muistiinpanot\n")
+            for i in range(10):
+                f.write(f"Speaker\nsegment {i} hyvää päivää\n")
+        output = os.path.join(self.directory.name, "meeting.en.txt")
+        
+        self.make_translator(FailingAfterBackend(succeed=4)).translate_file(self.input, output)
+        with open(FileTranslator.checkpoint_path(output), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["output_bytes"], os.path.getsize(output))
+        self.make_translator(StubTranslationBackend()).translate_file(self.input, output)
+        
+        with open(output, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[1::2], [f"[en] segment {i} hyvää päivää" for i in range(10)])
+        self.assertEqual(lines[::2], ["Speaker"] * 10)
+    
+    def test_empty_transcript(self):
+        """Test that a transcript without segments gives an empty output."""
+        empty = os.path.join(self.directory.name, "empty.txt")
+        open(empty, "w", encoding="utf-8").close()
+        output = os.path.join(self.directory.name, "empty.en.txt")
+        
+        result = self.make_translator(StubTranslationBackend()).translate_file(empty, output)
+        
+        self.assertEqual(result.segments_translated, 0)
+        self.assertFalse(result.failed)
+        self.assertEqual(os.path.getsize(output), 0)
+        self.assertFalse(os.path.exists(FileTranslator.checkpoint_path(output)))
+
+
+if __name__ == '__main__':
+    unittest.main()
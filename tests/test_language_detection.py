@@ -0,0 +1,88 @@
+"""Unit tests for local language detection."""
+
+import unittest
+from unittest.mock import Mock
+from src.core.backends import StubTranslationBackend
+from src.core.language_detection import LanguageDetector
+from src.core.translator import TranslationService
+from src.config.settings import TranslationConfig
+
+
+class TestLanguageDetector(unittest.TestCase):
+    """Test cases for LanguageDetector class."""
+    
+    def setUp(self):
+        self.detector = LanguageDetector()
+    
+    def test_detects_bundled_languages(self):
+        """Test identification of typical meeting sentences."""
+        samples = {
+            "fi": "Meidän täytyy sopia seuraavasta palaverista",
+            "en": "I think we should move on to the next item",
+            "sv": "Vi ses nästa vecka då",
+            "de": "Ich habe eine Frage zu dem Bericht",
+            "fr": "Je vais partager mon écran maintenant",
+            "es": "Vamos a revisar el informe mañana",
+        }
+        for language, text in samples.items():
+            with self.subTest(language=language):
+                self.assertEqual(self.detector.detect(text, expected="fi").language, language)
+    
+    def test_short_text_is_undecided(self):
+        """Test that captions too short to judge are left alone."""
+        self.assertIsNone(self.detector.detect("Kiitos", expected="fi"))
+        self.assertIsNone(self.detector.detect("", expected="fi"))
+    
+    def test_restricted_languages(self):
+        """Test limiting the detector to some of the bundled profiles."""
+        detector = LanguageDetector(languages=["fi", "en"])
+        
+        self.assertEqual(detector.languages, ["fi", "en"])
+
+
+class TestLanguageRouting(unittest.TestCase):
+    """Test cases for language routing in TranslationService."""
+    
+    def setUp(self):
+        self.backend = StubTranslationBackend()
+        self.service = TranslationService(
+            TranslationConfig(source_language="fi", target_language="en", detect_language=True),
+            backend=self.backend
+        )
+    
+    def test_target_language_passes_through(self):
+        """Test that text already in the target language is not sent to the backend."""
+        text = "Can you all see my screen now?"
+        
+        self.assertEqual(self.service.translate(text), text)
+        self.assertEqual(self.backend.calls, 0)
+        self.assertEqual(self.service.passed_through, 1)
+    
+    def test_other_language_is_rerouted(self):
+        """Test that text in a third language is translated from that language."""
+        backend = Mock()
+        backend.translate.return_value = "I have a question about the report"
+        self.service.backend = backend
+        
+        self.service.translate("Ich habe eine Frage zu dem Bericht")
+        
+        backend.translate.assert_called_once_with("Ich habe eine Frage zu dem Bericht", "de", "en")
+        self.assertEqual(self.service.rerouted, 1)
+    
+    def test_falls_back_to_configured_pair(self):
+        """Test that a failed rerouted request is retried with the configured source."""
+        backend = Mock()
+        backend.translate.side_effect = [None, "translated"]
+        self.service.backend = backend
+        
+        self.assertEqual(self.service.translate("Ich habe eine Frage zu dem Bericht"), "translated")
+        self.assertEqual(backend.translate.call_args[0][1], "fi")
+    
+    def test_source_language_is_translated(self):
+        """Test that source language text goes to the backend as before."""
+        self.assertEqual(self.service.translate("Meidän täytyy sopia palaverista"),
+                         "[en] Meidän täytyy sopia palaverista")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Unit tests for LatencyTracker."""
+
+import unittest
+from src.core.latency import LatencyTracker
+
+
+class TestLatencyTracker(unittest.TestCase):
+    """Test cases for LatencyTracker class."""
+    
+    def test_default_until_enough_samples(self):
+        """Test that the default timeout applies before min_samples latencies."""
+        tracker = LatencyTracker(min_samples=5)
+        for _ in range(4):
+            tracker.record(0.1)
+        
+        self.assertIsNone(tracker.percentile(99))
+        self.assertEqual(tracker.timeout(10.0), 10.0)
+    
+    def test_percentiles(self):
+        """Test nearest-rank percentiles over the window."""
+        tracker = LatencyTracker(window=100, min_samples=1)
+        for ms in range(1, 101):
+            tracker.record(ms / 1000)
+        
+        self.assertEqual(tracker.percentile(50), 0.05)
+        self.assertEqual(tracker.percentile(95), 0.095)
+        self.assertEqual(tracker.percentile(99), 0.099)
+    
+    def test_timeout_floor_and_cap(self):
+        """Test that the derived timeout is a p99 multiple within bounds."""
+        tracker = LatencyTracker(min_samples=1)
+        tracker.record(0.8)
+        self.assertAlmostEqual(tracker.timeout(10.0, multiplier=3.0), 2.4)
+        self.assertEqual(tracker.timeout(10.0, multiplier=0), 10.0)
+        
+        fast = LatencyTracker(min_samples=1)
+        fast.record(0.01)
+        self.assertEqual(fast.timeout(10.0, floor=1.0), 1.0)
+        
+        slow = LatencyTracker(min_samples=1)
+        slow.record(8.0)
+        self.assertEqual(slow.timeout(10.0), 10.0)
+    
+    def test_timeouts_by_size_class(self):
+        """Test that sized latencies only set the timeout of requests of similar length."""
+        tracker = LatencyTracker(min_samples=5)
+        for _ in range(5):
+            tracker.record(0.1, size=40)
+        
+        self.assertEqual(tracker.timeout(10.0, size=60), 1.0)
+        self.assertEqual(tracker.timeout(10.0, size=1000), 10.0)
+        self.assertEqual(tracker.percentile(99), 0.1)
+        
+        for _ in range(5):
+            tracker.record(2.0, size=900)
+        self.assertEqual(tracker.timeout(10.0, size=1000), 6.0)
+        self.assertEqual(tracker.timeout(10.0, size=60), 1.0)
+    
+    def test_window_is_rolling(self):
+        """Test that old latencies fall out of the window."""
+        tracker = LatencyTracker(window=3, min_samples=1)
+        for seconds in (5.0, 5.0, 5.0, 0.1, 0.1, 0.1):
+            tracker.record(seconds)
+        
+        self.assertEqual(len(tracker), 3)
+        self.assertEqual(tracker.percentile(99), 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
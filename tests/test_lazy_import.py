@@ -0,0 +1,72 @@
+"""Unit tests for LazyModule and StartupTrace."""
+
+import sys
+import unittest
+from src.utils.lazy_import import LazyModule
+from src.utils.startup_trace import StartupTrace
+
+
+class TestLazyModule(unittest.TestCase):
+    """Test cases for LazyModule class."""
+    
+    def test_import_deferred_until_attribute_access(self):
+        """Test that the module is only imported when first used."""
+        sys.modules.pop("colorsys", None)
+        lazy = LazyModule("colorsys")
+        
+        self.assertFalse(lazy.is_loaded)
+        self.assertNotIn("colorsys", sys.modules)
+        
+        self.assertEqual(lazy.rgb_to_hsv(0, 0, 0), (0.0, 0.0, 0.0))
+        self.assertTrue(lazy.is_loaded)
+        self.assertIn("colorsys", sys.modules)
+    
+    def test_attribute_override(self):
+        """Test that attributes set on the proxy shadow the module (as used by mock.patch)."""
+        lazy = LazyModule("json")
+        lazy.dumps = lambda obj: "patched"
+        
+        self.assertEqual(lazy.dumps({}), "patched")
+        
+        del lazy.dumps
+        self.assertEqual(lazy.dumps({}), "{}")
+    
+    def test_missing_module(self):
+        """Test that import errors surface on first use."""
+        lazy = LazyModule("module_that_does_not_exist")
+        
+        with self.assertRaises(ImportError):
+            lazy.anything
+
+
+class TestStartupTrace(unittest.TestCase):
+    """Test cases for StartupTrace class."""
+    
+    def test_phases_recorded_in_report(self):
+        """Test that timed phases appear in the report."""
+        trace = StartupTrace(enabled=True)
+        
+        with trace.phase("first"):
+            pass
+        result = trace.timed("second", lambda x: x * 2)(21)
+        
+        self.assertEqual(result, 42)
+        self.assertEqual([p.name for p in trace.phases], ["first", "second"])
+        report = trace.report()
+        self.assertIn("first", report)
+        self.assertIn("second", report)
+        self.assertIn("total", report)
+    
+    def test_phase_recorded_on_exception(self):
+        """Test that a failing phase is still recorded."""
+        trace = StartupTrace()
+        
+        with self.assertRaises(ValueError):
+            with trace.phase("failing"):
+                raise ValueError("boom")
+        
+        self.assertEqual(trace.phases[0].name, "failing")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""Unit tests for the load generator and the stub LibreTranslate server."""
+
+import io
+import unittest
+from contextlib import redirect_stderr
+from dataclasses import replace
+from src.config.settings import TranslationConfig
+from src.core.translator import HttpTranslationBackend
+from src.tools.loadgen import RecordedMeeting, LoadStep, LoadClient, run_load, format_report, main
+from src.tools.soak import SimulatedMeeting, SPEAKER
+from src.tools.stub_server import StubLibreTranslateServer
+
+
+class TestStubLibreTranslateServer(unittest.TestCase):
+    """Test cases for StubLibreTranslateServer class."""
+    
+    def setUp(self):
+        """Start a stub server."""
+        self.server = StubLibreTranslateServer(latency=0.0).start()
+        self.config = replace(TranslationConfig(), libretranslate_url=self.server.url)
+    
+    def tearDown(self):
+        self.server.stop()
+    
+    def test_translate_and_languages(self):
+        """Test that the stub answers like LibreTranslate."""
+        backend = HttpTranslationBackend(self.config)
+        
+        self.assertEqual(backend.translate("Hei", "fi", "en"), "[en] Hei")
+        self.assertTrue(backend.is_available())
+        self.assertIn("en", [language["code"] for language in backend.get_languages()])
+        self.assertEqual(self.server.requests_served, 1)
+    
+    def test_injected_errors(self):
+        """Test that error_rate makes translations fail."""
+        self.server.error_rate = 1.0
+        
+        self.assertIsNone(HttpTranslationBackend(self.config).translate("Hei", "fi", "en"))
+
+
+class TestRecordedMeeting(unittest.TestCase):
+    """Test cases for RecordedMeeting class."""
+    
+    def test_reveals_segments_word_by_word(self):
+        """Test that segments appear a word at a time and end with the marker."""
+        meeting = RecordedMeeting(["yksi kaksi", "kolme"], "M", words_per_second=1.0)
+        
+        meeting.advance(1.0)
+        self.assertTrue(meeting.transcript().endswith("M\nyksi"))
+        meeting.advance(2.0)
+        self.assertTrue(meeting.transcript().endswith("yksi kaksi\nM\nkolme\nM\n"))
+        self.assertEqual(meeting.lines, 2)
+    
+    def test_empty_transcript_rejected(self):
+        """Test that a transcript without segments cannot be replayed."""
+        with self.assertRaises(ValueError):
+            RecordedMeeting([], "M")
+
+
+class TestLoadClient(unittest.TestCase):
+    """Test cases for LoadClient class."""
+    
+    def setUp(self):
+        """Start a stub server."""
+        self.server = StubLibreTranslateServer(latency=0.0).start()
+        self.config = replace(TranslationConfig(), libretranslate_url=self.server.url,
+                              rate_delay=0.05, translate_always_after=0.2)
+    
+    def tearDown(self):
+        self.server.stop()
+    
+    def test_repeated_lines_hit_the_cache(self):
+        """Test that a client only requests lines it has not translated yet."""
+        step = LoadStep(1)
+        meeting = RecordedMeeting(["kiitos"], "M", words_per_second=1.0)
+        client = LoadClient(self.config, meeting, "M", step)
+        client.capture.mark_all_previous_translated()
+        
+        for _ in range(3):
+            meeting.advance(1.0)
+            client.tick()
+            # Same text as the previous complete line, so force a new capture of it
+            client.capture.prev_translated_complete_line = ""
+            client.capture.already_translated.clear()
+        
+        self.assertEqual(step.requests, 1)
+        self.assertEqual(step.cache_hits, 2)
+    
+    def test_client_throttling_not_timed(self):
+        """Test that waiting on the client's own rate limiter is not counted as latency."""
+        config = replace(self.config, max_requests_per_second=2.0, request_burst=1)
+        step = LoadStep(1)
+        meeting = RecordedMeeting(["yksi", "kaksi"], "M", words_per_second=1.0)
+        client = LoadClient(config, meeting, "M", step)
+        client.capture.mark_all_previous_translated()
+        
+        for _ in range(2):
+            meeting.advance(1.0)
+            client.tick()
+        
+        self.assertEqual(step.requests, 2)
+        # The second request waited about 0.5 s for a token before it was sent
+        self.assertLess(step.latency_ms(100), 250)
+    
+    def test_run_load_reports_each_step(self):
+        """Test that every client count gets throughput and latency figures."""
+        steps = run_load(self.config, [1, 2], 0.6,
+                         lambda index: SimulatedMeeting(seed=index, words_per_second=40.0), SPEAKER)
+        
+        self.assertEqual([step.clients for step in steps], [1, 2])
+        self.assertTrue(all(step.requests > 0 for step in steps))
+        self.assertEqual(sum(step.errors for step in steps), 0)
+        self.assertIsNotNone(steps[-1].latency_ms(95))
+        self.assertIn("req/s", format_report(steps))
+
+
+
+class TestMain(unittest.TestCase):
+    """Test cases for command line validation."""
+    
+    def test_invalid_arguments(self):
+        """Test that unusable client counts and target languages are rejected."""
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(main(["--stub", "--clients", "0"]), 2)
+            self.assertEqual(main(["--stub", "--clients", ""]), 2)
+            self.assertEqual(main(["--stub", "--target-lang", ","]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
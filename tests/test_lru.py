@@ -0,0 +1,56 @@
+"""Unit tests for the bounded LRU containers."""
+
+import unittest
+from src.utils.lru import LRUCache, LRUSet
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test cases for LRUCache class."""
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted when full."""
+        cache = LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(cache.get("a"), 1)
+        cache["c"] = 3
+        
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+    
+    def test_get_default_and_clear(self):
+        """Test missing keys and clearing."""
+        cache = LRUCache(2)
+        cache[("Hei", "en")] = "Hi"
+        
+        self.assertIsNone(cache.get(("Moi", "en")))
+        self.assertEqual(cache[("Hei", "en")], "Hi")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+    
+    def test_invalid_size(self):
+        """Test that a non-positive size is rejected."""
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+
+class TestLRUSet(unittest.TestCase):
+    """Test cases for LRUSet class."""
+    
+    def test_bounded_membership(self):
+        """Test that re-adding refreshes a member and old ones are forgotten."""
+        members = LRUSet(2)
+        members.add("first")
+        members.add("second")
+        members.add("first")
+        members.add("third")
+        
+        self.assertIn("first", members)
+        self.assertNotIn("second", members)
+        self.assertEqual(sorted(members), ["first", "third"])
+
+
+if __name__ == '__main__':
+    unittest.main()
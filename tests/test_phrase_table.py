@@ -0,0 +1,47 @@
+"""Unit tests for the phrase table."""
+
+import os
+import tempfile
+import unittest
+from src.core.phrase_table import PhraseTable, load_phrase_tables
+
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "examples", "phrases")
+
+
+class TestPhraseTable(unittest.TestCase):
+    """Test cases for PhraseTable class."""
+    
+    def test_normalized_lookup(self):
+        """Test that lookup ignores case, punctuation and whitespace."""
+        table = PhraseTable([("Kiitos", "thank you"), ("Kuuleeko?", "can you hear me?")])
+        
+        self.assertEqual(table.lookup("kiitos!"), "thank you")
+        self.assertEqual(table.lookup("  KUULEEKO  "), "can you hear me?")
+        self.assertIsNone(table.lookup("Kiitos kaikille"))
+        self.assertEqual(len(table), 2)
+    
+    def test_load_skips_comments_and_malformed_lines(self):
+        """Test loading a tab-separated phrase file."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "fi-en.tsv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("# comment\n\nJoo\tyeah\nno translation here\nHyvä\tgood\n")
+            
+            table = PhraseTable.load(path)
+        
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.lookup("hyvä."), "good")
+    
+    def test_load_phrase_tables_per_pair(self):
+        """Test that only pairs with a file get a table."""
+        tables = load_phrase_tables(EXAMPLES_DIR, "fi", ["en", "sv"])
+        
+        self.assertEqual(list(tables), ["en"])
+        self.assertEqual(tables["en"].lookup("Kiitos!"), "thank you")
+        self.assertEqual(load_phrase_tables("missing-directory", "fi", ["en"]), {})
+        self.assertEqual(load_phrase_tables("", "fi", ["en"]), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
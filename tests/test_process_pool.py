@@ -0,0 +1,75 @@
+"""Unit tests for the process-pool translation backend."""
+
+import time
+import unittest
+from src.core.process_pool import ProcessPoolTranslationBackend
+from src.core.translator import TranslationService, create_backend
+from src.config.settings import TranslationConfig
+
+
+class TestProcessPoolTranslationBackend(unittest.TestCase):
+    """Test cases for ProcessPoolTranslationBackend class."""
+    
+    def setUp(self):
+        self.backend = ProcessPoolTranslationBackend("stub", workers=2, batch_window=0.05)
+    
+    def tearDown(self):
+        self.backend.shutdown()
+    
+    def test_translate_in_worker(self):
+        """Test that translations run in a worker and return their result."""
+        self.assertEqual(self.backend.translate("Hei", "fi", "en"), "[en] Hei")
+        self.assertTrue(self.backend.is_available())
+    
+    def test_concurrent_requests_are_batched(self):
+        """Test that requests queued together are returned in order."""
+        futures = [self.backend.submit(f"line {i}", "fi", "en") for i in range(6)]
+        
+        self.assertEqual([future.result(timeout=30) for future in futures],
+                         [f"[en] line {i}" for i in range(6)])
+    
+    def test_batches_are_spread_across_workers(self):
+        """Test that a gathered batch is translated by all workers in parallel."""
+        backend = ProcessPoolTranslationBackend("stub", workers=4, batch_window=0.05,
+                                                engine_options={"delay": 0.2})
+        self.addCleanup(backend.shutdown)
+        # Start every worker process before timing
+        for future in [backend.get_pool().submit(time.sleep, 0.1) for _ in range(4)]:
+            future.result(timeout=30)
+        
+        started = time.monotonic()
+        futures = [backend.submit(f"line {i}", "fi", "en") for i in range(8)]
+        results = [future.result(timeout=30) for future in futures]
+        elapsed = time.monotonic() - started
+        
+        self.assertEqual(results, [f"[en] line {i}" for i in range(8)])
+        self.assertEqual(backend.batches_sent, 4)
+        # 8 translations of 0.2 s take 1.6 s on one worker, 0.4 s on four
+        self.assertLess(elapsed, 1.0)
+    
+    def test_service_fans_out_through_futures(self):
+        """Test that TranslationService submits to the pool for each target."""
+        service = TranslationService(TranslationConfig(), backend=self.backend)
+        
+        self.assertEqual(service.translate_to_targets("Hei", ["en", "sv"]),
+                         {"en": "[en] Hei", "sv": "[sv] Hei"})
+    
+    def test_unknown_engine(self):
+        """Test that an unknown engine makes the backend unavailable."""
+        backend = ProcessPoolTranslationBackend("missing", workers=1)
+        try:
+            self.assertFalse(backend.is_available())
+            self.assertIsNone(backend.translate("Hei", "fi", "en"))
+        finally:
+            backend.shutdown()
+    
+    def test_create_backend_with_worker_processes(self):
+        """Test that worker_processes selects the process pool for in-process engines."""
+        backend = create_backend(TranslationConfig(backend="stub", worker_processes=2))
+        
+        self.assertIsInstance(backend, ProcessPoolTranslationBackend)
+        self.assertEqual(backend.workers, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""Unit tests for TranslationProxy."""
+
+import http.client
+import json
+import threading
+import unittest
+import urllib.request
+from dataclasses import replace
+from src.config.settings import ProxyConfig, TranslationConfig
+from src.core.backends import StubTranslationBackend
+from src.core.proxy import TranslationProxy
+from src.core.translator import HttpTranslationBackend
+
+
+class FailingBackend(StubTranslationBackend):
+    """Stub backend whose translations always fail."""
+    
+    def translate(self, text, source_lang, target_lang):
+        super().translate(text, source_lang, target_lang)
+        return None
+
+
+class TestTranslationProxy(unittest.TestCase):
+    """Test cases for TranslationProxy class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.backend = StubTranslationBackend(delay=0.05)
+        self.proxy = TranslationProxy(ProxyConfig(port=0), TranslationConfig(), backend=self.backend)
+    
+    def test_shared_cache(self):
+        """Test that repeated captions cost one backend call."""
+        for _ in range(10):
+            self.assertEqual(self.proxy.translate("Hei", "fi", "en"), "[en] Hei")
+        
+        self.assertEqual(self.backend.calls, 1)
+        self.assertEqual(self.proxy.cache_hits, 9)
+        self.assertEqual(self.proxy.translate("Hei", "fi", "sv"), "[sv] Hei")
+        self.assertEqual(self.backend.calls, 2)
+    
+    def test_single_flight(self):
+        """Test that concurrent identical requests share one backend call."""
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.proxy.translate("Hei", "fi", "en")))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(results, ["[en] Hei"] * 10)
+        self.assertEqual(self.backend.calls, 1)
+        self.assertEqual(self.proxy.coalesced + self.proxy.cache_hits, 9)
+    
+    def test_failures_are_not_cached(self):
+        """Test that a failed translation is retried on the next request."""
+        backend = FailingBackend()
+        proxy = TranslationProxy(ProxyConfig(port=0), TranslationConfig(), backend=backend)
+        
+        self.assertIsNone(proxy.translate("Hei", "fi", "en"))
+        self.assertIsNone(proxy.translate("Hei", "fi", "en"))
+        
+        self.assertEqual(backend.calls, 2)
+        self.assertEqual(proxy.upstream_failures, 2)
+    
+    def test_libretranslate_api_over_http(self):
+        """Test that a LibreTranslate client can use the proxy."""
+        self.proxy.start()
+        try:
+            host, port = self.proxy.address
+            client = HttpTranslationBackend(replace(TranslationConfig(),
+                                                    libretranslate_url=f"http://{host}:{port}/translate"))
+            
+            self.assertEqual(client.translate("Hei", "fi", "en"), "[en] Hei")
+            self.assertEqual(client.translate("Hei", "fi", "en"), "[en] Hei")
+            self.assertTrue(client.is_available())
+            
+            request = urllib.request.Request(
+                f"http://{host}:{port}/translate",
+                data=json.dumps({"q": ["Hei", "Moi"], "source": "fi", "target": "en"}).encode("utf-8"),
+                headers={"Content-Type": "application/json"}
+            )
+            with urllib.request.urlopen(request, timeout=5) as response:
+                self.assertEqual(json.loads(response.read())["translatedText"], ["[en] Hei", "[en] Moi"])
+            
+            with urllib.request.urlopen(f"http://{host}:{port}/stats", timeout=5) as response:
+                stats = json.loads(response.read())
+        finally:
+            self.proxy.stop()
+        
+        self.assertEqual(stats["upstream_calls"], 2)
+        self.assertEqual(stats["cache_hits"], 2)
+    
+    def test_missing_target_rejected(self):
+        """Test that requests without a target language get HTTP 400."""
+        self.proxy.start()
+        try:
+            host, port = self.proxy.address
+            request = urllib.request.Request(
+                f"http://{host}:{port}/translate", data=b"q=Hei&source=fi",
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            )
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                urllib.request.urlopen(request, timeout=5)
+        finally:
+            self.proxy.stop()
+        
+        self.assertEqual(context.exception.code, 400)
+    
+    def test_malformed_content_length_rejected(self):
+        """Test that an unparseable Content-Length gets HTTP 400."""
+        self.proxy.start()
+        try:
+            host, port = self.proxy.address
+            connection = http.client.HTTPConnection(host, port, timeout=5)
+            connection.putrequest("POST", "/translate")
+            connection.putheader("Content-Type", "application/json")
+            connection.putheader("Content-Length", "many")
+            connection.endheaders()
+            status = connection.getresponse().status
+            connection.close()
+        finally:
+            self.proxy.stop()
+        
+        self.assertEqual(status, 400)
+    
+    def test_upstream_not_limited_by_client_budget(self):
+        """Test that the upstream backend uses the proxy's rate limit, not a client's."""
+        translation_config = TranslationConfig(max_requests_per_second=5.0)
+        
+        unlimited = TranslationProxy(ProxyConfig(port=0), translation_config)
+        self.assertIsNone(unlimited.backend.rate_limiter)
+        
+        limited = TranslationProxy(ProxyConfig(port=0, upstream_requests_per_second=50.0), translation_config)
+        self.assertEqual(limited.backend.rate_limiter.rate, 50.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""Unit tests for TokenBucket."""
+
+import time
+import unittest
+from unittest.mock import patch
+from src.core.rate_limiter import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket class."""
+    
+    def test_burst_available_immediately(self):
+        """Test that a full bucket allows a burst without waiting."""
+        bucket = TokenBucket(rate=1.0, burst=3)
+        
+        self.assertTrue(all(bucket.try_acquire() for _ in range(3)))
+        self.assertFalse(bucket.try_acquire())
+    
+    def test_refills_over_time(self):
+        """Test that tokens refill at the configured rate."""
+        bucket = TokenBucket(rate=10.0, burst=1)
+        bucket.try_acquire()
+        
+        with patch('src.core.rate_limiter.time.monotonic', return_value=bucket.updated_at + 0.11):
+            self.assertTrue(bucket.try_acquire())
+    
+    def test_acquire_waits_for_refill(self):
+        """Test that acquire blocks until a token is available."""
+        bucket = TokenBucket(rate=50.0, burst=1)
+        bucket.acquire()
+        
+        start = time.monotonic()
+        self.assertTrue(bucket.acquire())
+        
+        self.assertGreaterEqual(time.monotonic() - start, 0.015)
+    
+    def test_acquire_timeout(self):
+        """Test that acquire gives up after the timeout."""
+        bucket = TokenBucket(rate=0.1, burst=1)
+        bucket.acquire()
+        
+        self.assertFalse(bucket.acquire(timeout=0.01))
+    
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
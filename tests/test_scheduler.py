@@ -0,0 +1,90 @@
+"""Unit tests for TranslationScheduler."""
+
+import threading
+import unittest
+from src.core.scheduler import TranslationScheduler
+
+
+class TestTranslationScheduler(unittest.TestCase):
+    """Test cases for TranslationScheduler class."""
+    
+    def setUp(self):
+        """Set up a single-worker scheduler blocked on a gate job."""
+        self.scheduler = TranslationScheduler(workers=1)
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        
+        def blocker():
+            self.started.set()
+            self.gate.wait(5)
+        self.blocker = self.scheduler.submit(blocker)
+        self.started.wait(5)
+    
+    def tearDown(self):
+        """Release the worker and stop the scheduler."""
+        self.gate.set()
+        self.scheduler.shutdown()
+    
+    def test_higher_priority_runs_first(self):
+        """Test that completed lines are translated before speculative requests."""
+        order = []
+        speculative = self.scheduler.submit(order.append, "speculative",
+                                            priority=TranslationScheduler.PRIORITY_SPECULATIVE)
+        incomplete = self.scheduler.submit(order.append, "incomplete",
+                                           priority=TranslationScheduler.PRIORITY_INCOMPLETE)
+        complete = self.scheduler.submit(order.append, "complete",
+                                         priority=TranslationScheduler.PRIORITY_COMPLETE)
+        
+        self.gate.set()
+        for future in (speculative, incomplete, complete):
+            future.result(5)
+        
+        self.assertEqual(order, ["complete", "incomplete", "speculative"])
+    
+    def test_pending_job_superseded(self):
+        """Test that a newer job with the same key replaces a pending one."""
+        old = self.scheduler.submit(lambda: "old", supersede_key="incomplete")
+        new = self.scheduler.submit(lambda: "new", supersede_key="incomplete")
+        
+        self.gate.set()
+        
+        self.assertEqual(new.result(5), "new")
+        self.assertTrue(old.cancelled())
+        self.assertEqual(self.scheduler.superseded_count, 1)
+    
+    def test_sessions_served_fairly(self):
+        """Test that a burst from one session does not starve another."""
+        order = []
+        futures = [self.scheduler.submit(order.append, f"busy-{i}", session="busy") for i in range(3)]
+        futures.append(self.scheduler.submit(order.append, "quiet-0", session="quiet"))
+        
+        self.gate.set()
+        for future in futures:
+            future.result(5)
+        
+        self.assertLess(order.index("quiet-0"), order.index("busy-2"))
+    
+    def test_supersede_key_is_per_session(self):
+        """Test that sessions do not supersede each other's jobs."""
+        first = self.scheduler.submit(lambda: 1, supersede_key="incomplete", session="room1")
+        second = self.scheduler.submit(lambda: 2, supersede_key="incomplete", session="room2")
+        
+        self.gate.set()
+        
+        self.assertEqual(first.result(5), 1)
+        self.assertEqual(second.result(5), 2)
+    
+    def test_exception_propagates_to_future(self):
+        """Test that errors are reported through the future."""
+        def fail():
+            raise ValueError("boom")
+        future = self.scheduler.submit(fail)
+        
+        self.gate.set()
+        
+        with self.assertRaises(ValueError):
+            future.result(5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for SessionManager and transcript sources."""
+
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+from src.core.sessions import SessionManager
+from src.core.sources import FileTranscriptSource, StreamTranscriptSource
+from src.core.translator import SequencedTranslation
+from src.config.settings import AppConfig
+
+
+class TestSessionManager(unittest.TestCase):
+    """Test cases for SessionManager class."""
+    
+    def setUp(self):
+        """Set up a manager with a stubbed translation service."""
+        self.config = AppConfig()
+        self.config.capture.split_marker = "Speaker:"
+        self.service = Mock()
+        self.service.translate_sequenced.side_effect = lambda seq, text, langs: SequencedTranslation(
+            seq, text, {lang: f"{lang}:{text}" for lang in langs}
+        )
+        self.received = []
+        self.manager = SessionManager(
+            self.config,
+            translation_service=self.service,
+            on_translation=lambda session, update: self.received.append((session.name, update))
+        )
+        self.transcripts = {}
+    
+    def tearDown(self):
+        """Stop the shared scheduler."""
+        self.manager.stop()
+    
+    def add_session(self, name, text=""):
+        self.transcripts[name] = text
+        return self.manager.add_session(name, lambda: self.transcripts[name])
+    
+    def tick(self):
+        for future in self.manager.tick():
+            future.exception(5)
+    
+    def test_sessions_have_independent_state(self):
+        """Test that each session translates its own new lines."""
+        self.add_session("room1")
+        self.add_session("room2")
+        self.transcripts["room1"] = "Speaker: Hei Speaker: kesken"
+        self.transcripts["room2"] = "Speaker: Moi Speaker: kesken"
+        
+        self.tick()
+        
+        self.assertEqual(sorted((name, u.source_text) for name, u in self.received),
+                         [("room1", "Hei"), ("room2", "Moi")])
+        self.assertIn("Hei", self.manager.sessions["room1"].capture.already_translated)
+        self.assertNotIn("Hei", self.manager.sessions["room2"].capture.already_translated)
+    
+    def test_cache_shared_across_sessions(self):
+        """Test that the same caption in two sessions costs one backend call."""
+        self.add_session("room1")
+        self.add_session("room2")
+        self.transcripts["room1"] = "Speaker: Kiitos Speaker: kesken"
+        self.tick()
+        self.transcripts["room2"] = "Speaker: Kiitos Speaker: kesken"
+        self.tick()
+        
+        self.assertEqual(len(self.received), 2)
+        self.assertEqual(self.service.translate_sequenced.call_count, 1)
+        self.assertEqual(self.manager.cache_hits, 1)
+    
+    def test_duplicate_session_name(self):
+        """Test that session names must be unique."""
+        self.add_session("room1")
+        
+        with self.assertRaises(ValueError):
+            self.add_session("room1")
+
+
+class TestTranscriptSources(unittest.TestCase):
+    """Test cases for transcript sources."""
+    
+    def test_file_source_follows_appended_text(self):
+        """Test that appended text is picked up incrementally."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write("Speaker: Hyvää ")
+            path = f.name
+        try:
+            source = FileTranscriptSource(path, max_chars=1000)
+            self.assertEqual(source(), "Speaker: Hyvää ")
+            
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write("huomenta")
+            self.assertEqual(source(), "Speaker: Hyvää huomenta")
+        finally:
+            os.unlink(path)
+    
+    def test_file_source_keeps_bounded_tail(self):
+        """Test that only the last max_chars characters are kept."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            f.write("x" * 100 + "tail")
+            path = f.name
+        try:
+            self.assertEqual(FileTranscriptSource(path, max_chars=4)(), "tail")
+        finally:
+            os.unlink(path)
+    
+    def test_file_source_missing_file(self):
+        """Test that a missing file yields an empty transcript."""
+        self.assertEqual(FileTranscriptSource("does_not_exist.txt")(), "")
+    
+    def test_stream_source(self):
+        """Test that stream lines accumulate in the background."""
+        source = StreamTranscriptSource(io.StringIO("Speaker: Hei\nSpeaker: Moi\n")).start()
+        source._thread.join(5)
+        
+        self.assertEqual(source(), "Speaker: Hei\nSpeaker: Moi\n")
+        self.assertTrue(source.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Unit tests for the soak test harness."""
+
+import unittest
+from src.tools.soak import SimulatedMeeting, SoakSample, analyze, run_soak, SPEAKER
+
+
+def make_samples(sizes, latencies, rss_kb=20000):
+    return [
+        SoakSample(elapsed_hours=i, rss_kb=rss_kb, already_translated=size,
+                   cache_entries=size, tick_latency_ms=latency, ticks=100)
+        for i, (size, latency) in enumerate(zip(sizes, latencies))
+    ]
+
+
+class TestSoak(unittest.TestCase):
+    """Test cases for the soak harness."""
+    
+    def test_meeting_transcript_grows(self):
+        """Test that simulated speech appends lines under the speaker marker."""
+        meeting = SimulatedMeeting(seed=1)
+        start = len(meeting.transcript())
+        meeting.advance(60)
+        
+        self.assertGreater(len(meeting.transcript()), start)
+        self.assertGreater(meeting.lines, 0)
+        self.assertIn(SPEAKER, meeting.transcript())
+    
+    def test_short_run_stays_bounded(self):
+        """Test that a short simulated meeting passes with eviction in play."""
+        report = run_soak(hours=0.5, sample_minutes=5, max_entries=50)
+        
+        self.assertTrue(report.passed, report.format())
+        self.assertEqual(len(report.samples), 6)
+        self.assertEqual(max(s.already_translated for s in report.samples), 50)
+        self.assertLessEqual(max(s.cache_entries for s in report.samples), 50)
+        self.assertGreater(report.segments_translated, 50)
+    
+    def test_detects_unbounded_growth(self):
+        """Test that sizes beyond their bounds fail the run."""
+        samples = make_samples([100, 200, 300, 400], [0.1] * 4)
+        
+        failures = analyze(samples, max_translated_lines=250, max_cache_entries=250)
+        
+        self.assertEqual(len(failures), 2)
+        self.assertIn("already_translated", failures[0])
+    
+    def test_detects_latency_trend(self):
+        """Test that tick latency rising well above noise fails the run."""
+        samples = make_samples([10] * 8, [1.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+        
+        failures = analyze(samples, max_translated_lines=100, max_cache_entries=100)
+        
+        self.assertEqual(len(failures), 1)
+        self.assertIn("tick latency", failures[0])
+    
+    def test_ignores_latency_noise(self):
+        """Test that tiny absolute changes in latency are not flagged."""
+        samples = make_samples([10] * 8, [0.01, 0.01, 0.02, 0.02, 0.03, 0.03, 0.04, 0.04])
+        
+        self.assertEqual(analyze(samples, max_translated_lines=100, max_cache_entries=100), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
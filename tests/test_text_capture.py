@@ -2,9 +2,11 @@
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
+import io
 import time
-from src.core.text_capture import TextCapture
+from src.core.text_capture import TextCapture, iter_transcript_segments
 from src.config.settings import CaptureConfig
+from src.utils.clock import VirtualClock
 
 
 class TestTextCapture(unittest.TestCase):
@@ -21,14 +23,16 @@ class TestTextCapture(unittest.TestCase):
     @patch('src.core.text_capture.pyperclip.paste')
     @patch('src.core.text_capture.pyautogui.hotkey')
     @patch('src.core.text_capture.pyautogui.click')
-    @patch('src.core.text_capture.time.sleep')
-    def test_grab_text_success(self, mock_sleep, mock_click, mock_hotkey, mock_paste):
+    def test_grab_text_success(self, mock_click, mock_hotkey, mock_paste):
         """Test successful text capture."""
         mock_paste.return_value = "Test captured text"
+        clock = VirtualClock()
+        self.capture.clock = clock
         
         result = self.capture.grab_text()
         
         self.assertEqual(result, "Test captured text")
+        self.assertAlmostEqual(clock.monotonic(), 0.2)
         mock_click.assert_called_once()
         self.assertEqual(mock_hotkey.call_count, 2)
         mock_hotkey.assert_any_call('ctrl', 'a')
@@ -83,6 +87,21 @@ class TestTextCapture(unittest.TestCase):
         
         self.assertEqual(result, "Incomplete line")
     
+    def test_translate_always_after_on_virtual_clock(self):
+        """Test that the incomplete line is retranslated once translate_always_after has passed."""
+        clock = VirtualClock(start=1000.0)
+        transcript = ["Previous Test Speaker Still"]
+        capture = TextCapture(self.config, text_source=lambda: transcript[0], clock=clock)
+        capture.mark_all_previous_translated()
+        
+        transcript[0] += " talking"
+        clock.advance(4.0)
+        self.assertIsNone(capture.get_transcript_to_translate(5.0))
+        
+        clock.advance(1.5)
+        self.assertEqual(capture.get_transcript_to_translate(5.0), "Still talking")
+        self.assertEqual(capture.prev_translation_at, 1005.5)
+    
     @patch.object(TextCapture, 'grab_text')
     def test_get_transcript_to_translate_no_translation_needed(self, mock_grab_text):
         """Test getting transcript when no translation is needed."""
@@ -113,6 +132,48 @@ class TestTextCapture(unittest.TestCase):
         
         self.assertEqual(result, "Real text here")
     
+    @patch.object(TextCapture, 'grab_text')
+    def test_get_stable_incomplete_line(self, mock_grab_text):
+        """Test that the incomplete line is only returned after the debounce window."""
+        mock_grab_text.return_value = "Previous Test Speaker Still talking"
+        
+        self.capture.get_transcript_to_translate(5.0)
+        self.assertEqual(self.capture.incomplete_line, "Still talking")
+        self.assertIsNone(self.capture.get_stable_incomplete_line(1.0))
+        
+        self.capture.incomplete_line_changed_at = time.time() - 2.0
+        self.assertEqual(self.capture.get_stable_incomplete_line(1.0), "Still talking")
+    
+    @patch.object(TextCapture, 'grab_text')
+    def test_get_stable_incomplete_line_resets_on_change(self, mock_grab_text):
+        """Test that a changing incomplete line restarts the debounce window."""
+        mock_grab_text.return_value = "Previous Test Speaker Still"
+        self.capture.get_transcript_to_translate(5.0)
+        self.capture.incomplete_line_changed_at = time.time() - 2.0
+        
+        mock_grab_text.return_value = "Previous Test Speaker Still talking"
+        self.capture.get_transcript_to_translate(5.0)
+        
+        self.assertIsNone(self.capture.get_stable_incomplete_line(1.0))
+    
+    def test_get_stable_incomplete_line_already_translated(self):
+        """Test that translated incomplete lines are not returned again."""
+        self.capture.incomplete_line = "Done"
+        self.capture.incomplete_line_changed_at = time.time() - 2.0
+        self.capture.mark_as_translated("Done")
+        
+        self.assertIsNone(self.capture.get_stable_incomplete_line(1.0))
+    
+    @patch.object(TextCapture, 'grab_text')
+    def test_capture_seq_increments_every_tick(self, mock_grab_text):
+        """Test that every capture tick gets a new sequence number."""
+        mock_grab_text.return_value = "Text without split marker"
+        
+        self.capture.get_transcript_to_translate(5.0)
+        self.capture.get_transcript_to_translate(5.0)
+        
+        self.assertEqual(self.capture.capture_seq, 2)
+    
     def test_mark_as_translated(self):
         """Test marking text as translated."""
         text = "Test text"
@@ -143,5 +204,28 @@ class TestTextCapture(unittest.TestCase):
         self.assertEqual(self.capture.prev_translated_complete_line, "")
 
 
+class TestIterTranscriptSegments(unittest.TestCase):
+    """Test cases for the streaming transcript parser."""
+    
+    def test_segments_independent_of_chunk_size(self):
+        """Test that markers split across reads are still found."""
+        transcript = "Close caption has started.\nSpeaker\nHei kaikki\nSpeaker\n\nSpeaker\nViimeinen rivi"
+        
+        for chunk_size in (1, 4, 7, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                segments = list(iter_transcript_segments(io.StringIO(transcript), "Speaker", chunk_size))
+                self.assertEqual(segments, ["Hei kaikki", "Viimeinen rivi"])
+    
+    def test_text_before_first_marker_is_skipped(self):
+        """Test that a preamble such as a meeting title is not a segment."""
+        transcript = "Viikkopalaveri 12.3.\nSpeaker\nHei kaikki"
+        
+        for chunk_size in (1, 5, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                segments = list(iter_transcript_segments(io.StringIO(transcript), "Speaker", chunk_size))
+                self.assertEqual(segments, ["Hei kaikki"])
+        self.assertEqual(list(iter_transcript_segments(io.StringIO("No markers here"), "Speaker")), [])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
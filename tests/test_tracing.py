@@ -0,0 +1,131 @@
+"""Unit tests for per-caption tracing."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from src.config.settings import TracingConfig, CaptureConfig, TranslationConfig
+from src.core.backends import StubTranslationBackend
+from src.core.text_capture import TextCapture
+from src.core.translator import TranslationService
+from src.utils import tracing
+
+
+class TraceRecordingBackend(StubTranslationBackend):
+    """Stub backend that records a span on the current trace."""
+    
+    def translate(self, text, source_lang, target_lang):
+        with tracing.span("http", target=target_lang):
+            return super().translate(text, source_lang, target_lang)
+
+
+class TestTracer(unittest.TestCase):
+    """Test cases for Tracer class."""
+    
+    def setUp(self):
+        """Set up a tracer writing to a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "trace.json")
+        self.tracer = tracing.Tracer(TracingConfig(enabled=True, path=self.path))
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def load(self, path=None):
+        with open(path or self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def test_committed_spans_written_as_trace_events(self):
+        """Test that a committed trace ends up in a valid trace-event file."""
+        trace = self.tracer.start(7)
+        with trace.span("grab"):
+            pass
+        trace.commit()
+        with tracing.span("render", trace, provisional=False):
+            pass
+        self.tracer.close()
+        
+        events = self.load()
+        spans = [e for e in events if e["ph"] == "X"]
+        self.assertEqual([s["name"] for s in spans], ["grab", "render"])
+        self.assertTrue(all(s["pid"] == 7 and s["args"]["trace_id"] == 7 for s in spans))
+        self.assertIn({"name": "process_name", "ph": "M", "pid": 7, "args": {"name": "caption #7"}}, events)
+        self.assertIs(self.tracer.get(7), trace)
+    
+    def test_uncommitted_trace_dropped(self):
+        """Test that ticks without text leave nothing in the file."""
+        trace = self.tracer.start(1)
+        with trace.span("grab"):
+            pass
+        self.tracer.close()
+        
+        self.assertFalse(os.path.exists(self.path))
+        self.assertIsNone(self.tracer.get(1))
+    
+    def test_full_buffer_written_by_background_thread(self):
+        """Test that a full buffer is written off the thread recording the spans."""
+        writers = set()
+        write = self.tracer._write
+        
+        def recording_write(event):
+            writers.add(threading.current_thread().name)
+            write(event)
+        
+        self.tracer._write = recording_write
+        self.tracer.record_all([{"name": "mark", "ph": "i", "pid": 1}] * self.tracer.FLUSH_EVENTS)
+        deadline = time.monotonic() + 5.0
+        while self.tracer.events_written < self.tracer.FLUSH_EVENTS and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        self.assertEqual(self.tracer.events_written, self.tracer.FLUSH_EVENTS)
+        self.assertEqual(writers, {"trace-writer"})
+        self.tracer.close()
+        self.assertEqual(len(self.load()), self.tracer.FLUSH_EVENTS)
+    
+    def test_sampling(self):
+        """Test that sample_rate 0 traces nothing."""
+        tracer = tracing.Tracer(TracingConfig(enabled=True, path=self.path, sample_rate=0.0))
+        
+        self.assertIsNone(tracer.start(1))
+        with tracing.span("noop"):
+            pass
+    
+    def test_rotation(self):
+        """Test that full files are rotated and each one is valid JSON."""
+        tracer = tracing.Tracer(TracingConfig(enabled=True, path=self.path, max_events_per_file=4, backups=2))
+        for trace_id in range(1, 6):
+            trace = tracer.start(trace_id)
+            trace.commit()
+            with trace.span("grab"):
+                pass
+        tracer.close()
+        
+        self.assertTrue(os.path.exists(self.path + ".1"))
+        self.assertTrue(os.path.exists(self.path + ".2"))
+        self.assertFalse(os.path.exists(self.path + ".3"))
+        self.assertEqual(len(self.load(self.path + ".1")), 4)
+        self.assertGreater(len(self.load()), 0)
+    
+    def test_capture_and_translation_spans(self):
+        """Test that a caption gets grab, parse and per-language HTTP spans across threads."""
+        transcript = ["Intro M Hello"]
+        capture = TextCapture(CaptureConfig(split_marker="M"), text_source=lambda: transcript[0],
+                              tracer=self.tracer)
+        service = TranslationService(TranslationConfig(), backend=TraceRecordingBackend())
+        
+        self.assertIsNone(capture.get_transcript_to_translate(5.0))
+        transcript[0] += " there M"
+        text = capture.get_transcript_to_translate(5.0)
+        with tracing.activate(self.tracer.get(capture.capture_seq)):
+            service.translate_to_targets(text, ["en", "sv"])
+        self.tracer.close()
+        
+        spans = [e for e in self.load() if e["ph"] == "X"]
+        self.assertEqual(sorted(s["name"] for s in spans), ["grab", "http", "http", "parse"])
+        self.assertTrue(all(s["pid"] == 2 for s in spans))
+
+
+if __name__ == '__main__':
+    unittest.main()
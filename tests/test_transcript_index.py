@@ -0,0 +1,89 @@
+"""Unit tests for TranscriptIndex."""
+
+import os
+import tempfile
+import unittest
+from src.core.transcript_index import TranscriptIndex, tokenize
+from src.config.settings import SearchConfig
+
+
+class TestTranscriptIndex(unittest.TestCase):
+    """Test cases for TranscriptIndex class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = TranscriptIndex(SearchConfig(enabled=True))
+    
+    def test_tokenize(self):
+        """Test that tokens are lowercase words, including non-ASCII letters."""
+        self.assertEqual(tokenize("Päätös tehdään, OK?"), ["päätös", "tehdään", "ok"])
+    
+    def test_prefix_search_over_source_and_translation(self):
+        """Test that query terms match word prefixes in either language."""
+        self.index.add(1.0, "A", "Budjetti ylittyy", {"en": "The budget is exceeded"})
+        self.index.add(2.0, "B", "Aikataulu pitää", {"en": "The schedule holds"})
+        
+        self.assertEqual([s.speaker for s in self.index.search("budg")], ["A"])
+        self.assertEqual([s.speaker for s in self.index.search("budj")], ["A"])
+        self.assertEqual([s.speaker for s in self.index.search("the")], ["B", "A"])
+        self.assertEqual(self.index.search("sched budg"), [])
+        self.assertEqual(self.index.search(""), [])
+    
+    def test_results_newest_first_and_limited(self):
+        """Test that the newest matching segments are returned first."""
+        for i in range(5):
+            self.index.add(float(i), "A", f"Kohta {i}", {"en": f"Item {i}"})
+        
+        results = self.index.search("item", limit=2)
+        
+        self.assertEqual([s.timestamp for s in results], [4.0, 3.0])
+    
+    def test_session_filter(self):
+        """Test that results can be restricted to one session."""
+        self.index.add(1.0, "A", "Hei", {"en": "Hi"}, session="room1")
+        self.index.add(2.0, "B", "Hei", {"en": "Hi"}, session="room2")
+        
+        self.assertEqual([s.session for s in self.index.search("hi", session="room1")], ["room1"])
+    
+    def test_spills_oldest_segments_to_disk(self):
+        """Test that memory stays bounded and spilled segments stay searchable."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "spill.jsonl")
+            index = TranscriptIndex(SearchConfig(enabled=True, max_segments=8, spill_path=path))
+            for i in range(40):
+                index.add(float(i), "A", f"Rivi {i} word{i}", {"en": f"Line {i}"})
+                index.catch_up()
+            
+            self.assertLessEqual(len(index.segments), 8)
+            self.assertEqual(len(index), 40)
+            self.assertNotIn("word0", index.postings)
+            self.assertEqual([s.timestamp for s in index.search("word0")], [0.0])
+            self.assertEqual([s.timestamp for s in index.search("line", limit=50)],
+                             [float(i) for i in reversed(range(40))])
+    
+    def test_background_indexing(self):
+        """Test that segments are indexed by the background thread."""
+        self.index.start()
+        try:
+            self.index.add(1.0, "A", "Hei", {"en": "Hello"})
+        finally:
+            self.index.close()
+        
+        self.assertEqual(len(self.index.segments), 1)
+    
+    def test_temporary_spill_file_removed_on_close(self):
+        """Test that a spill file created by the index is deleted on close."""
+        index = TranscriptIndex(SearchConfig(enabled=True, max_segments=4))
+        for i in range(10):
+            index.add(float(i), "A", "Hei", {"en": "Hi"})
+        index.catch_up()
+        path = index.spill_path
+        self.assertTrue(os.path.exists(path))
+        
+        index.close()
+        
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
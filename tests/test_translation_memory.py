@@ -0,0 +1,71 @@
+"""Unit tests for TranslationMemory."""
+
+import unittest
+from src.core.translation_memory import TranslationMemory
+
+
+class TestTranslationMemory(unittest.TestCase):
+    """Test cases for TranslationMemory class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.memory = TranslationMemory(max_entries=100, threshold=0.7)
+        self.memory.add("Tänään puhumme budjetista ja aikataulusta", "en",
+                        "Today we talk about the budget and the schedule")
+    
+    def test_exact_match_ignores_case_and_punctuation(self):
+        """Test that normalisation makes punctuation-only revisions exact matches."""
+        match = self.memory.lookup("tänään puhumme budjetista, ja aikataulusta.", "en")
+        
+        self.assertIsNotNone(match)
+        self.assertEqual(match.similarity, 1.0)
+        self.assertEqual(match.translation, "Today we talk about the budget and the schedule")
+    
+    def test_near_match_above_threshold(self):
+        """Test that a one-word revision is found."""
+        match = self.memory.lookup("Tänään puhumme budjetista ja aikataulusta nyt", "en")
+        
+        self.assertIsNotNone(match)
+        self.assertGreaterEqual(match.similarity, 0.7)
+        self.assertLess(match.similarity, 1.0)
+    
+    def test_unrelated_text_not_matched(self):
+        """Test that dissimilar text returns no match."""
+        self.assertIsNone(self.memory.lookup("Kuuleeko kaikki minut hyvin", "en"))
+    
+    def test_other_target_language_not_matched(self):
+        """Test that matches are per target language."""
+        self.assertIsNone(self.memory.lookup("Tänään puhumme budjetista ja aikataulusta", "sv"))
+    
+    def test_bounded_size_evicts_least_recently_used(self):
+        """Test that the memory never exceeds max_entries."""
+        memory = TranslationMemory(max_entries=3)
+        for i in range(10):
+            memory.add(f"lause numero {i}", "en", f"sentence number {i}")
+        
+        self.assertEqual(len(memory), 3)
+        self.assertIsNone(memory.lookup("lause numero 0", "en"))
+        self.assertEqual(memory.lookup("lause numero 9", "en").translation, "sentence number 9")
+        # Postings of evicted entries are removed as well
+        keys = set(memory.entries)
+        for posting in memory.postings.values():
+            self.assertTrue(posting <= keys)
+    
+    def test_lookup_cost_is_bounded_with_full_memory(self):
+        """Test that a lookup in a full memory only touches a bounded number of entries."""
+        memory = TranslationMemory(max_entries=5000)
+        for i in range(5000):
+            memory.add(f"puhuja {i} sanoi jotain kokouksessa numero {i * 7}", "en", f"translation {i}")
+        
+        text = "puhuja 42 sanoi jotain kokouksessa numero 294 ok"
+        match = memory.lookup(text, "en")
+        
+        self.assertEqual(match.translation, "translation 42")
+        # n-grams shared by every entry are skipped, and only the best few candidates are scored
+        self.assertLessEqual(memory.last_postings_scanned,
+                             len(memory.ngrams(memory.normalize(text))) * memory.max_posting_size)
+        self.assertLess(memory.last_postings_scanned, len(memory))
+        self.assertLessEqual(memory.last_candidates_scored, TranslationMemory.MAX_CANDIDATES)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,8 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import requests
 import json
+import time
+from src.core.backends import StubTranslationBackend
 from src.core.translator import TranslationService
 from src.config.settings import TranslationConfig
 
@@ -20,7 +22,7 @@ class TestTranslationService(unittest.TestCase):
         self.config.target_language = "en"
         self.service = TranslationService(self.config)
     
-    @patch('src.core.translator.requests.post')
+    @patch('src.core.translator.requests.Session.post')
     def test_translate_success(self, mock_post):
         """Test successful translation."""
         # Mock successful response
@@ -41,7 +43,7 @@ class TestTranslationService(unittest.TestCase):
         self.assertEqual(call_args[1]['json']['source'], "fi")
         self.assertEqual(call_args[1]['json']['target'], "en")
     
-    @patch('src.core.translator.requests.post')
+    @patch('src.core.translator.requests.Session.post')
     def test_translate_with_custom_languages(self, mock_post):
         """Test translation with custom languages."""
         mock_response = Mock()
@@ -58,7 +60,7 @@ class TestTranslationService(unittest.TestCase):
         self.assertEqual(call_args[1]['json']['source'], "en")
         self.assertEqual(call_args[1]['json']['target'], "es")
     
-    @patch('src.core.translator.requests.post')
+    @patch('src.core.translator.requests.Session.post')
     def test_translate_empty_text(self, mock_post):
         """Test translation with empty text."""
         result = self.service.translate("")
@@ -67,7 +69,7 @@ class TestTranslationService(unittest.TestCase):
         self.assertIsNone(result)
         mock_post.assert_not_called()
     
-    @patch('src.core.translator.requests.post')
+    @patch('src.core.translator.requests.Session.post')
     def test_translate_api_error(self, mock_post):
         """Test translation with API error."""
         mock_response = Mock()
@@ -79,7 +81,7 @@ class TestTranslationService(unittest.TestCase):
         
         self.assertIsNone(result)
     
-    @patch('src.core.translator.requests.post')
+    @patch('src.core.translator.requests.Session.post')
     def test_translate_network_error(self, mock_post):
         """Test translation with network error."""
         mock_post.side_effect = requests.exceptions.RequestException("Network error")
@@ -88,7 +90,7 @@ class TestTranslationService(unittest.TestCase):
         
         self.assertIsNone(result)
     
-    @patch('src.core.translator.requests.post')
+    @patch('src.core.translator.requests.Session.post')
     def test_translate_invalid_json(self, mock_post):
         """Test translation with invalid JSON response."""
         mock_response = Mock()
@@ -100,7 +102,61 @@ class TestTranslationService(unittest.TestCase):
         
         self.assertIsNone(result)
     
-    @patch('src.core.translator.requests.get')
+    @patch('src.core.translator.requests.Session.post')
+    def test_translate_to_targets(self, mock_post):
+        """Test translating to several target languages in parallel."""
+        def respond(url, json, headers, timeout):
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {"translatedText": f"{json['target']}: {json['q']}"}
+            return response
+        mock_post.side_effect = respond
+        
+        result = self.service.translate_to_targets("Hei", ["en", "sv", "de"])
+        
+        self.assertEqual(result, {"en": "en: Hei", "sv": "sv: Hei", "de": "de: Hei"})
+        self.assertEqual(mock_post.call_count, 3)
+    
+    @patch('src.core.translator.requests.Session.post')
+    def test_translate_to_targets_partial_failure(self, mock_post):
+        """Test that one failing language does not affect the others."""
+        def respond(url, json, headers, timeout):
+            response = Mock()
+            response.status_code = 500 if json['target'] == "sv" else 200
+            response.text = "Internal Server Error"
+            response.json.return_value = {"translatedText": "Hello"}
+            return response
+        mock_post.side_effect = respond
+        
+        result = self.service.translate_to_targets("Hei", ["en", "sv"])
+        
+        self.assertEqual(result, {"en": "Hello", "sv": None})
+    
+    @patch('src.core.translator.requests.Session.post')
+    def test_translate_sequenced(self, mock_post):
+        """Test that the sequence number is carried through to the result."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"translatedText": "Hello"}
+        mock_post.return_value = mock_response
+        
+        result = self.service.translate_sequenced(42, "Hei", ["en"])
+        
+        self.assertEqual(result.seq, 42)
+        self.assertEqual(result.source_text, "Hei")
+        self.assertEqual(result.translations, {"en": "Hello"})
+    
+    @patch('src.core.translator.requests.Session.post')
+    def test_translate_sequenced_omits_failed_languages(self, mock_post):
+        """Test that failed languages are left out of a sequenced result."""
+        mock_post.side_effect = requests.exceptions.RequestException("Network error")
+        
+        result = self.service.translate_sequenced(7, "Hei", ["en"])
+        
+        self.assertEqual(result.seq, 7)
+        self.assertEqual(result.translations, {})
+    
+    @patch('src.core.translator.requests.Session.get')
     def test_is_service_available_success(self, mock_get):
         """Test service availability check success."""
         mock_response = Mock()
@@ -115,7 +171,57 @@ class TestTranslationService(unittest.TestCase):
             timeout=5
         )
     
-    @patch('src.core.translator.requests.get')
+    @patch('src.core.translator.requests.Session.get')
+    @patch('src.core.translator.requests.Session.post')
+    def test_timeouts_follow_observed_latency(self, mock_post, mock_get):
+        """Test that timeouts become a capped p99 multiple once latencies are known."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"translatedText": "Hello"}
+        mock_post.return_value = mock_response
+        mock_get.return_value = mock_response
+        
+        self.service.translate("Hei")
+        self.assertEqual(mock_post.call_args[1]['timeout'], 10.0)
+        
+        for _ in range(20):
+            self.service.backend.latency.record(0.5, size=len("Hei"))
+        self.service.translate("Hei")
+        self.service.is_service_available()
+        
+        self.assertEqual(mock_post.call_args[1]['timeout'], 1.5)
+        self.assertEqual(mock_get.call_args[1]['timeout'], 1.5)
+        
+        for _ in range(20):
+            self.service.backend.latency.record(4.0)
+        self.service.is_service_available()
+        self.assertEqual(mock_get.call_args[1]['timeout'], 5.0)
+    
+    @patch('src.core.translator.requests.Session.post')
+    def test_long_text_not_timed_by_short_captions(self, mock_post):
+        """Test that a long request after many fast short ones keeps the default timeout."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"translatedText": "Hello"}
+        mock_post.return_value = mock_response
+        
+        for _ in range(20):
+            self.service.translate("Hei")
+        self.service.translate("Hei")
+        self.assertEqual(mock_post.call_args[1]['timeout'], 1.0)
+        
+        self.service.translate("a" * 1000)
+        self.assertEqual(mock_post.call_args[1]['timeout'], 10.0)
+    
+    @patch('src.core.translator.requests.Session.post')
+    def test_timeout_is_recorded_as_latency(self, mock_post):
+        """Test that timed out requests count at their timeout."""
+        mock_post.side_effect = requests.exceptions.Timeout("Read timed out")
+        
+        self.assertIsNone(self.service.translate("Hei"))
+        self.assertEqual(list(self.service.backend.latency.samples), [10.0])
+    
+    @patch('src.core.translator.requests.Session.get')
     def test_is_service_available_failure(self, mock_get):
         """Test service availability check failure."""
         mock_get.side_effect = requests.exceptions.RequestException("Connection error")
@@ -123,6 +229,104 @@ class TestTranslationService(unittest.TestCase):
         result = self.service.is_service_available()
         
         self.assertFalse(result)
+    
+    @patch('src.core.translator.requests.Session.get')
+    @patch('src.core.translator.requests.Session.post')
+    def test_warm_up(self, mock_post, mock_get):
+        """Test warm-up fetches languages and translates once per pair."""
+        mock_get.return_value = Mock(status_code=200, json=Mock(return_value=[{"code": "en"}]))
+        mock_post.return_value = Mock(status_code=200, json=Mock(return_value={"translatedText": "Hei"}))
+        progress = []
+        
+        result = self.service.warm_up([("fi", "en"), ("fi", "sv")], progress.append)
+        
+        self.assertTrue(result)
+        self.assertEqual(mock_post.call_count, 2)
+        targets = [call[1]['json']['target'] for call in mock_post.call_args_list]
+        self.assertEqual(targets, ["en", "sv"])
+        self.assertEqual(progress[0], "connecting")
+        self.assertEqual(progress[-1], "ready")
+    
+    @patch('src.core.translator.requests.Session.get')
+    @patch('src.core.translator.requests.Session.post')
+    def test_warm_up_unavailable(self, mock_post, mock_get):
+        """Test warm-up reports failure when the server is unreachable."""
+        mock_get.side_effect = requests.exceptions.RequestException("Connection error")
+        mock_post.side_effect = requests.exceptions.RequestException("Connection error")
+        
+        self.assertFalse(self.service.warm_up([("fi", "en")]))
+
+
+class TestChunkedTranslation(unittest.TestCase):
+    """Test cases for translating texts longer than max_chunk_chars."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = TranslationConfig(backend="stub", max_chunk_chars=40)
+        self.backend = StubTranslationBackend()
+        self.service = TranslationService(self.config, backend=self.backend)
+        self.text = ("Ensimmäinen lause on tässä. Toinen lause tulee perään. "
+                     "Kolmas lause on kysymys? Neljäs lause lopettaa.")
+    
+    def test_short_text_is_not_chunked(self):
+        """Test that text within the limit is sent in one request."""
+        self.assertEqual(self.service.translate("Hei maailma", "fi", "en"), "[en] Hei maailma")
+        self.assertEqual(self.backend.calls, 1)
+        self.assertEqual(len(self.service.chunk_cache), 0)
+    
+    def test_long_text_is_translated_in_chunks(self):
+        """Test that chunks are translated separately and joined in order."""
+        result = self.service.translate(self.text, "fi", "en")
+        
+        self.assertEqual(result, "[en] Ensimmäinen lause on tässä. [en] Toinen lause tulee perään. "
+                                 "[en] Kolmas lause on kysymys? [en] Neljäs lause lopettaa.")
+        self.assertEqual(self.backend.calls, 4)
+    
+    def test_chunks_are_translated_in_parallel(self):
+        """Test that the chunks' requests overlap."""
+        self.backend.delay = 0.2
+        started = time.monotonic()
+        self.service.translate(self.text, "fi", "en")
+        self.assertLess(time.monotonic() - started, 0.6)
+    
+    def test_growing_text_only_translates_new_chunks(self):
+        """Test that cached chunks are not requested again."""
+        self.service.translate(self.text, "fi", "en")
+        result = self.service.translate(self.text + " Viides lause jatkaa puhetta.", "fi", "en")
+        
+        self.assertTrue(result.endswith("[en] Viides lause jatkaa puhetta."))
+        self.assertEqual(self.backend.calls, 5)
+    
+    def test_failed_chunk_fails_translation(self):
+        """Test that a failed chunk fails the text but keeps the others cached."""
+        translate = self.backend.translate
+        self.backend.translate = lambda text, source, target: (
+            None if text.startswith("Toinen") else translate(text, source, target)
+        )
+        self.assertIsNone(self.service.translate(self.text, "fi", "en"))
+        self.assertEqual(len(self.service.chunk_cache), 3)
+        
+        self.backend.translate = translate
+        self.assertIsNotNone(self.service.translate(self.text, "fi", "en"))
+        self.assertEqual(self.backend.calls, 4)
+    
+    def test_overlong_token_is_not_split_by_spaces(self):
+        """Test that a single token longer than max_chunk_chars comes back whole."""
+        self.backend.translate = lambda text, source, target: text
+        url = "https://example.com/" + "a" * 100
+        
+        self.assertEqual(self.service.translate(url, "fi", "en"), url)
+    
+    def test_submit_chunks_long_text(self):
+        """Test that submitted long texts are chunked as well."""
+        future = self.service.submit(self.text, "fi", "sv")
+        self.assertEqual(future.result(timeout=5).count("[sv]"), 4)
+    
+    def test_chunking_disabled(self):
+        """Test that a limit of 0 sends long texts whole."""
+        self.config.max_chunk_chars = 0
+        self.assertEqual(self.service.translate(self.text, "fi", "en"), f"[en] {self.text}")
+        self.assertEqual(self.backend.calls, 1)
 
 
 if __name__ == '__main__':